@@ -1,18 +1,21 @@
 import os
+from functools import partial
 from typing import Optional, List
-from datetime import datetime
 
 # Импортируем из utils.py
 from src.utils import load_transactions
 
+# Импортируем из transactions_cache.py
+from src.transactions_cache import load_cached
+
 # Импортируем из processing.py
 from src.processing import filter_by_state, sort_by_date
 
 # Импортируем из generators.py
 from src.generators import filter_by_currency, transaction_descriptions
 
-# Импортируем из masks.py
-from src.masks import get_mask_account, get_mask_card_number
+# Импортируем из statement.py
+from src.statement import render_statement
 
 
 def get_user_input(prompt: str, valid_options: Optional[List[str]] = None,
@@ -48,69 +51,6 @@ def get_user_input(prompt: str, valid_options: Optional[List[str]] = None,
         print(f"Пожалуйста, введите один из допустимых вариантов: {', '.join(valid_options)}")
 
 
-def format_date(date_str: str) -> str:
-    """
-    Форматирует дату из ISO формата в DD.MM.YYYY.
-
-    Args:
-        date_str: Дата в строковом формате
-
-    Returns:
-        Отформатированная дата
-    """
-    try:
-        # Пытаемся разобрать разные форматы дат
-        if 'T' in date_str:
-            dt = datetime.fromisoformat(date_str.replace('Z', '+00:00'))
-        else:
-            dt = datetime.strptime(date_str, '%Y-%m-%d')
-        return dt.strftime('%d.%m.%Y')
-    except (ValueError, AttributeError):
-        return date_str
-
-
-def format_operation_details(operation: dict) -> str:
-    """
-    Форматирует детали операции для вывода.
-
-    Args:
-        operation: Словарь с данными операции
-
-    Returns:
-        Отформатированная строка
-    """
-    date = format_date(operation.get('date', ''))
-    description = operation.get('description', 'Без описания')
-
-    from_info = operation.get('from', '')
-    to_info = operation.get('to', '')
-    amount = operation.get('operationAmount', {}).get('amount', '0')
-    currency = operation.get('operationAmount', {}).get('currency', {}).get('name', 'руб.')
-
-    # Маскирование номеров
-    if from_info:
-        if 'Счет' in from_info:
-            from_info = get_mask_account(from_info)
-        else:
-            from_info = get_mask_card_number(from_info)
-
-    if to_info:
-        if 'Счет' in to_info:
-            to_info = get_mask_account(to_info)
-        else:
-            to_info = get_mask_card_number(to_info)
-
-    # Формирование строки
-    result = f"{date} {description}\n"
-
-    if from_info:
-        result += f"{from_info} -> "
-    result += f"{to_info}\n"
-    result += f"Сумма: {amount} {currency}\n"
-
-    return result
-
-
 def get_available_files() -> tuple:
     """
     Проверяет наличие файлов в папке data.
@@ -133,41 +73,31 @@ def get_available_files() -> tuple:
     return (bool(json_path), bool(csv_path), bool(xlsx_path), json_path, csv_path, xlsx_path)
 
 
-def load_csv_file(file_path: str):
+def load_csv_file(file_path: str, workers: int = 1, as_records: bool = False):
     """
     Загружает данные из CSV файла.
 
     Args:
         file_path: Путь к CSV файлу
+        workers: Число процессов для разбора (1 — последовательно, None — по числу ядер)
+        as_records: Вернуть компактные записи Transaction вместо словарей
 
     Returns:
         Список операций
     """
     import csv
+    from src.fin_operations import csv_row_to_operation, csv_row_to_record, parse_csv_parallel
 
-    operations = []
+    row_converter = csv_row_to_record if as_records else csv_row_to_operation
 
     try:
+        if workers != 1:
+            return parse_csv_parallel(file_path, delimiter=',', workers=workers, row_converter=row_converter)
+
         with open(file_path, 'r', encoding='utf-8') as file:
             reader = csv.DictReader(file)
-            for row in reader:
-                # Преобразуем строку в нужный формат
-                operation = {
-                    'id': int(row.get('id', 0)),
-                    'state': row.get('state', ''),
-                    'date': row.get('date', ''),
-                    'description': row.get('description', ''),
-                    'from': row.get('from', ''),
-                    'to': row.get('to', ''),
-                    'operationAmount': {
-                        'amount': float(row.get('amount', 0)) if row.get('amount') else 0,
-                        'currency': {
-                            'name': row.get('currency', 'RUB'),
-                            'code': row.get('currency_code', 'RUB')
-                        }
-                    }
-                }
-                operations.append(operation)
+            # Преобразуем строки в нужный формат
+            operations = [row_converter(row) for row in reader]
     except Exception as e:
         print(f"Ошибка при загрузке CSV файла: {e}")
         return []
@@ -175,41 +105,22 @@ def load_csv_file(file_path: str):
     return operations
 
 
-def load_xlsx_file(file_path: str):
+def load_xlsx_file(file_path: str, as_records: bool = False):
     """
     Загружает данные из XLSX файла.
 
     Args:
         file_path: Путь к XLSX файлу
+        as_records: Вернуть компактные записи Transaction вместо словарей
 
     Returns:
         Список операций
     """
     try:
-        import pandas as pd
-
-        df = pd.read_excel(file_path)
-        operations = []
-
-        for _, row in df.iterrows():
-            operation = {
-                'id': int(row.get('id', 0)),
-                'state': str(row.get('state', '')),
-                'date': str(row.get('date', '')),
-                'description': str(row.get('description', '')),
-                'from': str(row.get('from', '')),
-                'to': str(row.get('to', '')),
-                'operationAmount': {
-                    'amount': float(row.get('amount', 0)),
-                    'currency': {
-                        'name': str(row.get('currency', 'RUB')),
-                        'code': str(row.get('currency_code', 'RUB'))
-                    }
-                }
-            }
-            operations.append(operation)
-
-        return operations
+        # Колонки преобразуются целиком, без построчного обхода DataFrame
+        from src.fin_operations import reading_operations_excel
+
+        return reading_operations_excel(file_path, as_records=as_records)
     except ImportError:
         print("Для работы с XLSX файлами установите библиотеку pandas: pip install pandas")
         return []
@@ -257,13 +168,13 @@ def main() -> None:
     try:
         if file_type == '1' and json_exists:
             print(f"\nДля обработки выбран JSON-файл: {os.path.basename(json_path)}")
-            operations = load_transactions(json_path)
+            operations = load_cached(json_path, partial(load_transactions, as_records=True))
         elif file_type == '2' and csv_exists:
             print(f"\nДля обработки выбран CSV-файл: {os.path.basename(csv_path)}")
-            operations = load_csv_file(csv_path)
+            operations = load_cached(csv_path, partial(load_csv_file, as_records=True))
         elif file_type == '3' and xlsx_exists:
             print(f"\nДля обработки выбран XLSX-файл: {os.path.basename(xlsx_path)}")
-            operations = load_xlsx_file(xlsx_path)
+            operations = load_cached(xlsx_path, partial(load_xlsx_file, as_records=True))
         else:
             print("Ошибка: Выбран недопустимый вариант.")
             return
@@ -345,9 +256,7 @@ def main() -> None:
     print("=" * 60)
     print(f"\nВсего банковских операций в выборке: {len(filtered_operations)}\n")
 
-    for operation in filtered_operations:
-        print(format_operation_details(operation))
-        print("-" * 40)
+    render_statement(filtered_operations)
 
 
 if __name__ == "__main__":
@@ -1,5 +1,75 @@
-from typing import List, Dict
-from collections import Counter
+from typing import List, Dict, Set, Tuple
+from collections import Counter, deque
+from functools import lru_cache
+
+
+class CategoryMatcher:
+    """
+    Автомат Ахо–Корасик для одновременного поиска множества подстрок.
+
+    Строится один раз для набора шаблонов; find за один проход по тексту
+    возвращает номера всех шаблонов, входящих в текст, включая
+    перекрывающиеся и вложенные друг в друга.
+    """
+
+    def __init__(self, patterns: Tuple[str, ...]) -> None:
+        goto: List[Dict[str, int]] = [{}]
+        outputs: List[List[int]] = [[]]
+
+        # Бор из всех шаблонов
+        for index, pattern in enumerate(patterns):
+            state = 0
+            for char in pattern:
+                next_state = goto[state].get(char)
+                if next_state is None:
+                    next_state = len(goto)
+                    goto.append({})
+                    outputs.append([])
+                    goto[state][char] = next_state
+                state = next_state
+            outputs[state].append(index)
+
+        # Суффиксные ссылки обходом в ширину; выходы наследуются по ссылкам,
+        # поэтому при поиске не нужно проходить цепочку ссылок
+        fail = [0] * len(goto)
+        queue = deque(goto[0].values())
+        while queue:
+            state = queue.popleft()
+            for char, child in goto[state].items():
+                queue.append(child)
+                link = fail[state]
+                while link and char not in goto[link]:
+                    link = fail[link]
+                target = goto[link].get(char, 0)
+                fail[child] = target if target != child else 0
+                outputs[child] = outputs[child] + outputs[fail[child]]
+
+        self.patterns = patterns
+        self._goto = goto
+        self._fail = fail
+        self._outputs = [tuple(output) for output in outputs]
+
+    def find(self, text: str) -> Set[int]:
+        """Возвращает номера шаблонов, которые встречаются в тексте."""
+        goto = self._goto
+        fail = self._fail
+        outputs = self._outputs
+
+        found: Set[int] = set()
+        state = 0
+        for char in text:
+            while state and char not in goto[state]:
+                state = fail[state]
+            state = goto[state].get(char, 0)
+            if outputs[state]:
+                found.update(outputs[state])
+        return found
+
+
+@lru_cache(maxsize=32)
+def compile_categories(patterns: Tuple[str, ...]) -> CategoryMatcher:
+    """Строит автомат для набора шаблонов; повторные вызовы с тем же набором берут его из кэша."""
+    return CategoryMatcher(patterns)
 
 
 def process_bank_operations(data: List[Dict], categories: List[str]) -> Dict[str, int]:
@@ -41,18 +111,18 @@ def process_bank_operations(data: List[Dict], categories: List[str]) -> Dict[str
         if category:  # Пропускаем пустые категории
             category_mapping[category.lower()] = category
 
-    # Подсчитываем операции
+    # Автомат по всем категориям строится один раз и переиспользуется между вызовами
+    matcher = compile_categories(tuple(category_mapping))
+    originals = list(category_mapping.values())
+
+    # Подсчитываем операции: одно прохождение описания находит все категории сразу
     for operation in data:
         description = operation.get('description')
         if not description:
             continue
 
-        description_lower = description.lower()
-
-        # Проверяем каждую категорию из mapping
-        for category_lower, original_category in category_mapping.items():
-            if category_lower in description_lower:
-                counter[original_category] += 1
+        for index in matcher.find(description.lower()):
+            counter[originals[index]] += 1
 
     # Создаем итоговый словарь, сохраняя порядок категорий из входного списка
     # и устанавливая 0 для категорий, не найденных в данных
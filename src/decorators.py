@@ -1,42 +1,643 @@
+import asyncio
+import atexit
 import functools
+import inspect
+import json
+import math
+import os
+import sys
+import threading
+import time
+import warnings
+from collections import OrderedDict
+from typing import (Any, Awaitable, Callable, Dict, Hashable, List, Optional, ParamSpec, Protocol, Tuple, TypeVar,
+                    Union, cast, overload)
 
+P = ParamSpec('P')
+R = TypeVar('R')
+R_co = TypeVar('R_co', covariant=True)
 
-def log(filename=None):
-    def decorator(func):
-        @functools.wraps(func)
-        def wrapper(*args, **kwargs):
-            # Простое форматирование аргументов
-            args_str = str(args)
-            kwargs_str = str(kwargs)
+# Параметры сброса буфера файла лога по умолчанию: 0 — записывать каждое сообщение сразу
+LOG_FLUSH_SIZE = int(os.getenv('LOG_FLUSH_SIZE', 0))
+LOG_FLUSH_INTERVAL = float(os.getenv('LOG_FLUSH_INTERVAL', 0))
 
-            if kwargs:
-                inputs_str = f"{args_str}, {kwargs_str}"
-            else:
-                inputs_str = args_str
+# Файл, в который при завершении процесса сохраняется статистика timed (если не задан, не сохраняется)
+TIMINGS_PATH = os.getenv('TIMINGS_PATH')
 
-            try:
-                result = func(*args, **kwargs)
-                message = f"{func.__name__} ok\n"
 
-                if filename:
-                    with open(filename, 'a', encoding='utf-8') as f:
-                        f.write(message)
-                else:
-                    print(message, end='')
+class LogSink:
+    """
+    Буферизованная запись сообщений лога в файл.
+
+    Файл открывается один раз и остается открытым. Сообщения копятся
+    в памяти и записываются в файл, когда их объем достигает flush_size
+    символов или с последней записи прошло flush_interval секунд
+    (проверяется при каждом сообщении и фоновым потоком). При flush_size=0
+    каждое сообщение записывается сразу. Запись потокобезопасна.
+
+    Как logging.handlers.WatchedFileHandler, перед записью проверяется, что
+    путь по-прежнему указывает на открытый файл; если файл переименован
+    (например, logrotate) или удален, он открывается заново.
+    """
+
+    def __init__(self, filename: str, flush_size: int = LOG_FLUSH_SIZE,
+                 flush_interval: float = LOG_FLUSH_INTERVAL) -> None:
+        self.filename = filename
+        self.flush_size = flush_size
+        self.flush_interval = flush_interval
+        self._open()
+        self._buffer: List[str] = []
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+        self._lock = threading.Lock()
+
+    def write(self, message: str) -> None:
+        """Добавляет сообщение в буфер и записывает буфер в файл, если пора."""
+        with self._lock:
+            self._buffer.append(message)
+            self._buffered += len(message)
+            if self._buffered >= self.flush_size or self._interval_elapsed():
+                self._flush_locked()
+
+    def flush(self) -> None:
+        """Записывает накопленные сообщения в файл."""
+        with self._lock:
+            self._flush_locked()
+
+    def flush_if_due(self) -> None:
+        """Записывает накопленные сообщения, если истек интервал сброса."""
+        with self._lock:
+            if self._buffer and self._interval_elapsed():
+                self._flush_locked()
+
+    def close(self) -> None:
+        """Записывает накопленные сообщения и закрывает файл."""
+        with self._lock:
+            self._flush_locked()
+            self._file.close()
+
+    def _open(self) -> None:
+        self._file = open(self.filename, 'a', encoding='utf-8')
+        stat = os.fstat(self._file.fileno())
+        self._dev, self._ino = stat.st_dev, stat.st_ino
+
+    def _reopen_if_moved(self) -> None:
+        """Открывает файл заново, если по пути теперь другой файл или его нет."""
+        try:
+            stat = os.stat(self.filename)
+        except FileNotFoundError:
+            moved = True
+        else:
+            moved = (stat.st_dev, stat.st_ino) != (self._dev, self._ino)
+        if moved:
+            self._file.close()
+            self._open()
+
+    def _interval_elapsed(self) -> bool:
+        return self.flush_interval > 0 and time.monotonic() - self._last_flush >= self.flush_interval
+
+    def _flush_locked(self) -> None:
+        if self._buffer and not self._file.closed:
+            self._reopen_if_moved()
+            self._file.write(''.join(self._buffer))
+            self._file.flush()
+        self._buffer.clear()
+        self._buffered = 0
+        self._last_flush = time.monotonic()
+
+
+# Открытые файлы лога процесса по абсолютному пути
+_sinks: Dict[str, LogSink] = {}
+_sinks_lock = threading.Lock()
+_flusher: Optional[threading.Thread] = None
+
+
+def _flush_periodically() -> None:
+    """Фоновый поток: сбрасывает буферы файлов, у которых истек интервал сброса."""
+    while True:
+        with _sinks_lock:
+            sinks = list(_sinks.values())
+        intervals = [sink.flush_interval for sink in sinks if sink.flush_interval > 0]
+        time.sleep(min(intervals) if intervals else 1.0)
+        for sink in sinks:
+            sink.flush_if_due()
+
+
+def get_log_sink(filename: str, flush_size: Optional[int] = None,
+                 flush_interval: Optional[float] = None) -> LogSink:
+    """
+    Возвращает общий для процесса LogSink файла, создавая его при первом обращении.
+
+    Параметры сброса задаются при создании LogSink. Если файл уже открыт
+    с другими значениями, они не меняются, а выдается предупреждение.
+
+    Args:
+        filename: Путь к файлу лога
+        flush_size: Объем буфера в символах, при котором он записывается в файл
+            (None — LOG_FLUSH_SIZE)
+        flush_interval: Максимальное время хранения сообщений в буфере, секунды
+            (None — LOG_FLUSH_INTERVAL)
+    """
+    global _flusher
+    path = os.path.abspath(filename)
+    with _sinks_lock:
+        sink = _sinks.get(path)
+        if sink is None:
+            sink = _sinks[path] = LogSink(
+                path,
+                LOG_FLUSH_SIZE if flush_size is None else flush_size,
+                LOG_FLUSH_INTERVAL if flush_interval is None else flush_interval,
+            )
+        elif ((flush_size is not None and flush_size != sink.flush_size)
+              or (flush_interval is not None and flush_interval != sink.flush_interval)):
+            warnings.warn(
+                f"Файл лога {path} уже открыт с flush_size={sink.flush_size}, "
+                f"flush_interval={sink.flush_interval}; новые параметры сброса не применяются",
+                RuntimeWarning, stacklevel=2,
+            )
+        if sink.flush_interval > 0 and _flusher is None:
+            flusher = threading.Thread(target=_flush_periodically, name='log-flusher', daemon=True)
+            flusher.start()
+            _flusher = flusher
+    return sink
+
+
+def flush_logs() -> None:
+    """Записывает в файлы все накопленные сообщения лога."""
+    with _sinks_lock:
+        sinks = list(_sinks.values())
+    for sink in sinks:
+        sink.flush()
+
+
+# Сообщения, оставшиеся в буферах, записываются при завершении процесса
+atexit.register(flush_logs)
+
+
+class AsyncLogQueue:
+    """
+    Очередь сообщений лога для корутин одного цикла событий.
+
+    Корутины только кладут сообщение в очередь, а фоновая задача забирает
+    накопившиеся сообщения пачкой и записывает их в отдельном потоке,
+    поэтому запись в файл или консоль не блокирует цикл событий. При отмене
+    задачи (завершении цикла) оставшиеся сообщения записываются сразу,
+    а очередь удаляется из реестра очередей циклов.
+    """
+
+    def __init__(self) -> None:
+        self._queue: asyncio.Queue[Tuple[Callable[[str], None], str]] = asyncio.Queue()
+        self._loop = asyncio.get_running_loop()
+        self._task = self._loop.create_task(self._drain())
+
+    def put(self, emit: Callable[[str], None], message: str) -> None:
+        """Ставит сообщение в очередь на запись функцией emit."""
+        self._queue.put_nowait((emit, message))
 
+    async def join(self) -> None:
+        """Ждет, пока все поставленные в очередь сообщения будут записаны."""
+        await self._queue.join()
+
+    def _take_all(self) -> List[Tuple[Callable[[str], None], str]]:
+        batch = []
+        while not self._queue.empty():
+            batch.append(self._queue.get_nowait())
+        return batch
+
+    @staticmethod
+    def _write(batch: List[Tuple[Callable[[str], None], str]]) -> None:
+        for emit, message in batch:
+            emit(message)
+
+    async def _drain(self) -> None:
+        try:
+            while True:
+                batch = [await self._queue.get()]
+                batch.extend(self._take_all())
+                await asyncio.to_thread(self._write, batch)
+                for _ in batch:
+                    self._queue.task_done()
+        except asyncio.CancelledError:
+            # Пачку, уже переданную в поток, допишет он сам; записываем только оставшиеся в очереди
+            self._write(self._take_all())
+            raise
+        finally:
+            # Задача ссылается на цикл событий, поэтому запись реестра удаляется явно,
+            # иначе очередь и завершившийся цикл остаются в памяти
+            if _async_queues.get(self._loop) is self:
+                del _async_queues[self._loop]
+
+
+# Очереди сообщений лога по работающим циклам событий
+_async_queues: Dict[asyncio.AbstractEventLoop, AsyncLogQueue] = {}
+
+
+def _async_log_queue() -> AsyncLogQueue:
+    """Возвращает очередь лога текущего цикла событий, создавая ее при первом обращении."""
+    loop = asyncio.get_running_loop()
+    queue = _async_queues.get(loop)
+    if queue is None:
+        queue = _async_queues[loop] = AsyncLogQueue()
+    return queue
+
+
+async def drain_logs() -> None:
+    """Ждет записи всех сообщений, поставленных в очередь корутинами текущего цикла событий."""
+    queue = _async_queues.get(asyncio.get_running_loop())
+    if queue is not None:
+        await queue.join()
+
+
+def _error_message(func: Callable[..., Any], args: Tuple[Any, ...], kwargs: Dict[str, Any], e: Exception) -> str:
+    """Сообщение об ошибке вызова с аргументами."""
+    # Простое форматирование аргументов (только для сообщения об ошибке)
+    args_str = str(args)
+    kwargs_str = str(kwargs)
+
+    if kwargs:
+        inputs_str = f"{args_str}, {kwargs_str}"
+    else:
+        inputs_str = args_str
+
+    return f"{func.__name__} error: {type(e).__name__}. Inputs: {inputs_str}\n"
+
+
+def log(filename: Optional[str] = None, flush_size: Optional[int] = None,
+        flush_interval: Optional[float] = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        sink: Optional[LogSink] = None
+
+        def emit(message: str) -> None:
+            # Файл лога открывается при первой записи и затем переиспользуется
+            nonlocal sink
+            if not filename:
+                print(message, end='')
+                return
+            if sink is None:
+                sink = get_log_sink(filename, flush_size, flush_interval)
+            sink.write(message)
+
+        if inspect.iscoroutinefunction(func):
+            # Корутина: результат и исключение известны только после await,
+            # а сообщение записывается через очередь, не блокируя цикл событий
+            coroutine_func = cast(Callable[P, Awaitable[Any]], func)
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                try:
+                    result = await coroutine_func(*args, **kwargs)
+                    _async_log_queue().put(emit, f"{func.__name__} ok\n")
+                    return result
+
+                except Exception as e:
+                    _async_log_queue().put(emit, _error_message(func, args, kwargs, e))
+                    raise
+
+            return cast(Callable[P, R], async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            try:
+                result = func(*args, **kwargs)
+                emit(f"{func.__name__} ok\n")
                 return result
 
             except Exception as e:
-                message = f"{func.__name__} error: {type(e).__name__}. Inputs: {inputs_str}\n"
+                emit(_error_message(func, args, kwargs, e))
+                raise
 
-                if filename:
-                    with open(filename, 'a', encoding='utf-8') as f:
-                        f.write(message)
-                else:
-                    print(message, end='')
+        return wrapper
 
-                raise
+    return decorator
+
+
+class LatencyHistogram:
+    """
+    Гистограмма длительностей вызовов в наносекундах с логарифмическими корзинами.
+
+    Как в HDR-гистограмме, значения меньше 2 * SUB_BUCKETS хранятся точно,
+    а каждый следующий интервал [2^k, 2^(k+1)) делится на SUB_BUCKETS равных
+    корзин, поэтому относительная погрешность перцентилей не превышает
+    1 / SUB_BUCKETS при фиксированном объеме памяти на любой диапазон значений.
+    """
+
+    SUB_BUCKET_BITS = 5
+    SUB_BUCKETS = 1 << SUB_BUCKET_BITS
+
+    def __init__(self) -> None:
+        self._lock = threading.Lock()
+        self.clear()
+
+    def clear(self) -> None:
+        """Удаляет все накопленные значения."""
+        with self._lock:
+            self.count = 0
+            self.total = 0
+            self.min: Optional[int] = None
+            self.max: Optional[int] = None
+            self._counts: Dict[int, int] = {}
+
+    @classmethod
+    def _index(cls, value: int) -> int:
+        """Номер корзины для значения."""
+        if value < 2 * cls.SUB_BUCKETS:
+            return value
+        shift = value.bit_length() - cls.SUB_BUCKET_BITS - 1
+        return cls.SUB_BUCKETS * shift + (value >> shift)
+
+    @classmethod
+    def _bounds(cls, index: int) -> Tuple[int, int]:
+        """Наименьшее и наибольшее значения, попадающие в корзину."""
+        if index < 2 * cls.SUB_BUCKETS:
+            return index, index
+        shift = index // cls.SUB_BUCKETS - 1
+        top = index - cls.SUB_BUCKETS * shift
+        return top << shift, ((top + 1) << shift) - 1
+
+    def record(self, value: int) -> None:
+        """Добавляет длительность вызова в наносекундах."""
+        index = self._index(value)
+        with self._lock:
+            self.count += 1
+            self.total += value
+            if self.min is None or value < self.min:
+                self.min = value
+            if self.max is None or value > self.max:
+                self.max = value
+            self._counts[index] = self._counts.get(index, 0) + 1
+
+    def percentile(self, percent: float) -> int:
+        """Возвращает значение перцентиля (середину корзины, в пределах min и max)."""
+        with self._lock:
+            if self.min is None or self.max is None:
+                return 0
+            rank = max(1, math.ceil(percent / 100 * self.count))
+            if rank >= self.count:
+                return self.max
+            seen = 0
+            for index in sorted(self._counts):
+                seen += self._counts[index]
+                if seen >= rank:
+                    low, high = self._bounds(index)
+                    return min(max((low + high) // 2, self.min), self.max)
+            return self.max
+
+    def summary(self) -> Dict[str, float]:
+        """Возвращает число вызовов и длительности в микросекундах."""
+        return {
+            'calls': self.count,
+            'total_ms': self.total / 1e6,
+            'mean_us': self.total / self.count / 1e3 if self.count else 0.0,
+            'min_us': (self.min or 0) / 1e3,
+            'p50_us': self.percentile(50) / 1e3,
+            'p95_us': self.percentile(95) / 1e3,
+            'p99_us': self.percentile(99) / 1e3,
+            'max_us': (self.max or 0) / 1e3,
+        }
+
+
+# Гистограммы длительностей по полному имени функции
+_timings: Dict[str, LatencyHistogram] = {}
+_timings_lock = threading.Lock()
+
+
+def _histogram(name: str) -> LatencyHistogram:
+    """Возвращает гистограмму функции, создавая ее при первом обращении."""
+    with _timings_lock:
+        histogram = _timings.get(name)
+        if histogram is None:
+            histogram = _timings[name] = LatencyHistogram()
+        return histogram
+
+
+@overload
+def timed(func: Callable[P, R]) -> Callable[P, R]:
+    ...
+
+
+@overload
+def timed(func: None = None, *, name: Optional[str] = None) -> Callable[[Callable[P, R]], Callable[P, R]]:
+    ...
+
+
+def timed(func: Optional[Callable[P, R]] = None, *,
+          name: Optional[str] = None) -> Union[Callable[P, R], Callable[[Callable[P, R]], Callable[P, R]]]:
+    """
+    Декоратор, измеряющий длительность каждого вызова через perf_counter_ns.
+
+    Длительности копятся в памяти в гистограмме функции; вызовы, завершившиеся
+    исключением, тоже учитываются. Для корутин длительность измеряется до
+    завершения await. Используется как @timed или @timed(name='...').
+
+    Args:
+        func: Декорируемая функция
+        name: Имя в статистике (по умолчанию модуль и имя функции)
+    """
+    def decorator(func: Callable[P, R]) -> Callable[P, R]:
+        histogram = _histogram(name or f"{func.__module__}.{func.__qualname__}")
+
+        if inspect.iscoroutinefunction(func):
+            # Корутина: измеряется выполнение до завершения await, а не создание объекта корутины
+            coroutine_func = cast(Callable[P, Awaitable[Any]], func)
+
+            @functools.wraps(func)
+            async def async_wrapper(*args: P.args, **kwargs: P.kwargs) -> Any:
+                started = time.perf_counter_ns()
+                try:
+                    return await coroutine_func(*args, **kwargs)
+                finally:
+                    histogram.record(time.perf_counter_ns() - started)
+
+            return cast(Callable[P, R], async_wrapper)
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            started = time.perf_counter_ns()
+            try:
+                return func(*args, **kwargs)
+            finally:
+                histogram.record(time.perf_counter_ns() - started)
 
         return wrapper
 
+    return decorator(func) if func is not None else decorator
+
+
+def timing_stats() -> Dict[str, Dict[str, float]]:
+    """Возвращает статистику вызовов всех функций с @timed, которые вызывались хотя бы раз."""
+    with _timings_lock:
+        timings = list(_timings.items())
+    return {name: histogram.summary() for name, histogram in sorted(timings) if histogram.count}
+
+
+def reset_timings() -> None:
+    """Очищает накопленную статистику вызовов."""
+    with _timings_lock:
+        for histogram in _timings.values():
+            histogram.clear()
+
+
+def dump_timings(path: Optional[str] = None) -> None:
+    """
+    Сохраняет статистику вызовов в JSON.
+
+    Args:
+        path: Путь к файлу (по умолчанию TIMINGS_PATH; если он не задан, ничего не делает)
+    """
+    path = path or TIMINGS_PATH
+    if not path:
+        return
+    with open(path, 'w', encoding='utf-8') as f:
+        json.dump(timing_stats(), f, ensure_ascii=False, indent=2)
+
+
+# Статистика вызовов сохраняется при завершении процесса, если задан TIMINGS_PATH
+atexit.register(dump_timings)
+
+
+class MemoCache:
+    """
+    Кэш результатов функции с вытеснением давно не использованных записей (LRU).
+
+    Ограничивается числом записей maxsize и суммарным размером значений
+    max_bytes (по sys.getsizeof); у записей может быть время жизни ttl.
+    Считает попадания, промахи, вытеснения и истекшие записи. Потокобезопасен;
+    функция вызывается вне блокировки, поэтому при одновременном промахе
+    по одному ключу она может быть вычислена несколько раз.
+    """
+
+    def __init__(self, maxsize: Optional[int] = 128, ttl: Optional[float] = None,
+                 max_bytes: Optional[int] = None) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self.max_bytes = max_bytes
+        self._entries: OrderedDict[Hashable, Tuple[Any, int, Optional[float]]] = OrderedDict()
+        self._lock = threading.Lock()
+        self._bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+
+    def get(self, key: Hashable) -> Tuple[bool, Any]:
+        """Возвращает (True, значение) при попадании или (False, None) при промахе."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is not None:
+                value, size, expires_at = entry
+                if expires_at is None or expires_at > time.monotonic():
+                    self._entries.move_to_end(key)
+                    self.hits += 1
+                    return True, value
+                self._remove(key)
+                self.expirations += 1
+            self.misses += 1
+            return False, None
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет значение, вытесняя записи сверх ограничений."""
+        size = sys.getsizeof(value) if self.max_bytes is not None else 0
+        if self.max_bytes is not None and size > self.max_bytes:
+            # Значение больше всего кэша: не сохраняем, чтобы не вытеснять остальные
+            return
+        expires_at = time.monotonic() + self.ttl if self.ttl is not None else None
+        with self._lock:
+            if key in self._entries:
+                self._remove(key)
+            self._entries[key] = (value, size, expires_at)
+            self._bytes += size
+            while self._entries and ((self.maxsize is not None and len(self._entries) > self.maxsize)
+                                     or (self.max_bytes is not None and self._bytes > self.max_bytes)):
+                self._remove(next(iter(self._entries)))
+                self.evictions += 1
+
+    def _remove(self, key: Hashable) -> None:
+        _, size, _ = self._entries.pop(key)
+        self._bytes -= size
+
+    def clear(self) -> None:
+        """Удаляет все записи и обнуляет статистику."""
+        with self._lock:
+            self._entries.clear()
+            self._bytes = 0
+            self.hits = self.misses = self.evictions = self.expirations = 0
+
+    def stats(self) -> Dict[str, Any]:
+        """Возвращает статистику кэша."""
+        with self._lock:
+            calls = self.hits + self.misses
+            return {
+                'hits': self.hits,
+                'misses': self.misses,
+                'hit_rate': self.hits / calls if calls else 0.0,
+                'evictions': self.evictions,
+                'expirations': self.expirations,
+                'size': len(self._entries),
+                'bytes': self._bytes,
+                'maxsize': self.maxsize,
+            }
+
+
+class Memoized(Protocol[P, R_co]):
+    """Функция, обернутая memoize: вызывается как исходная и дает доступ к своему кэшу."""
+
+    cache: MemoCache
+    cache_stats: Callable[[], Dict[str, Any]]
+    cache_clear: Callable[[], None]
+
+    def __call__(self, *args: P.args, **kwargs: P.kwargs) -> R_co:
+        ...
+
+
+# Кэши memoize по полному имени функции
+_memo_caches: Dict[str, MemoCache] = {}
+
+
+def _default_key(args: Tuple[Any, ...], kwargs: Dict[str, Any]) -> Hashable:
+    """Ключ из аргументов вызова; именованные аргументы учитываются независимо от порядка."""
+    if not kwargs:
+        return args
+    return args, tuple(sorted(kwargs.items()))
+
+
+def memoize(maxsize: Optional[int] = 128, ttl: Optional[float] = None, key: Optional[Callable[..., Hashable]] = None,
+            max_bytes: Optional[int] = None) -> Callable[[Callable[P, R]], Memoized[P, R]]:
+    """
+    Декоратор, кэширующий результаты функции.
+
+    Args:
+        maxsize: Максимальное число записей (None — без ограничения)
+        ttl: Время жизни записи в секундах (None — бессрочно)
+        key: Функция, строящая хэшируемый ключ из аргументов вызова
+            (нужна для словарей и других нехэшируемых аргументов)
+        max_bytes: Максимальный суммарный размер значений по sys.getsizeof (None — без ограничения)
+
+    У обернутой функции есть атрибут cache (MemoCache), а также методы
+    cache_stats() и cache_clear().
+    """
+    def decorator(func: Callable[P, R]) -> Memoized[P, R]:
+        cache = MemoCache(maxsize, ttl, max_bytes)
+        _memo_caches[f"{func.__module__}.{func.__qualname__}"] = cache
+
+        @functools.wraps(func)
+        def wrapper(*args: P.args, **kwargs: P.kwargs) -> R:
+            cache_key = key(*args, **kwargs) if key is not None else _default_key(args, kwargs)
+            found, cached = cache.get(cache_key)
+            if found:
+                return cast(R, cached)
+            value = func(*args, **kwargs)
+            cache.set(cache_key, value)
+            return value
+
+        memoized = cast(Memoized[P, R], wrapper)
+        memoized.cache = cache
+        memoized.cache_stats = cache.stats
+        memoized.cache_clear = cache.clear
+        return memoized
+
     return decorator
+
+
+def memoize_stats() -> Dict[str, Dict[str, Any]]:
+    """Возвращает статистику кэшей всех функций с memoize."""
+    return {name: cache.stats() for name, cache in sorted(_memo_caches.items())}
@@ -1,16 +1,322 @@
+import asyncio
 import os
+import threading
+import time
+from collections import OrderedDict
+from typing import Dict, Any, Awaitable, Callable, Hashable, Iterable, List, Optional, Tuple, TypeVar
+
 import requests
 from dotenv import load_dotenv
-from typing import Dict, Any
+from requests.adapters import HTTPAdapter
+
+from src.rate_store import RateStore
 
 load_dotenv('.env')
 
 # Ключ API (замените на ваш реальный ключ)
 API_KEY = os.getenv('API_KEY')
 BASE_URL = "https://api.apilayer.com/exchangerates_data/convert"
+# Адрес для получения таблицы курсов одним запросом: /latest или /YYYY-MM-DD
+RATES_URL = "https://api.apilayer.com/exchangerates_data"
+
+# Базовая валюта таблицы курсов: курс любой пары вычисляется через нее
+RATE_TABLE_BASE = os.getenv('RATE_TABLE_BASE', 'EUR')
+
+# Число соединений в пуле HTTP-клиента и таймауты (секунды) на установку соединения и чтение ответа
+HTTP_POOL_SIZE = int(os.getenv('HTTP_POOL_SIZE', 10))
+HTTP_CONNECT_TIMEOUT = float(os.getenv('HTTP_CONNECT_TIMEOUT', 3.05))
+HTTP_READ_TIMEOUT = float(os.getenv('HTTP_READ_TIMEOUT', 10))
+
+# Время жизни курса в кэше (секунды) и максимальное число курсов в кэше
+RATE_CACHE_TTL = float(os.getenv('RATE_CACHE_TTL', 3600))
+RATE_CACHE_SIZE = int(os.getenv('RATE_CACHE_SIZE', 1024))
+
+# Путь к базе SQLite с историческими курсами (если не задан, курсы хранятся только в памяти)
+RATE_STORE_PATH = os.getenv('RATE_STORE_PATH')
+
+
+class ExchangeRateClient:
+    """
+    HTTP-клиент API курсов с пулом постоянных (keep-alive) соединений.
+
+    Один объект requests.Session с HTTPAdapter на pool_size соединений
+    разделяется между потоками: пул соединений urllib3 потокобезопасен,
+    поэтому параллельные запросы из рабочих потоков переиспользуют уже
+    открытые TCP/TLS-соединения вместо установки нового на каждый запрос.
+    """
+
+    def __init__(self, pool_size: int = HTTP_POOL_SIZE, connect_timeout: float = HTTP_CONNECT_TIMEOUT,
+                 read_timeout: float = HTTP_READ_TIMEOUT) -> None:
+        self.timeout = (connect_timeout, read_timeout)
+        self.session = requests.Session()
+        # pool_block: при занятых соединениях поток ждет освобождения, а не открывает лишнее
+        adapter = HTTPAdapter(pool_connections=1, pool_maxsize=pool_size, pool_block=True)
+        self.session.mount("https://", adapter)
+        self.session.mount("http://", adapter)
+
+    def get(self, url: str, headers: Optional[Dict[str, Any]] = None,
+            params: Optional[Dict[str, Any]] = None) -> requests.Response:
+        """Выполняет GET-запрос через пул соединений с таймаутами клиента."""
+        return self.session.get(url, headers=headers, params=params, timeout=self.timeout)
+
+    def close(self) -> None:
+        """Закрывает все соединения пула."""
+        self.session.close()
+
+
+_client: Optional[ExchangeRateClient] = None
+_client_lock = threading.Lock()
+
+
+def get_client() -> ExchangeRateClient:
+    """Возвращает общий для модуля HTTP-клиент, создавая его при первом обращении."""
+    global _client
+    if _client is None:
+        with _client_lock:
+            if _client is None:
+                _client = ExchangeRateClient()
+    return _client
+
+
+class RateCache:
+    """
+    Кэш курсов валют с ограниченным временем жизни и размером.
+
+    Ключ — кортеж (исходная валюта, целевая валюта, день курса) для курса
+    пары или ('table', базовая валюта, день курса) для таблицы курсов,
+    значение — курс или таблица курсов.
+    Просроченные записи не возвращаются, а при превышении maxsize
+    вытесняется запись, к которой дольше всего не обращались (LRU).
+    """
+
+    def __init__(self, maxsize: int = RATE_CACHE_SIZE, ttl: float = RATE_CACHE_TTL) -> None:
+        self.maxsize = maxsize
+        self.ttl = ttl
+        self._entries: OrderedDict[Hashable, Tuple[Any, float]] = OrderedDict()
+        self._lock = threading.Lock()
+
+    def get(self, key: Hashable) -> Any:
+        """Возвращает курс или таблицу курсов по ключу или None, если записи нет или она устарела."""
+        with self._lock:
+            entry = self._entries.get(key)
+            if entry is None:
+                return None
+            value, expires_at = entry
+            if expires_at <= time.monotonic():
+                del self._entries[key]
+                return None
+            self._entries.move_to_end(key)
+            return value
+
+    def set(self, key: Hashable, value: Any) -> None:
+        """Сохраняет курс или таблицу курсов, вытесняя самые давно использованные записи сверх maxsize."""
+        with self._lock:
+            self._entries[key] = (value, time.monotonic() + self.ttl)
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
 
+    def clear(self) -> None:
+        """Очищает кэш."""
+        with self._lock:
+            self._entries.clear()
 
-def convert_currency(amount: float, from_currency: str, to_currency: str = "RUB") -> float:
+    def __len__(self) -> int:
+        return len(self._entries)
+
+
+# Общий кэш курсов для всех конвертаций
+RATE_CACHE = RateCache()
+
+T = TypeVar('T')
+
+
+class _Flight:
+    """Выполняющийся запрос: результат или ошибка и событие завершения."""
+
+    def __init__(self) -> None:
+        self.done = threading.Event()
+        self.result: Any = None
+        self.error: Optional[BaseException] = None
+
+
+class SingleFlight:
+    """
+    Объединение одновременных одинаковых запросов из разных потоков.
+
+    Первый поток, запросивший ключ, выполняет функцию, остальные потоки
+    с тем же ключом ждут ее завершения и получают тот же результат
+    или то же исключение. После завершения ключ освобождается, и следующий
+    вызов снова выполнит функцию.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Hashable, _Flight] = {}
+        self._lock = threading.Lock()
+
+    def do(self, key: Hashable, func: Callable[[], T]) -> T:
+        """Выполняет func для ключа или присоединяется к уже выполняющемуся вызову."""
+        with self._lock:
+            flight = self._flights.get(key)
+            leader = flight is None
+            if flight is None:
+                flight = self._flights[key] = _Flight()
+
+        if not leader:
+            flight.done.wait()
+        else:
+            try:
+                flight.result = func()
+            except BaseException as e:
+                flight.error = e
+            finally:
+                with self._lock:
+                    del self._flights[key]
+                flight.done.set()
+
+        if flight.error is not None:
+            raise flight.error
+        result: T = flight.result
+        return result
+
+
+class AsyncSingleFlight:
+    """
+    Объединение одновременных одинаковых запросов из корутин одного цикла событий.
+
+    Запрос выполняется отдельной задачей, которую ожидают все вызывающие
+    через asyncio.shield: отмена одного из ожидающих не отменяет запрос
+    для остальных. Задачу нельзя ожидать из другого цикла событий, поэтому
+    запросы объединяются только внутри одного цикла: ключ дополняется
+    текущим циклом.
+    """
+
+    def __init__(self) -> None:
+        self._flights: Dict[Tuple[asyncio.AbstractEventLoop, Hashable], asyncio.Future] = {}
+
+    async def do(self, key: Hashable, func: Callable[[], Awaitable[T]]) -> T:
+        """Выполняет корутину func для ключа или ожидает уже выполняющуюся в этом же цикле событий."""
+        flight_key = (asyncio.get_running_loop(), key)
+        task = self._flights.get(flight_key)
+        if task is None:
+            task = asyncio.ensure_future(func())
+            self._flights[flight_key] = task
+            task.add_done_callback(lambda _: self._flights.pop(flight_key, None))
+        return await asyncio.shield(task)
+
+
+# Запросы курсов, выполняющиеся в данный момент
+RATE_FLIGHTS = SingleFlight()
+ASYNC_RATE_FLIGHTS = AsyncSingleFlight()
+
+
+def _rate_key(from_currency: str, to_currency: str, date: Optional[str] = None) -> Tuple[str, str, str]:
+    """Строит ключ кэша: курс на день (YYYY-MM-DD) или текущий курс, если дата не указана."""
+    return from_currency.upper(), to_currency.upper(), (date or '')[:10]
+
+
+_rate_store: Optional[RateStore] = None
+_rate_store_lock = threading.Lock()
+
+
+def get_rate_store() -> Optional[RateStore]:
+    """Возвращает хранилище исторических курсов, открывая базу RATE_STORE_PATH при первом обращении."""
+    global _rate_store
+    if _rate_store is None and RATE_STORE_PATH:
+        with _rate_store_lock:
+            if _rate_store is None:
+                _rate_store = RateStore(RATE_STORE_PATH)
+    return _rate_store
+
+
+def set_rate_store(store: Optional[RateStore]) -> None:
+    """Подключает хранилище исторических курсов (None — отключает его)."""
+    global _rate_store
+    _rate_store = store
+
+
+def _lookup_rate(key: Tuple[str, str, str], cache: RateCache) -> Optional[float]:
+    """Ищет курс в кэше, а курс на дату — также в хранилище исторических курсов."""
+    rate: Optional[float] = cache.get(key)
+    if rate is None and key[2]:
+        store = get_rate_store()
+        if store is not None:
+            rate = store.get_rate(key[0], key[1], key[2])
+            if rate is not None:
+                cache.set(key, rate)
+    return rate
+
+
+def _table_key(day: str, base: str = RATE_TABLE_BASE, kind: str = 'table') -> Tuple[str, str, str]:
+    """
+    Ключ кэша для таблицы курсов к base на день (пустая строка — текущие курсы).
+
+    kind 'table' — полная таблица из API, 'stored' — курсы на день из хранилища.
+    """
+    return kind, base, day
+
+
+def _lookup_table(day: str, cache: RateCache, currencies: Iterable[str] = ()) -> Optional[Dict[str, float]]:
+    """
+    Ищет таблицу курсов в кэше, а таблицу на дату — также в хранилище исторических курсов.
+
+    В хранилище может быть только часть курсов на день (например, после
+    загрузки из CSV), поэтому таблица оттуда возвращается, только если в ней
+    есть все валюты currencies; иначе возвращается None и таблица запрашивается у API.
+    """
+    table: Optional[Dict[str, float]] = cache.get(_table_key(day))
+    if table is not None or not day:
+        return table
+
+    store = get_rate_store()
+    if store is None:
+        return None
+    stored_key = _table_key(day, kind='stored')
+    stored: Optional[Dict[str, float]] = cache.get(stored_key)
+    if stored is None:
+        stored = store.get_rates(RATE_TABLE_BASE, day)
+        if not stored:
+            return None
+        # Курс базовой валюты к самой себе в загруженных таблицах может отсутствовать
+        stored.setdefault(RATE_TABLE_BASE, 1.0)
+        cache.set(stored_key, stored)
+    if all(stored.get(currency) for currency in currencies):
+        return stored
+    return None
+
+
+def _remember_table(day: str, table: Dict[str, float], cache: RateCache) -> None:
+    """Сохраняет полученную из API таблицу курсов в кэше и, если она на дату, в хранилище."""
+    cache.set(_table_key(day), table)
+    if day:
+        store = get_rate_store()
+        if store is not None:
+            store.set_rates((day, RATE_TABLE_BASE, quote, rate) for quote, rate in table.items())
+
+
+def cross_rate(table: Dict[str, float], from_currency: str, to_currency: str) -> float:
+    """
+    Вычисляет курс пары через базовую валюту таблицы.
+
+    Args:
+        table (Dict[str, float]): Количество единиц каждой валюты за одну единицу базовой валюты
+        from_currency (str): Исходная валюта
+        to_currency (str): Целевая валюта
+
+    Returns:
+        float: Стоимость одной единицы from_currency в to_currency
+
+    Raises:
+        ValueError: Если валюты нет в таблице курсов
+    """
+    for currency in (from_currency, to_currency):
+        if not table.get(currency):
+            raise ValueError(f"Unsupported currency: {currency}")
+    return table[to_currency] / table[from_currency]
+
+
+def convert_currency(amount: float, from_currency: str, to_currency: str = "RUB",
+                     date: Optional[str] = None) -> float:
     """
     Конвертирует сумму из одной валюты в другую используя внешнее API.
 
@@ -18,6 +324,7 @@ def convert_currency(amount: float, from_currency: str, to_currency: str = "RUB"
         amount (float): Сумма для конвертации
         from_currency (str): Исходная валюта (например, "USD", "EUR")
         to_currency (str): Целевая валюта (по умолчанию "RUB")
+        date (str): Дата курса в формате YYYY-MM-DD (по умолчанию текущий курс)
 
     Returns:
         float: Сконвертированная сумма в целевой валюте
@@ -34,9 +341,11 @@ def convert_currency(amount: float, from_currency: str, to_currency: str = "RUB"
         "to": to_currency,
         "amount": amount
     }
+    if date:
+        params["date"] = date
 
     try:
-        response = requests.get(BASE_URL, headers=headers, params=params, timeout=10)
+        response = get_client().get(BASE_URL, headers=headers, params=params)
         response.raise_for_status()  # Проверяем статус код
 
         data = response.json()
@@ -52,20 +361,119 @@ def convert_currency(amount: float, from_currency: str, to_currency: str = "RUB"
         raise Exception(f"Invalid response format: {str(e)}")
 
 
-def get_transaction_amount_in_rub(transaction: Dict[str, Any]) -> float:
+def fetch_rate_table(base: str = RATE_TABLE_BASE, date: Optional[str] = None,
+                     symbols: Optional[Iterable[str]] = None) -> Dict[str, float]:
     """
-    Возвращает сумму транзакции в рублях.
+    Запрашивает таблицу курсов всех валют к base одним запросом.
 
     Args:
-        transaction (Dict[str, Any]): Словарь с данными о транзакции
+        base (str): Базовая валюта таблицы (по умолчанию RATE_TABLE_BASE)
+        date (str): Дата курсов в формате YYYY-MM-DD (по умолчанию текущие курсы)
+        symbols (Iterable[str]): Коды валют, которыми нужно ограничить таблицу (по умолчанию все)
 
     Returns:
-        float: Сумма транзакции в рублях
+        Dict[str, float]: Количество единиц каждой валюты за одну единицу base
 
     Raises:
-        ValueError: Если валюта транзакции не поддерживается
-        Exception: Если произошла ошибка при конвертации валюты
+        Exception: Если произошла ошибка при обращении к API
+    """
+    headers = {
+        "apikey": API_KEY
+    }
+
+    params = {
+        "base": base
+    }
+    if symbols is not None:
+        params["symbols"] = ",".join(sorted(set(symbols)))
+
+    url = f"{RATES_URL}/{date or 'latest'}"
+
+    try:
+        response = get_client().get(url, headers=headers, params=params)
+        response.raise_for_status()
+
+        data = response.json()
+
+        if not data.get("success", False):
+            raise Exception(f"API error: {data.get('error', {}).get('info', 'Unknown error')}")
+
+        table = {currency: float(rate) for currency, rate in data["rates"].items()}
+        table[base] = 1.0
+        return table
+
+    except requests.exceptions.RequestException as e:
+        raise Exception(f"Request failed: {str(e)}")
+    except (KeyError, ValueError, TypeError, AttributeError) as e:
+        raise Exception(f"Invalid response format: {str(e)}")
+
+
+def get_rate_table(date: Optional[str] = None, cache: Optional[RateCache] = None,
+                   currencies: Iterable[str] = ()) -> Dict[str, float]:
+    """
+    Возвращает таблицу курсов к RATE_TABLE_BASE на день операции.
+
+    Таблица ищется в кэше и хранилище исторических курсов, а при отсутствии
+    запрашивается у API одним запросом; одновременные запросы одной таблицы
+    из разных потоков объединяются. Курсы из хранилища, в которых нет
+    какой-либо из валют currencies, дополняются таблицей из API.
+
+    Args:
+        date (str): Дата операции в формате ISO (по умолчанию текущие курсы)
+        cache (RateCache): Кэш курсов (по умолчанию общий RATE_CACHE)
+        currencies (Iterable[str]): Валюты, курсы которых нужны вызывающему
+
+    Raises:
+        Exception: Если произошла ошибка при обращении к API
+    """
+    cache = RATE_CACHE if cache is None else cache
+    day = (date or '')[:10]
+    table = _lookup_table(day, cache, currencies)
+    if table is not None:
+        return table
+
+    def fetch() -> Dict[str, float]:
+        fetched = fetch_rate_table(RATE_TABLE_BASE, day or None)
+        _remember_table(day, fetched, cache)
+        return fetched
+
+    return RATE_FLIGHTS.do((_table_key(day), id(cache)), fetch)
+
+
+def get_exchange_rate(from_currency: str, to_currency: str = "RUB", date: Optional[str] = None,
+                      cache: Optional[RateCache] = None) -> float:
+    """
+    Возвращает курс валютной пары, вычисляя его по таблице курсов к базовой валюте.
+
+    Курс на дату сначала ищется в хранилище исторических курсов (если оно
+    подключено). Иначе курс вычисляется по таблице курсов на этот день,
+    поэтому для любого числа пар нужен один запрос к API в день.
+
+    Args:
+        from_currency (str): Исходная валюта
+        to_currency (str): Целевая валюта (по умолчанию "RUB")
+        date (str): Дата операции в формате ISO; курс берется на этот день
+            (по умолчанию текущий курс)
+        cache (RateCache): Кэш курсов (по умолчанию общий RATE_CACHE)
+
+    Returns:
+        float: Стоимость одной единицы from_currency в to_currency
+
+    Raises:
+        ValueError: Если валюты нет в таблице курсов
+        Exception: Если произошла ошибка при обращении к API
     """
+    cache = RATE_CACHE if cache is None else cache
+    key = _rate_key(from_currency, to_currency, date)
+    rate = _lookup_rate(key, cache)
+    if rate is None:
+        rate = cross_rate(get_rate_table(key[2], cache, key[:2]), key[0], key[1])
+        cache.set(key, rate)
+    return rate
+
+
+def _amount_and_currency(transaction: Dict[str, Any]) -> Tuple[float, str]:
+    """Возвращает сумму транзакции числом (0.0, если она некорректна) и код валюты в верхнем регистре."""
     # Получаем сумму и валюту из транзакции
     amount = transaction.get("amount", 0)
     currency = transaction.get("currency", "RUB")
@@ -77,18 +485,199 @@ def get_transaction_amount_in_rub(transaction: Dict[str, Any]) -> float:
         except (ValueError, TypeError):
             amount = 0.0
 
+    return float(amount), currency.upper()
+
+
+def get_transaction_amount_in_rub(transaction: Dict[str, Any]) -> float:
+    """
+    Возвращает сумму транзакции в рублях.
+
+    Args:
+        transaction (Dict[str, Any]): Словарь с данными о транзакции
+
+    Returns:
+        float: Сумма транзакции в рублях
+
+    Raises:
+        ValueError: Если валюты транзакции нет в таблице курсов
+        Exception: Если произошла ошибка при конвертации валюты
+    """
+    amount, currency = _amount_and_currency(transaction)
+
     # Если валюта рубль или не указана, возвращаем как есть
-    if currency.upper() in ["RUB", ""]:
-        return float(amount)
+    if currency in ["RUB", ""]:
+        return amount
+
+    # Иначе умножаем сумму на курс, вычисленный по таблице курсов
+    try:
+        return amount * get_exchange_rate(currency, "RUB", transaction.get("date"))
+    except ValueError:
+        raise
+    except Exception as e:
+        # В случае ошибки API можно вернуть 0 или пробросить исключение
+        # В зависимости от требований бизнес-логики
+        raise Exception(f"Failed to convert {amount} {transaction.get('currency')} to RUB: {str(e)}")
 
-    # Если валюта USD или EUR, конвертируем
-    elif currency.upper() in ["USD", "EUR"]:
+
+def convert_transactions_to_rub(transactions: List[Dict[str, Any]],
+                                cache: Optional[RateCache] = None) -> Tuple[List[Optional[float]], Dict[int, str]]:
+    """
+    Переводит суммы списка транзакций в рубли.
+
+    Для каждого дня курса, встречающегося в пакете, таблица курсов
+    запрашивается один раз (для транзакций без даты — одна таблица текущих
+    курсов). Ошибка одной транзакции не прерывает обработку остальных.
+
+    Args:
+        transactions (List[Dict[str, Any]]): Список транзакций
+        cache (RateCache): Кэш курсов (по умолчанию общий RATE_CACHE)
+
+    Returns:
+        Tuple[List[Optional[float]], Dict[int, str]]: Суммы в рублях в порядке транзакций
+            (None для транзакций с ошибкой) и словарь ошибок по номеру транзакции
+    """
+    cache = RATE_CACHE if cache is None else cache
+
+    amounts: List[Optional[float]] = []
+    errors: Dict[int, str] = {}
+    for i, transaction in enumerate(transactions):
+        amount, currency = _amount_and_currency(transaction)
+        if currency in ["RUB", ""]:
+            amounts.append(amount)
+            continue
         try:
-            return convert_currency(amount, currency.upper(), "RUB")
+            # Таблица на день запрашивается при первой транзакции этого дня, остальные берут ее из кэша
+            amounts.append(amount * get_exchange_rate(currency, "RUB", transaction.get("date"), cache))
+        except ValueError as e:
+            errors[i] = str(e)
+            amounts.append(None)
         except Exception as e:
-            # В случае ошибки API можно вернуть 0 или пробросить исключение
-            # В зависимости от требований бизнес-логики
-            raise Exception(f"Failed to convert {amount} {currency} to RUB: {str(e)}")
+            errors[i] = f"Failed to convert {amount} {transaction.get('currency')} to RUB: {str(e)}"
+            amounts.append(None)
+
+    return amounts, errors
+
+
+class AsyncRateLimiter:
+    """Ограничивает частоту запросов к API: не больше rate запросов в секунду."""
+
+    def __init__(self, rate: float) -> None:
+        self.interval = 1 / rate
+        self._next_at = 0.0
+        self._lock = asyncio.Lock()
+
+    async def wait(self) -> None:
+        """Ждет, пока не наступит время следующего разрешенного запроса."""
+        async with self._lock:
+            now = time.monotonic()
+            delay = self._next_at - now
+            self._next_at = max(now, self._next_at) + self.interval
+        if delay > 0:
+            await asyncio.sleep(delay)
+
+
+async def async_convert_currency(amount: float, from_currency: str, to_currency: str = "RUB",
+                                 date: Optional[str] = None) -> float:
+    """
+    Асинхронный вариант convert_currency.
+
+    Запрос выполняется в пуле потоков через общий HTTP-клиент с пулом
+    соединений, поэтому цикл событий не блокируется, а параллельные
+    конвертации переиспользуют соединения.
+
+    Raises:
+        Exception: Если произошла ошибка при обращении к API
+    """
+    if date:
+        return await asyncio.to_thread(convert_currency, amount, from_currency, to_currency, date)
+    return await asyncio.to_thread(convert_currency, amount, from_currency, to_currency)
+
+
+async def async_get_rate_table(date: Optional[str] = None, cache: Optional[RateCache] = None,
+                               limiter: Optional[AsyncRateLimiter] = None,
+                               currencies: Iterable[str] = ()) -> Dict[str, float]:
+    """
+    Асинхронный вариант get_rate_table.
+
+    Args:
+        limiter (AsyncRateLimiter): Ограничение частоты запросов; применяется только
+            к запросам в API, таблицы из кэша возвращаются сразу
+    """
+    cache = RATE_CACHE if cache is None else cache
+    day = (date or '')[:10]
+    table = _lookup_table(day, cache, currencies)
+    if table is not None:
+        return table
+
+    async def fetch() -> Dict[str, float]:
+        if limiter is not None:
+            await limiter.wait()
+        fetched = await asyncio.to_thread(fetch_rate_table, RATE_TABLE_BASE, day or None)
+        _remember_table(day, fetched, cache)
+        return fetched
+
+    # Одновременные запросы одной таблицы из разных корутин выполняются одним обращением к API
+    return await ASYNC_RATE_FLIGHTS.do((_table_key(day), id(cache)), fetch)
+
+
+async def async_get_exchange_rate(from_currency: str, to_currency: str = "RUB", date: Optional[str] = None,
+                                  cache: Optional[RateCache] = None,
+                                  limiter: Optional[AsyncRateLimiter] = None) -> float:
+    """Асинхронный вариант get_exchange_rate."""
+    cache = RATE_CACHE if cache is None else cache
+    key = _rate_key(from_currency, to_currency, date)
+    rate = _lookup_rate(key, cache)
+    if rate is None:
+        rate = cross_rate(await async_get_rate_table(key[2], cache, limiter, key[:2]), key[0], key[1])
+        cache.set(key, rate)
+    return rate
+
+
+async def async_get_transaction_amount_in_rub(transaction: Dict[str, Any],
+                                              limiter: Optional[AsyncRateLimiter] = None) -> float:
+    """
+    Асинхронный вариант get_transaction_amount_in_rub с теми же исключениями.
+
+    Raises:
+        ValueError: Если валюты транзакции нет в таблице курсов
+        Exception: Если произошла ошибка при конвертации валюты
+    """
+    amount, currency = _amount_and_currency(transaction)
+
+    if currency in ["RUB", ""]:
+        return amount
+
+    try:
+        return amount * await async_get_exchange_rate(currency, "RUB", transaction.get("date"), limiter=limiter)
+    except ValueError:
+        raise
+    except Exception as e:
+        raise Exception(f"Failed to convert {amount} {transaction.get('currency')} to RUB: {str(e)}")
+
+
+async def async_convert_transactions(transactions: List[Dict[str, Any]], concurrency: int = HTTP_POOL_SIZE,
+                                     rate_limit: Optional[float] = None,
+                                     return_exceptions: bool = False) -> List[Any]:
+    """
+    Конвертирует транзакции в рубли параллельно.
+
+    Args:
+        transactions (List[Dict[str, Any]]): Список транзакций
+        concurrency (int): Максимальное число одновременных конвертаций
+            (по умолчанию равно размеру пула соединений)
+        rate_limit (float): Максимальное число запросов к API в секунду (None — без ограничения)
+        return_exceptions (bool): Возвращать исключения в списке результатов
+            вместо того, чтобы пробрасывать первое из них
+
+    Returns:
+        List[Any]: Суммы в рублях в порядке транзакций (или исключения при return_exceptions=True)
+    """
+    semaphore = asyncio.Semaphore(concurrency)
+    limiter = AsyncRateLimiter(rate_limit) if rate_limit else None
+
+    async def convert(transaction: Dict[str, Any]) -> float:
+        async with semaphore:
+            return await async_get_transaction_amount_in_rub(transaction, limiter)
 
-    else:
-        raise ValueError(f"Unsupported currency: {currency}")
+    return await asyncio.gather(*(convert(transaction) for transaction in transactions),
+                                return_exceptions=return_exceptions)
@@ -1,15 +1,31 @@
 import csv
+import io
 import pandas as pd
 import os
-from typing import List, Dict
+from concurrent.futures import ProcessPoolExecutor
+from typing import List, Dict, Any, Callable, Optional, Tuple
 
+from src.decorators import timed
+from src.timestamps import parse_timestamps
+from src.transaction import Transaction
 
-def reading_transactions_csv(file_path: str) -> List[Dict]:
+# Число порций на один процесс: мелкие порции выравнивают нагрузку между процессами
+CSV_CHUNKS_PER_WORKER = 4
+
+
+@timed
+def reading_transactions_csv(file_path: str, workers: int = 1) -> List[Dict]:
     """
     Считывает финансовые операции из CSV-файла.
     Возвращает список словарей с транзакциями.
+
+    При workers > 1 (или None — по числу ядер) файл разбирается
+    параллельно через parse_csv_parallel.
     """
     try:
+        if workers != 1:
+            return parse_csv_parallel(file_path, delimiter=';', workers=workers)
+
         transactions_csv = []
         with open(file_path, 'r', newline='', encoding='utf-8') as csv_f:
             rd_transactions_csv = csv.DictReader(csv_f, delimiter=';')
@@ -22,6 +38,7 @@ def reading_transactions_csv(file_path: str) -> List[Dict]:
         return []
 
 
+@timed
 def reading_transactions_excel(file_path: str) -> List[Dict]:
     """
     Считывает финансовые операции из Excel файла.
@@ -31,9 +48,209 @@ def reading_transactions_excel(file_path: str) -> List[Dict]:
         if not os.path.exists(file_path):
             return []
 
-        df = pd.read_excel(file_path)
+        df = _read_excel(file_path)
         transactions = df.to_dict('records')
         return transactions
 
     except Exception:
         return []
+
+
+def csv_row_to_operation(row: Dict[str, str]) -> Dict[str, Any]:
+    """Преобразует строку CSV в операцию со вложенными operationAmount/currency."""
+    return {
+        'id': int(row.get('id', 0)),
+        'state': row.get('state', ''),
+        'date': row.get('date', ''),
+        'description': row.get('description', ''),
+        'from': row.get('from', ''),
+        'to': row.get('to', ''),
+        'operationAmount': {
+            'amount': float(row.get('amount', 0)) if row.get('amount') else 0,
+            'currency': {
+                'name': row.get('currency', 'RUB'),
+                'code': row.get('currency_code', 'RUB')
+            }
+        }
+    }
+
+
+def csv_row_to_record(row: Dict[str, str]) -> Transaction:
+    """Преобразует строку CSV в компактную запись Transaction (поля как в csv_row_to_operation)."""
+    return Transaction.create(
+        id=int(row.get('id', 0)),
+        state=row.get('state', ''),
+        date=row.get('date', ''),
+        amount=float(row.get('amount', 0)) if row.get('amount') else 0,
+        currency_code=row.get('currency_code', 'RUB'),
+        currency_name=row.get('currency', 'RUB'),
+        from_=row.get('from', ''),
+        to=row.get('to', ''),
+        description=row.get('description', ''),
+    )
+
+
+def _csv_header(file_path: str, delimiter: str) -> Tuple[List[str], int]:
+    """Возвращает названия колонок и смещение в байтах, с которого начинаются данные."""
+    with open(file_path, 'rb') as file:
+        header_line = file.readline()
+        data_start = file.tell()
+    header = next(csv.reader([header_line.decode('utf-8')], delimiter=delimiter), [])
+    return header, data_start
+
+
+def _csv_byte_ranges(file_path: str, data_start: int, parts: int) -> List[Tuple[int, int]]:
+    """
+    Делит файл на диапазоны байтов примерно равного размера.
+    Каждая граница сдвигается к началу следующей строки.
+    """
+    file_size = os.path.getsize(file_path)
+    step = max(1, (file_size - data_start) // max(1, parts))
+
+    boundaries = [data_start]
+    with open(file_path, 'rb') as file:
+        offset = data_start + step
+        while offset < file_size:
+            file.seek(offset - 1)
+            # Дочитываем до конца текущей строки; если offset уже на границе, readline вернет '\n'
+            file.readline()
+            boundary = file.tell()
+            if boundary >= file_size:
+                break
+            if boundary > boundaries[-1]:
+                boundaries.append(boundary)
+            offset = boundary + step
+    boundaries.append(file_size)
+
+    return [(start, end) for start, end in zip(boundaries, boundaries[1:]) if end > start]
+
+
+def _parse_csv_range(task: Tuple[str, int, int, List[str], str, Optional[Callable]]) -> List[Dict]:
+    """Разбирает один диапазон байтов CSV-файла (выполняется в процессе-обработчике)."""
+    file_path, start, end, fieldnames, delimiter, row_converter = task
+    with open(file_path, 'rb') as file:
+        file.seek(start)
+        text = file.read(end - start).decode('utf-8')
+
+    reader = csv.DictReader(io.StringIO(text, newline=''), fieldnames=fieldnames, delimiter=delimiter)
+    if row_converter is None:
+        return list(reader)
+    return [row_converter(row) for row in reader]
+
+
+def parse_csv_parallel(file_path: str, delimiter: str = ';', workers: Optional[int] = None,
+                       row_converter: Optional[Callable[[Dict[str, str]], Any]] = None) -> List[Any]:
+    """
+    Разбирает CSV-файл параллельно в пуле процессов.
+
+    Файл делится по границам строк на диапазоны байтов, каждый диапазон
+    разбирается в отдельном процессе, результаты склеиваются в порядке
+    следования в файле. Результат совпадает с последовательным
+    csv.DictReader, если поля не содержат переводов строк внутри кавычек.
+
+    Args:
+        file_path: Путь к CSV-файлу
+        delimiter: Разделитель колонок
+        workers: Число процессов (None — по числу ядер)
+        row_converter: Функция преобразования строки; должна быть
+            определена на уровне модуля, чтобы передаваться в процессы
+
+    Returns:
+        Список строк файла (или результатов row_converter)
+    """
+    workers = workers or os.cpu_count() or 1
+    fieldnames, data_start = _csv_header(file_path, delimiter)
+    if not fieldnames:
+        return []
+
+    ranges = _csv_byte_ranges(file_path, data_start, workers * CSV_CHUNKS_PER_WORKER)
+    tasks = [(file_path, start, end, fieldnames, delimiter, row_converter) for start, end in ranges]
+
+    if workers == 1 or len(tasks) <= 1:
+        chunks = map(_parse_csv_range, tasks)
+        return [row for chunk in chunks for row in chunk]
+
+    with ProcessPoolExecutor(max_workers=workers) as executor:
+        # map сохраняет порядок задач, а значит и порядок строк в файле
+        return [row for chunk in executor.map(_parse_csv_range, tasks) for row in chunk]
+
+
+def _read_excel(file_path: str) -> pd.DataFrame:
+    """Читает лист Excel в DataFrame — общая точка входа для всех загрузчиков Excel."""
+    return pd.read_excel(file_path)
+
+
+def _text_column(df: pd.DataFrame, name: str, default: str) -> List[str]:
+    """Возвращает колонку целиком в виде списка строк или список значений по умолчанию."""
+    if name not in df.columns:
+        return [default] * len(df)
+    return list(map(str, df[name].tolist()))
+
+
+def operations_from_frame(df: pd.DataFrame, as_records: bool = False) -> List[Any]:
+    """
+    Преобразует DataFrame с транзакциями в список операций
+    со вложенной структурой operationAmount/currency
+    (или в записи Transaction при as_records=True).
+
+    Преобразование типов выполняется сразу для целой колонки,
+    а не построчно через iterrows.
+    """
+    count = len(df)
+    ids = df['id'].astype('int64').tolist() if 'id' in df.columns else [0] * count
+    dates = _text_column(df, 'date', '')
+    amounts = df['amount'].astype(float).tolist() if 'amount' in df.columns else [0.0] * count
+
+    columns = zip(
+        ids,
+        _text_column(df, 'state', ''),
+        dates,
+        _text_column(df, 'description', ''),
+        _text_column(df, 'from', ''),
+        _text_column(df, 'to', ''),
+        amounts,
+        _text_column(df, 'currency', 'RUB'),
+        _text_column(df, 'currency_code', 'RUB'),
+    )
+
+    if as_records:
+        # Даты разбираются один раз для всей колонки
+        timestamps = parse_timestamps(dates).tolist()
+        return [
+            Transaction.create(op_id, state, date, amount, currency_code, currency_name, from_info, to_info,
+                               description, timestamp)
+            for (op_id, state, date, description, from_info, to_info, amount, currency_name, currency_code), timestamp
+            in zip(columns, timestamps)
+        ]
+
+    return [
+        {
+            'id': op_id,
+            'state': state,
+            'date': date,
+            'description': description,
+            'from': from_info,
+            'to': to_info,
+            'operationAmount': {
+                'amount': amount,
+                'currency': {
+                    'name': currency_name,
+                    'code': currency_code
+                }
+            }
+        }
+        for op_id, state, date, description, from_info, to_info, amount, currency_name, currency_code in columns
+    ]
+
+
+@timed
+def reading_operations_excel(file_path: str, as_records: bool = False) -> List[Any]:
+    """
+    Считывает финансовые операции из Excel файла
+    в формате операций (со вложенными operationAmount/currency)
+    или в виде записей Transaction при as_records=True.
+
+    В отличие от reading_transactions_excel, ошибки чтения не скрываются,
+    а пробрасываются вызывающему коду.
+    """
+    return operations_from_frame(_read_excel(file_path), as_records=as_records)
@@ -1,15 +1,27 @@
-def filter_by_currency(transactions: list, currency: str) -> iter:
+from typing import Iterable
+
+from src.transaction import Transaction
+
+
+def filter_by_currency(transactions: Iterable[dict], currency: str) -> iter:
     """
     Фильтрует транзакции по валюте операции.
 
     Args:
-        transactions: Список словарей с транзакциями
+        transactions: Список словарей (или записей Transaction) с транзакциями
+            или итератор, например iter_transactions
         currency: Код валюты для фильтрации (например, "USD")
 
     Returns:
         Итератор, который выдает транзакции с указанной валютой
     """
     for transaction in transactions:
+        # У компактной записи код валюты — обычное поле
+        if type(transaction) is Transaction:
+            if transaction.currency_code == currency:
+                yield transaction
+            continue
+
         # Получаем код валюты из операции
         operation_amount = transaction.get("operationAmount", {})
         currency_info = operation_amount.get("currency", {})
@@ -20,7 +32,7 @@ def filter_by_currency(transactions: list, currency: str) -> iter:
             yield transaction
 
 
-def transaction_descriptions(transactions: list) -> iter:
+def transaction_descriptions(transactions: Iterable[dict]) -> iter:
     """
     Генератор, который возвращает описание каждой транзакции по очереди.
     """
@@ -0,0 +1,150 @@
+import atexit
+import logging
+import os
+import queue
+import re
+import threading
+from datetime import datetime
+from logging.handlers import QueueHandler, QueueListener
+from typing import List, Optional
+
+LOG_FORMAT = '%(asctime)s - %(name)s - %(levelname)s - %(message)s'
+LOGS_DIR = "logs"
+
+# Доля сохраняемых сообщений уровня INFO и ниже о каждой отдельной записи (1.0 — все)
+LOG_SAMPLE_RATE = float(os.getenv('LOG_SAMPLE_RATE', 1.0))
+
+# Признак сообщения об отдельной записи (карте, счете, транзакции): такие сообщения прореживаются.
+# Передается в вызов логгера как extra=PER_RECORD
+PER_RECORD = {'per_record': True}
+
+# Группы от 4 цифр, разделенные одиночным пробелом или дефисом ("1234 5678 9012 3456"), или сплошной
+# номер. Номером карты или счета считается последовательность, в которой 8 и более цифр;
+# даты вида 2019-08-26 не подходят, так как их группы короче 4 цифр
+_NUMBER_RE = re.compile(r'\d{4,}(?:[ -]\d{4,})*')
+_DIGIT_RE = re.compile(r'\d')
+_MIN_NUMBER_DIGITS = 8
+
+
+def _redact_number(match: re.Match[str]) -> str:
+    """Заменяет звездочками все цифры номера, кроме четырех последних; разделители сохраняются."""
+    number: str = match.group(0)
+    digits = sum(char.isdigit() for char in number)
+    if digits < _MIN_NUMBER_DIGITS:
+        return number
+    hidden = digits - 4
+    return _DIGIT_RE.sub('*', number, count=hidden)
+
+
+def redact(text: str) -> str:
+    """Заменяет в тексте номера карт и счетов звездочками, кроме четырех последних цифр."""
+    return _NUMBER_RE.sub(_redact_number, text)
+
+
+class RedactingFilter(logging.Filter):
+    """Скрывает номера карт и счетов в тексте сообщения (вместе с подставленными аргументами)."""
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        message = record.getMessage()
+        redacted = redact(message)
+        if redacted != message:
+            record.msg = redacted
+            record.args = None
+        return True
+
+
+class SamplingFilter(logging.Filter):
+    """
+    Прореживает сообщения об отдельных записях (с extra=PER_RECORD) уровня INFO и ниже.
+
+    Пропускается каждое k-е такое сообщение, где k = 1 / rate; предупреждения,
+    ошибки и сообщения без признака PER_RECORD пропускаются всегда.
+    """
+
+    def __init__(self, rate: float = LOG_SAMPLE_RATE) -> None:
+        super().__init__()
+        self.every = max(1, round(1 / rate)) if rate > 0 else 0
+        self._seen = 0
+        self._lock = threading.Lock()
+
+    def filter(self, record: logging.LogRecord) -> bool:
+        if record.levelno >= logging.WARNING or not getattr(record, 'per_record', False):
+            return True
+        if not self.every:
+            return False
+        with self._lock:
+            self._seen += 1
+            return (self._seen - 1) % self.every == 0
+
+
+_listener: Optional[QueueListener] = None
+_queue_handler: Optional[QueueHandler] = None
+_lock = threading.Lock()
+
+
+def setup_logging(log_name: str = "app", level: int = logging.INFO, sample_rate: float = LOG_SAMPLE_RATE,
+                  redact_pii: bool = True, console: bool = True) -> QueueListener:
+    """
+    Настраивает логирование приложения через очередь.
+
+    Корневой логгер получает QueueHandler: вызов логгера только кладет запись
+    в очередь, а запись в файл logs/<log_name>_<время>.log и в консоль
+    выполняет фоновый поток QueueListener. Настройка выполняется один раз
+    на процесс; повторные вызовы возвращают уже запущенный listener.
+
+    Args:
+        log_name: Префикс имени файла лога
+        level: Уровень корневого логгера
+        sample_rate: Доля сохраняемых сообщений об отдельных записях уровня INFO
+        redact_pii: Скрывать номера карт и счетов в сообщениях
+        console: Также выводить сообщения в консоль
+
+    Returns:
+        Запущенный QueueListener
+    """
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is not None:
+            return _listener
+
+        os.makedirs(LOGS_DIR, exist_ok=True)
+        current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
+        log_filename = os.path.join(LOGS_DIR, f"{log_name}_{current_time}.log")
+
+        handlers: List[logging.Handler] = [logging.FileHandler(log_filename, mode='w', encoding='utf-8')]
+        if console:
+            handlers.append(logging.StreamHandler())
+        formatter = logging.Formatter(LOG_FORMAT)
+        for handler in handlers:
+            handler.setFormatter(formatter)
+            if redact_pii:
+                # Маскировка выполняется в потоке listener, а не в вызывающем коде
+                handler.addFilter(RedactingFilter())
+
+        log_queue: queue.SimpleQueue[logging.LogRecord] = queue.SimpleQueue()
+        _queue_handler = QueueHandler(log_queue)
+        _queue_handler.addFilter(SamplingFilter(sample_rate))
+
+        root = logging.getLogger()
+        root.setLevel(level)
+        root.addHandler(_queue_handler)
+
+        _listener = QueueListener(log_queue, *handlers, respect_handler_level=True)
+        _listener.start()
+        atexit.register(shutdown_logging)
+        return _listener
+
+
+def shutdown_logging() -> None:
+    """Записывает оставшиеся в очереди сообщения и останавливает фоновый поток."""
+    global _listener, _queue_handler
+    with _lock:
+        if _listener is None:
+            return
+        if _queue_handler is not None:
+            logging.getLogger().removeHandler(_queue_handler)
+        _listener.stop()
+        for handler in _listener.handlers:
+            handler.close()
+        _listener = None
+        _queue_handler = None
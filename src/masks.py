@@ -1,67 +1,119 @@
 import logging
-import os
-from datetime import datetime
+from logging.handlers import QueueListener
+from typing import Any, Callable, Dict, Iterable, List, Optional, Tuple
 
+from src import logging_config
+from src.logging_config import PER_RECORD
 
-def setup_logging():
-    """Настройка логирования"""
-    # Создаем папку logs если она не существует
-    logs_dir = "logs"
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
+logger = logging.getLogger(__name__)
 
-    # Формируем имя файла с текущей датой и временем
-    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = os.path.join(logs_dir, f"app_{current_time}.log")
 
-    # Настраиваем логирование
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename, mode='w'),  # 'w' для перезаписи при каждом запуске
-            logging.StreamHandler()  # Также выводим в консоль (опционально)
-        ]
-    )
+def setup_logging() -> QueueListener:
+    """Настройка логирования (общая очередь с записью в файл в фоновом потоке)"""
+    return logging_config.setup_logging("app")
+
+
+def _mask_card_or_none(card_number: str) -> Optional[str]:
+    """Маскирует номер карты из 16 цифр в формате XXXX XX** **** XXXX; для некорректного номера возвращает None."""
+    if len(card_number) != 16 or not card_number.isdigit():
+        return None
+    return f"{card_number[:4]} {card_number[4:6]}** **** {card_number[-4:]}"
+
+
+def _mask_account_or_none(account_number: str) -> Optional[str]:
+    """Маскирует номер счета (не меньше 4 цифр) в формате **XXXX; для некорректного номера возвращает None."""
+    if len(account_number) < 4 or not account_number.isdigit():
+        return None
+    return f"**{account_number[-4:]}"
 
 
 def get_mask_card_number(card_number: str) -> str:
     """Функция маскирует номер карты в формате XXXX XX** **** XXXX"""
-    logger = logging.getLogger(__name__)
-
     try:
-        logger.info(f"Начало маскировки номера карты: {card_number}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Начало маскировки номера карты: %s", card_number, extra=PER_RECORD)
 
-        if len(card_number) != 16 or not card_number.isdigit():
+        masked = _mask_card_or_none(card_number)
+        if masked is None:
             error_msg = "Номеер карты должен состоять из 16 цифр"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        masked = f"{card_number[:4]} {card_number[4:6]}** **** {card_number[-4:]}"
-        logger.info(f"Номер карты успешно замаскирован: {masked}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Номер карты успешно замаскирован: %s", masked, extra=PER_RECORD)
         return masked
 
     except Exception as e:
-        logger.exception(f"Ошибка при маскировке номера карты: {str(e)}")
+        logger.exception("Ошибка при маскировке номера карты: %s", e)
         raise
 
 
 def get_mask_account(account_number: str) -> str:
     """Функция маскирует номер счета в формате **XXXX"""
-    logger = logging.getLogger(__name__)
-
     try:
-        logger.info(f"Начало маскировки номера счета: {account_number}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Начало маскировки номера счета: %s", account_number, extra=PER_RECORD)
 
-        if len(account_number) < 4 or not account_number.isdigit():
+        masked_account = _mask_account_or_none(account_number)
+        if masked_account is None:
             error_msg = "Номер счета должен содержать минимум 4 цифры"
             logger.error(error_msg)
             raise ValueError(error_msg)
 
-        masked_account = f"**{account_number[-4:]}"
-        logger.info(f"Номер счета успешно замаскирован: {masked_account}")
+        if logger.isEnabledFor(logging.INFO):
+            logger.info("Номер счета успешно замаскирован: %s", masked_account, extra=PER_RECORD)
         return masked_account
 
     except Exception as e:
-        logger.exception(f"Ошибка при маскировке номера счета: {str(e)}")
+        logger.exception("Ошибка при маскировке номера счета: %s", e)
         raise
+
+
+def _mask_batch(values: Iterable[Any], mask_one: Callable[[str], Optional[str]],
+                kind: str) -> Tuple[List[Optional[str]], Dict[int, Any]]:
+    """Маскирует значения функцией mask_one, собирая некорректные вместо исключений."""
+    masked: List[Optional[str]] = []
+    invalid: Dict[int, Any] = {}
+    append = masked.append
+    for i, value in enumerate(values):
+        result = mask_one(value) if isinstance(value, str) else None
+        if result is None:
+            invalid[i] = value
+        append(result)
+
+    logger.info("Замаскировано номеров %s: %d, некорректных: %d", kind, len(masked) - len(invalid), len(invalid))
+    return masked, invalid
+
+
+def mask_cards(card_numbers: Iterable[Any]) -> Tuple[List[Optional[str]], Dict[int, Any]]:
+    """
+    Маскирует номера карт пачкой в формате XXXX XX** **** XXXX.
+
+    В отличие от get_mask_card_number не выбрасывает исключение для
+    некорректного номера и пишет в лог одну итоговую запись на всю пачку.
+
+    Args:
+        card_numbers: Номера карт (список, колонка или массив строк)
+
+    Returns:
+        Маскированные номера в исходном порядке (None для некорректных)
+        и словарь некорректных значений по их позиции
+    """
+    return _mask_batch(card_numbers, _mask_card_or_none, "карт")
+
+
+def mask_accounts(account_numbers: Iterable[Any]) -> Tuple[List[Optional[str]], Dict[int, Any]]:
+    """
+    Маскирует номера счетов пачкой в формате **XXXX.
+
+    В отличие от get_mask_account не выбрасывает исключение для
+    некорректного номера и пишет в лог одну итоговую запись на всю пачку.
+
+    Args:
+        account_numbers: Номера счетов (список, колонка или массив строк)
+
+    Returns:
+        Маскированные номера в исходном порядке (None для некорректных)
+        и словарь некорректных значений по их позиции
+    """
+    return _mask_batch(account_numbers, _mask_account_or_none, "счетов")
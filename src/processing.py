@@ -1,9 +1,19 @@
-def filter_by_state(data: list[dict], state: str = 'EXECUTED') -> list[dict]:
+import heapq
+from typing import Iterable, Optional, Union
+
+from src.decorators import timed
+from src.timestamps import MISSING_TIMESTAMP, parse_timestamp, to_timestamp
+from src.transaction import Transaction
+
+
+@timed
+def filter_by_state(data: Iterable[dict], state: str = 'EXECUTED') -> list[dict]:
     """
     Фильтрует список словарей по значению ключа 'state'.
 
     Args:
-        data: Список словарей для фильтрации
+        data: Список словарей (или записей Transaction) для фильтрации
+            или итератор, например iter_transactions
         state: Значение для фильтрации (по умолчанию 'EXECUTED')
 
     Returns:
@@ -12,10 +22,23 @@ def filter_by_state(data: list[dict], state: str = 'EXECUTED') -> list[dict]:
     return [item for item in data if item.get('state') == state]
 
 
-def sort_by_date(data: list[dict], reverse: bool = True) -> list[dict]:
+def _date_key(item: Union[dict, Transaction]) -> int:
+    """Возвращает метку времени операции: у записи Transaction она уже вычислена при загрузке."""
+    if type(item) is Transaction:
+        if item.timestamp is None:
+            raise KeyError('date')
+        return item.timestamp
+    return to_timestamp(item['date'])
+
+
+def sort_by_date(data: Iterable[dict], reverse: bool = True) -> list[dict]:
     """
     Сортирует список словарей по дате (ключ 'date').
 
+    Сравниваются метки времени в UTC, а не строки, поэтому даты
+    в разных форматах ('2019-08-26T10:50:58.294041', '2023-09-05T11:30:32Z')
+    упорядочиваются правильно. Некорректные даты считаются самыми ранними.
+
     Args:
         data: Список словарей для сортировки
         reverse: Порядок сортировки (True - по убыванию, False - по возрастанию)
@@ -23,4 +46,59 @@ def sort_by_date(data: list[dict], reverse: bool = True) -> list[dict]:
     Returns:
         Отсортированный список словарей
     """
-    return sorted(data, key=lambda x: x['date'], reverse=reverse)
+    return sorted(data, key=_date_key, reverse=reverse)
+
+
+def filter_by_date_range(data: Iterable[dict], start: Union[str, int, None] = None,
+                         end: Union[str, int, None] = None) -> list[dict]:
+    """
+    Оставляет операции с датой в полуинтервале [start, end).
+
+    Args:
+        data: Список словарей (или записей Transaction) с операциями
+        start: Начало периода — дата ISO или метка времени в микросекундах (None — без ограничения)
+        end: Конец периода, не включая его (None — без ограничения)
+
+    Returns:
+        Список операций за период; операции без даты или с некорректной датой пропускаются
+    """
+    start_ts = parse_timestamp(start) if isinstance(start, str) else start
+    end_ts = parse_timestamp(end) if isinstance(end, str) else end
+
+    result = []
+    for item in data:
+        if type(item) is Transaction:
+            timestamp: Optional[int] = item.timestamp
+        else:
+            timestamp = to_timestamp(item.get('date'))
+        if timestamp is None or timestamp == MISSING_TIMESTAMP:
+            continue
+        if start_ts is not None and timestamp < start_ts:
+            continue
+        if end_ts is not None and timestamp >= end_ts:
+            continue
+        result.append(item)
+    return result
+
+
+def latest_operations(data: Iterable[dict], n: int = 5, state: Optional[str] = 'EXECUTED') -> list[dict]:
+    """
+    Возвращает n последних по дате операций с указанным статусом.
+
+    Выбор делается за один проход с кучей размера n: время O(N·log n),
+    память O(n), поэтому подходит и для итераторов вроде iter_transactions.
+    Результат совпадает с sort_by_date(filter_by_state(data, state))[:n].
+
+    Args:
+        data: Список словарей (или записей Transaction) или итератор операций
+        n: Количество операций
+        state: Статус операций (None — без фильтрации по статусу)
+
+    Returns:
+        Список операций по убыванию даты
+    """
+    if n <= 0:
+        return []
+    if state is not None:
+        data = (item for item in data if item.get('state') == state)
+    return heapq.nlargest(n, data, key=_date_key)
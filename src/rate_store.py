@@ -0,0 +1,110 @@
+import csv
+import logging
+import sqlite3
+import threading
+from typing import Dict, Iterable, Optional, Tuple
+
+# Строка таблицы курсов: (дата YYYY-MM-DD, базовая валюта, котируемая валюта, курс)
+RateRow = Tuple[str, str, str, float]
+
+_SCHEMA = """
+CREATE TABLE IF NOT EXISTS rates (
+    date TEXT NOT NULL,
+    base TEXT NOT NULL,
+    quote TEXT NOT NULL,
+    rate REAL NOT NULL,
+    PRIMARY KEY (base, quote, date)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS rates_by_base_date ON rates (base, date);
+"""
+
+
+class RateStore:
+    """
+    Локальное хранилище исторических курсов валют в SQLite.
+
+    Курс на дату не меняется, поэтому однажды полученный из API курс
+    сохраняется навсегда, и повторная обработка старых операций не требует
+    обращений к сети. Поиск идет по первичному ключу (base, quote, date).
+    Курс означает стоимость одной единицы base в quote. Одно соединение
+    разделяется между потоками под блокировкой.
+    """
+
+    def __init__(self, path: str = ':memory:') -> None:
+        self.path = path
+        self._connection = sqlite3.connect(path, check_same_thread=False)
+        self._lock = threading.Lock()
+        with self._lock, self._connection:
+            self._connection.executescript(_SCHEMA)
+
+    def get_rate(self, base: str, quote: str, date: str) -> Optional[float]:
+        """Возвращает курс на дату или None, если его нет в хранилище."""
+        with self._lock:
+            row = self._connection.execute(
+                "SELECT rate FROM rates WHERE base = ? AND quote = ? AND date = ?",
+                (base.upper(), quote.upper(), date[:10]),
+            ).fetchone()
+        return None if row is None else row[0]
+
+    def get_rates(self, base: str, date: str) -> Dict[str, float]:
+        """Возвращает все курсы к base на дату: количество единиц каждой валюты за одну единицу base."""
+        with self._lock:
+            rows = self._connection.execute(
+                "SELECT quote, rate FROM rates WHERE base = ? AND date = ?", (base.upper(), date[:10])
+            ).fetchall()
+        return dict(rows)
+
+    def set_rate(self, base: str, quote: str, date: str, rate: float) -> None:
+        """Сохраняет курс на дату, заменяя ранее сохраненный."""
+        self.set_rates([(date, base, quote, rate)])
+
+    def set_rates(self, rows: Iterable[RateRow]) -> int:
+        """
+        Сохраняет курсы одной транзакцией.
+
+        Args:
+            rows: Строки (дата, базовая валюта, котируемая валюта, курс)
+
+        Returns:
+            Количество сохраненных курсов
+        """
+        normalized = [(date[:10], base.upper(), quote.upper(), float(rate)) for date, base, quote, rate in rows]
+        with self._lock, self._connection:
+            self._connection.executemany(
+                "INSERT OR REPLACE INTO rates (date, base, quote, rate) VALUES (?, ?, ?, ?)", normalized
+            )
+        return len(normalized)
+
+    def load_csv(self, file_path: str, delimiter: str = ',') -> int:
+        """
+        Загружает таблицу курсов из CSV с колонками date, base, quote, rate.
+
+        Некорректные строки пропускаются с предупреждением в логе.
+
+        Args:
+            file_path: Путь к CSV-файлу
+            delimiter: Разделитель колонок
+
+        Returns:
+            Количество загруженных курсов
+        """
+        logger = logging.getLogger(__name__)
+
+        rows = []
+        with open(file_path, encoding='utf-8', newline='') as file:
+            for line_number, row in enumerate(csv.DictReader(file, delimiter=delimiter), start=2):
+                try:
+                    rows.append((row['date'], row['base'], row['quote'], float(row['rate'])))
+                except (KeyError, TypeError, ValueError) as e:
+                    logger.warning("Строка %s файла %s пропущена: %s", line_number, file_path, e)
+        return self.set_rates(rows)
+
+    def __len__(self) -> int:
+        with self._lock:
+            count: int = self._connection.execute("SELECT COUNT(*) FROM rates").fetchone()[0]
+        return count
+
+    def close(self) -> None:
+        """Закрывает соединение с базой."""
+        with self._lock:
+            self._connection.close()
@@ -1,18 +1,123 @@
 import re
-from typing import List, Dict
+from bisect import bisect_left
+from typing import List, Dict, Optional, Set
 
+from src.decorators import timed
 
-def process_bank_search(data: List[Dict], search: str) -> List[Dict]:
+# Запрос из слов, разделенных одиночными пробелами, не содержит спецсимволов regex
+_PLAIN_QUERY_RE = re.compile(r'\w+(?: \w+)*')
+_TOKEN_RE = re.compile(r'\w+')
+
+
+def _has_simple_case(text: str) -> bool:
+    """
+    Проверяет, что для текста поиск через lower() эквивалентен re.IGNORECASE.
+    Это не так для символов, у которых нижний регистр длиннее исходного
+    или не совпадает после обратного преобразования (например, 'İ', 'ſ').
+    """
+    lowered = text.lower()
+    return len(lowered) == len(text) and lowered.upper().lower() == lowered
+
+
+class DescriptionIndex:
+    """
+    Инвертированный индекс описаний операций для process_bank_search.
+
+    Строится один раз по списку операций. Описания разбиваются на токены
+    в нижнем регистре; для каждого токена хранится список номеров операций
+    (posting list), а отсортированный список суффиксов токенов позволяет
+    искать слово как префикс суффикса, то есть как любую подстроку токена.
+    Запросы из обычных слов отвечают пересечением списков, а кандидаты
+    проверяются тем же регулярным выражением, что и в process_bank_search,
+    поэтому результат и порядок совпадают. Настоящие регулярные выражения
+    обрабатываются полным просмотром через process_bank_search.
+    """
+
+    def __init__(self, data: List[Dict]) -> None:
+        self._data = data or []
+        self._descriptions: Dict[int, str] = {}
+        # Операции, для которых lower() не эквивалентен IGNORECASE: всегда проверяются напрямую
+        self._always_check: Set[int] = set()
+
+        postings: Dict[str, List[int]] = {}
+        for row_id, operation in enumerate(self._data):
+            description = operation.get('description')
+            if not description:
+                continue
+            self._descriptions[row_id] = description
+            if not _has_simple_case(description):
+                self._always_check.add(row_id)
+            for token in set(_TOKEN_RE.findall(description.lower())):
+                postings.setdefault(token, []).append(row_id)
+
+        self._tokens = list(postings)
+        self._postings = [postings[token] for token in self._tokens]
+        # Суффиксы всех различных токенов: поиск подстроки токена = поиск префикса суффикса
+        self._suffixes = sorted(
+            (token[start:], token_id)
+            for token_id, token in enumerate(self._tokens)
+            for start in range(len(token))
+        )
+
+    def _rows_with_substring(self, word: str) -> Set[int]:
+        """Возвращает операции, у которых какой-либо токен содержит word."""
+        rows: Set[int] = set()
+        seen_tokens: Set[int] = set()
+        position = bisect_left(self._suffixes, (word,))
+        while position < len(self._suffixes) and self._suffixes[position][0].startswith(word):
+            token_id = self._suffixes[position][1]
+            if token_id not in seen_tokens:
+                seen_tokens.add(token_id)
+                rows.update(self._postings[token_id])
+            position += 1
+        return rows
+
+    def search(self, search: str) -> List[Dict]:
+        """
+        Ищет операции по строке в описании с тем же результатом, что process_bank_search.
+
+        Args:
+            search: Строка поиска или регулярное выражение
+
+        Returns:
+            Список операций в исходном порядке
+        """
+        if not search or not self._data:
+            return []
+
+        if not _PLAIN_QUERY_RE.fullmatch(search) or not _has_simple_case(search):
+            return process_bank_search(self._data, search)
+
+        candidates: Optional[Set[int]] = None
+        for word in search.lower().split(' '):
+            rows = self._rows_with_substring(word)
+            candidates = rows if candidates is None else candidates & rows
+            if not candidates:
+                break
+
+        candidates = (candidates or set()) | self._always_check
+        pattern = re.compile(search, re.IGNORECASE)
+        return [self._data[row_id] for row_id in sorted(candidates)
+                if pattern.search(self._descriptions[row_id])]
+
+
+@timed
+def process_bank_search(data: List[Dict], search: str, index: Optional[DescriptionIndex] = None) -> List[Dict]:
     """
     Фильтрует список банковских операций по наличию строки поиска в описании.
 
     Args:
         data: Список словарей с данными о банковских операциях
         search: Строка для поиска в описании операций
+        index: Индекс DescriptionIndex, построенный по тем же data;
+            если передан, обычные слова ищутся по индексу без просмотра всех описаний
 
     Returns:
         Список отфильтрованных словарей, где в описании найдена строка поиска
     """
+    if index is not None:
+        return index.search(search)
+
     if not search or not data:
         return []
 
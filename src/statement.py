@@ -0,0 +1,166 @@
+import os
+import sys
+from typing import Any, Iterable, List, TextIO, Union
+
+from src.decorators import memoize, timed
+from src.timestamps import MISSING_TIMESTAMP, format_local_date
+from src.transaction import Transaction
+from src.widget import mask_account_card
+
+# Объем текста (в символах), который накапливается перед одной записью в поток,
+# и размер буфера файла, открываемого по пути
+STATEMENT_BUFFER_SIZE = int(os.getenv('STATEMENT_BUFFER_SIZE', 1 << 16))
+
+# Максимальное число дней в кэше отформатированных дат выписки
+DATE_CACHE_SIZE = int(os.getenv('DATE_CACHE_SIZE', 4096))
+
+SEPARATOR = "-" * 40
+
+# Блок операции в том виде, в котором его выводили print(format_operation_details(...)) и print("-" * 40)
+_BLOCK_WITH_SOURCE = ("{} {}\n{} -> {}\nСумма: {} {}\n\n" + SEPARATOR + "\n").format
+_BLOCK_WITHOUT_SOURCE = ("{} {}\n{}\nСумма: {} {}\n\n" + SEPARATOR + "\n").format
+
+
+def format_date(date_str: str) -> str:
+    """
+    Форматирует дату из ISO формата в DD.MM.YYYY.
+
+    Выводится дата так, как она записана в строке, без перевода в UTC.
+
+    Args:
+        date_str: Дата в строковом формате
+
+    Returns:
+        Отформатированная дата
+    """
+    try:
+        return format_local_date(date_str)
+    except (ValueError, TypeError):
+        return date_str
+
+
+@memoize(maxsize=DATE_CACHE_SIZE)
+def _format_day(day: str) -> str:
+    """Форматирует записанную дату 'YYYY-MM-DD' в DD.MM.YYYY (результат кэшируется по дню)."""
+    return format_local_date(day)
+
+
+def _render_date(operation: Any) -> str:
+    """Дата блока операции, совпадающая с format_date(operation.get('date', ''))."""
+    date_str = operation.get('date', '')
+    if (type(operation) is Transaction and operation.timestamp is not None
+            and operation.timestamp != MISSING_TIMESTAMP
+            and date_str[4:5] == '-' and date_str[7:8] == '-'):
+        # Дата записи уже проверена при загрузке, а у операций одного дня строки
+        # различаются только временем, поэтому дата форматируется один раз на день
+        return _format_day(date_str[:10])
+    return format_date(date_str)
+
+
+def format_operation_details(operation: dict) -> str:
+    """
+    Форматирует детали операции для вывода.
+
+    Args:
+        operation: Словарь (или запись Transaction) с данными операции
+
+    Returns:
+        Отформатированная строка
+    """
+    date = format_date(operation.get('date', ''))
+    description = operation.get('description', 'Без описания')
+
+    from_info = operation.get('from', '')
+    to_info = operation.get('to', '')
+    amount = operation.get('operationAmount', {}).get('amount', '0')
+    currency = operation.get('operationAmount', {}).get('currency', {}).get('name', 'руб.')
+
+    # Маскирование номеров (результат кэшируется для повторяющихся карт и счетов)
+    if from_info:
+        from_info = mask_account_card(from_info)
+
+    if to_info:
+        to_info = mask_account_card(to_info)
+
+    # Формирование строки
+    result = f"{date} {description}\n"
+
+    if from_info:
+        result += f"{from_info} -> "
+    result += f"{to_info}\n"
+    result += f"Сумма: {amount} {currency}\n"
+
+    return result
+
+
+def _render_block(operation: Any) -> str:
+    """Собирает текст блока одной операции вместе с разделителем."""
+    date = _render_date(operation)
+    description = operation.get('description', 'Без описания')
+    from_info = operation.get('from', '')
+    to_info = operation.get('to', '')
+
+    if type(operation) is Transaction:
+        # Поля записи читаются напрямую, без сборки вложенного словаря operationAmount
+        amount = '0' if operation.amount is None else operation.amount
+        currency = 'руб.' if operation.currency_name is None else operation.currency_name
+    else:
+        operation_amount = operation.get('operationAmount', {})
+        amount = operation_amount.get('amount', '0')
+        currency = operation_amount.get('currency', {}).get('name', 'руб.')
+
+    if to_info:
+        to_info = mask_account_card(to_info)
+    if from_info:
+        return _BLOCK_WITH_SOURCE(date, description, mask_account_card(from_info), to_info, amount, currency)
+    return _BLOCK_WITHOUT_SOURCE(date, description, to_info, amount, currency)
+
+
+def _write_blocks(operations: Iterable[Any], stream: TextIO, buffer_size: int) -> int:
+    """Пишет блоки операций в поток порциями не меньше buffer_size символов."""
+    chunk: List[str] = []
+    pending = 0
+    count = 0
+    for operation in operations:
+        block = _render_block(operation)
+        chunk.append(block)
+        pending += len(block)
+        count += 1
+        if pending >= buffer_size:
+            stream.write(''.join(chunk))
+            chunk.clear()
+            pending = 0
+    if chunk:
+        stream.write(''.join(chunk))
+    return count
+
+
+@timed
+def render_statement(operations: Iterable[Any], target: Union[str, TextIO, None] = None,
+                     buffer_size: int = STATEMENT_BUFFER_SIZE, encoding: str = 'utf-8') -> int:
+    """
+    Выводит выписку по операциям в поток или файл.
+
+    Текст совпадает с выводом print(format_operation_details(operation))
+    и print("-" * 40) для каждой операции, но блоки собираются по готовым
+    шаблонам и записываются в поток крупными порциями, а не двумя вызовами
+    print на операцию. Операции читаются из итерируемого объекта по одной,
+    поэтому выписку можно строить из генератора.
+
+    Args:
+        operations: Словари или записи Transaction
+        target: Поток для записи, путь к файлу или None (стандартный вывод)
+        buffer_size: Размер порции текста и буфера файла
+        encoding: Кодировка файла, если target задан путем
+
+    Returns:
+        Количество выведенных операций
+    """
+    if isinstance(target, str):
+        with open(target, 'w', encoding=encoding, buffering=buffer_size) as file:
+            return _write_blocks(operations, file, buffer_size)
+
+    stream = sys.stdout if target is None else target
+    count = _write_blocks(operations, stream, buffer_size)
+    stream.flush()
+    return count
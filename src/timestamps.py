@@ -0,0 +1,88 @@
+from datetime import date, datetime
+from typing import Any, Iterable
+
+import numpy as np
+
+# Метка времени для операций без даты или с нераспознанной датой: такие операции
+# оказываются в начале при сортировке по возрастанию (совпадает с NaT в NumPy)
+MISSING_TIMESTAMP = int(np.iinfo(np.int64).min)
+
+MICROSECONDS_PER_DAY = 86400 * 1_000_000
+
+# Порядковый номер 1970-01-01 в datetime.toordinal
+_EPOCH_ORDINAL = 719163
+
+
+def parse_timestamp(date_str: str) -> int:
+    """
+    Переводит дату ISO 8601 в целое число микросекунд от начала эпохи (UTC).
+
+    Дата без часового пояса считается датой в UTC, 'Z' и смещения вида
+    +03:00 приводятся к UTC. Разбор выполняет C-реализация fromisoformat
+    над наивной частью строки, а метка считается целочисленной арифметикой,
+    без создания объектов с часовым поясом.
+
+    Raises:
+        ValueError: Если строка не является корректной датой
+    """
+    if date_str[-1:] == 'Z':
+        date_str = date_str[:-1]
+    dt = datetime.fromisoformat(date_str)
+    seconds = (dt.toordinal() - _EPOCH_ORDINAL) * 86400 + dt.hour * 3600 + dt.minute * 60 + dt.second
+    offset = dt.utcoffset()
+    if offset is not None:
+        seconds -= int(offset.total_seconds())
+    return seconds * 1_000_000 + dt.microsecond
+
+
+def to_timestamp(date_str: Any) -> int:
+    """Как parse_timestamp, но для пустой или некорректной даты возвращает MISSING_TIMESTAMP."""
+    if not isinstance(date_str, str) or not date_str:
+        return MISSING_TIMESTAMP
+    try:
+        return parse_timestamp(date_str)
+    except ValueError:
+        return MISSING_TIMESTAMP
+
+
+def parse_timestamps(dates: Iterable[Any]) -> np.ndarray:
+    """
+    Переводит колонку дат в массив меток времени int64 (микросекунды UTC).
+
+    Даты фиксированного формата выписок разбираются векторно через
+    datetime64 в NumPy. Если в колонке встречаются смещения часового пояса
+    или некорректные значения, колонка разбирается поэлементно через
+    to_timestamp.
+    """
+    dates = list(dates)
+    try:
+        naive = [value[:-1] if value[-1:] == 'Z' else value for value in dates]
+        if any(len(value) > 10 and value[-6] in '+-' for value in naive):
+            raise ValueError("Смещения часового пояса разбираются поэлементно")
+        return np.array(naive, dtype='datetime64[us]').astype(np.int64)
+    except (TypeError, ValueError, IndexError):
+        return np.fromiter((to_timestamp(value) for value in dates), dtype=np.int64, count=len(dates))
+
+
+def format_local_date(date_str: str) -> str:
+    """
+    Форматирует дату ISO 8601 в 'DD.MM.YYYY' так, как она записана в строке.
+
+    В отличие от format_timestamp смещение часового пояса не применяется:
+    '2024-01-16T01:00:00+03:00' выводится как 16.01.2024. Метки времени UTC
+    предназначены для сортировки и фильтрации по периоду, а для вывода
+    используется эта функция.
+
+    Raises:
+        ValueError: Если строка не является корректной датой
+    """
+    if date_str[-1:] == 'Z':
+        date_str = date_str[:-1]
+    dt = datetime.fromisoformat(date_str)
+    return f"{dt.day:02d}.{dt.month:02d}.{dt.year:04d}"
+
+
+def format_timestamp(timestamp: int) -> str:
+    """Форматирует метку времени (микросекунды UTC) в 'DD.MM.YYYY' — дату в UTC."""
+    day = date.fromordinal(timestamp // MICROSECONDS_PER_DAY + _EPOCH_ORDINAL)
+    return f"{day.day:02d}.{day.month:02d}.{day.year:04d}"
@@ -0,0 +1,135 @@
+import sys
+from dataclasses import dataclass
+from typing import Any, Dict, Optional, Union
+
+from src.timestamps import to_timestamp
+
+
+def _intern(value: Any) -> Any:
+    """Интернирует строку, чтобы повторяющиеся значения хранились в памяти один раз."""
+    return sys.intern(value) if type(value) is str else value
+
+
+@dataclass(frozen=True, slots=True)
+class Transaction:
+    """
+    Компактная запись о банковской операции.
+
+    Хранит плоские поля вместо словаря со вложенными operationAmount
+    и currency. Повторяющиеся строки (статус, валюта, описание)
+    интернируются. Дата разбирается один раз при создании записи в поле
+    timestamp (микросекунды UTC): по нему сортируют и форматируют дату,
+    не разбирая строку повторно. Для совместимости с кодом, работающим
+    со словарями, поддерживает чтение по ключам исходного формата: get и [].
+    Отсутствующие в исходных данных поля хранятся как None.
+    """
+
+    id: Any
+    state: Optional[str]
+    date: Optional[str]
+    amount: Union[str, float, None]
+    currency_code: Optional[str]
+    currency_name: Optional[str]
+    from_: Optional[str]
+    to: Optional[str]
+    description: Optional[str]
+    timestamp: Optional[int] = None
+
+    @classmethod
+    def create(cls, id: Any = None, state: Optional[str] = None, date: Optional[str] = None,
+               amount: Union[str, float, None] = None, currency_code: Optional[str] = None,
+               currency_name: Optional[str] = None, from_: Optional[str] = None, to: Optional[str] = None,
+               description: Optional[str] = None, timestamp: Optional[int] = None) -> 'Transaction':
+        """
+        Создает запись, интернируя повторяющиеся строковые поля.
+
+        Если timestamp не передан (например, уже разобран загрузчиком для всей колонки),
+        он вычисляется из date. Для некорректной даты timestamp равен MISSING_TIMESTAMP,
+        для отсутствующей — None.
+        """
+        if timestamp is None and date is not None:
+            timestamp = to_timestamp(date)
+        return cls(id, _intern(state), date, amount, _intern(currency_code), _intern(currency_name),
+                   from_, to, _intern(description), timestamp)
+
+    @classmethod
+    def from_dict(cls, data: Dict[str, Any]) -> 'Transaction':
+        """Создает запись из словаря в формате operations.json."""
+        operation_amount = data.get('operationAmount') or {}
+        currency = operation_amount.get('currency') or {}
+        return cls.create(
+            id=data.get('id'),
+            state=data.get('state'),
+            date=data.get('date'),
+            amount=operation_amount.get('amount'),
+            currency_code=currency.get('code'),
+            currency_name=currency.get('name'),
+            from_=data.get('from'),
+            to=data.get('to'),
+            description=data.get('description'),
+        )
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Возвращает операцию в формате operations.json (поля со значением None опускаются)."""
+        result = {}
+        for key in ('id', 'state', 'date'):
+            value = getattr(self, key)
+            if value is not None:
+                result[key] = value
+        operation_amount = self._operation_amount()
+        if operation_amount is not None:
+            result['operationAmount'] = operation_amount
+        for key, attr in (('description', 'description'), ('from', 'from_'), ('to', 'to')):
+            value = getattr(self, attr)
+            if value is not None:
+                result[key] = value
+        return result
+
+    def _operation_amount(self) -> Optional[Dict[str, Any]]:
+        """Собирает вложенный словарь operationAmount по требованию."""
+        if self.amount is None and self.currency_code is None and self.currency_name is None:
+            return None
+        operation_amount: Dict[str, Any] = {}
+        if self.amount is not None:
+            operation_amount['amount'] = self.amount
+        currency = {}
+        if self.currency_name is not None:
+            currency['name'] = self.currency_name
+        if self.currency_code is not None:
+            currency['code'] = self.currency_code
+        if currency:
+            operation_amount['currency'] = currency
+        return operation_amount
+
+    def get(self, key: str, default: Any = None) -> Any:
+        """Читает поле по ключу словарного формата, как dict.get."""
+        if key == 'operationAmount':
+            value = self._operation_amount()
+        else:
+            attr = _KEY_TO_FIELD.get(key)
+            value = getattr(self, attr) if attr else None
+        return default if value is None else value
+
+    def __getitem__(self, key: str) -> Any:
+        value = self.get(key)
+        if value is None:
+            raise KeyError(key)
+        return value
+
+    def __contains__(self, key: str) -> bool:
+        return self.get(key) is not None
+
+
+# Соответствие ключей словарного формата полям записи
+_KEY_TO_FIELD = {
+    'id': 'id',
+    'state': 'state',
+    'date': 'date',
+    'amount': 'amount',
+    'currency': 'currency_code',
+    'currency_code': 'currency_code',
+    'currency_name': 'currency_name',
+    'from': 'from_',
+    'to': 'to',
+    'description': 'description',
+}
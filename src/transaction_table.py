@@ -0,0 +1,178 @@
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Union
+
+import numpy as np
+
+from src.timestamps import MISSING_TIMESTAMP, parse_timestamp, parse_timestamps
+from src.transaction import Transaction
+
+
+def _amount_to_cents(amount: Any) -> int:
+    """Переводит сумму (строку или число) в целое число копеек/центов."""
+    try:
+        return round(float(amount) * 100)
+    except (TypeError, ValueError):
+        return 0
+
+
+def _currency_code(operation: Union[Dict[str, Any], Transaction]) -> Optional[str]:
+    """Возвращает код валюты операции."""
+    if type(operation) is Transaction:
+        return operation.currency_code
+    code: Optional[str] = (operation.get('operationAmount') or {}).get('currency', {}).get('code')
+    return code
+
+
+def _timestamps(rows: List[Any]) -> np.ndarray:
+    """Собирает колонку меток времени: записи Transaction уже содержат их, словари разбираются векторно."""
+    if all(type(row) is Transaction for row in rows):
+        return np.array([MISSING_TIMESTAMP if row.timestamp is None else row.timestamp for row in rows],
+                        dtype=np.int64)
+    return parse_timestamps(row.get('date') for row in rows)
+
+
+def _encode(values: List[Any], categories: Dict[Any, int]) -> np.ndarray:
+    """Кодирует значения номерами категорий, пополняя словарь категорий."""
+    return np.fromiter((categories.setdefault(value, len(categories)) for value in values),
+                       dtype=np.int32, count=len(values))
+
+
+class TransactionTable:
+    """
+    Колоночное представление списка операций на массивах NumPy.
+
+    Хранит идентификаторы, метки времени (микросекунды UTC), суммы в целых
+    копейках и коды категорий статуса и валюты. Фильтрация и сортировка
+    выполняются векторно и возвращают новую таблицу, которая разделяет
+    колонки с исходной и отличается только массивом индексов строк.
+    Исходные операции (словари или записи Transaction) сохраняются,
+    поэтому to_list возвращает их без изменений.
+    """
+
+    def __init__(self, rows: List[Any], columns: Dict[str, np.ndarray], states: Dict[Any, int],
+                 currencies: Dict[Any, int], index: Optional[np.ndarray] = None) -> None:
+        self._rows = rows
+        self._columns = columns
+        self._states = states
+        self._currencies = currencies
+        self._index = np.arange(len(rows), dtype=np.int64) if index is None else index
+
+    @classmethod
+    def from_list(cls, data: Iterable[Union[Dict[str, Any], Transaction]]) -> 'TransactionTable':
+        """Строит таблицу из списка словарей или записей Transaction."""
+        rows = list(data)
+        states: Dict[Any, int] = {}
+        currencies: Dict[Any, int] = {}
+
+        ids = []
+        for row in rows:
+            try:
+                ids.append(int(row.get('id', 0)))
+            except (TypeError, ValueError):
+                ids.append(0)
+
+        amounts = []
+        for row in rows:
+            if type(row) is Transaction:
+                amounts.append(row.amount)
+            else:
+                amounts.append((row.get('operationAmount') or {}).get('amount'))
+
+        columns = {
+            'id': np.array(ids, dtype=np.int64),
+            'timestamp': _timestamps(rows),
+            'amount': np.array([_amount_to_cents(amount) for amount in amounts], dtype=np.int64),
+            'state': _encode([row.get('state') for row in rows], states),
+            'currency': _encode([_currency_code(row) for row in rows], currencies),
+        }
+        return cls(rows, columns, states, currencies)
+
+    def to_list(self) -> List[Union[Dict[str, Any], Transaction]]:
+        """Возвращает операции выборки в исходном формате и порядке выборки."""
+        rows = self._rows
+        return [rows[i] for i in self._index.tolist()]
+
+    def _view(self, index: np.ndarray) -> 'TransactionTable':
+        """Создает таблицу с теми же колонками и другим набором строк."""
+        return TransactionTable(self._rows, self._columns, self._states, self._currencies, index)
+
+    def _select(self, column: str, categories: Dict[Any, int], value: Any) -> 'TransactionTable':
+        """Оставляет строки, у которых категория в колонке равна value."""
+        code = categories.get(value)
+        if code is None:
+            return self._view(self._index[:0])
+        return self._view(self._index[self._columns[column][self._index] == code])
+
+    def filter_by_state(self, state: str = 'EXECUTED') -> 'TransactionTable':
+        """Оставляет операции с указанным статусом."""
+        return self._select('state', self._states, state)
+
+    def filter_by_currency(self, currency: str) -> 'TransactionTable':
+        """Оставляет операции с указанным кодом валюты."""
+        return self._select('currency', self._currencies, currency)
+
+    def sort_by_date(self, reverse: bool = True) -> 'TransactionTable':
+        """
+        Сортирует операции по дате (стабильно, как sorted).
+
+        Args:
+            reverse: Порядок сортировки (True - по убыванию, False - по возрастанию)
+        """
+        timestamps = self._columns['timestamp']
+        if not reverse:
+            order = np.argsort(timestamps[self._index], kind='stable')
+            return self._view(self._index[order])
+        # Стабильная сортировка по убыванию: сортируем перевернутый массив и переворачиваем результат,
+        # тогда операции с одинаковой датой сохраняют исходный порядок
+        reversed_index = self._index[::-1]
+        order = np.argsort(timestamps[reversed_index], kind='stable')[::-1]
+        return self._view(reversed_index[order])
+
+    def filter_by_date_range(self, start: Union[str, int, None] = None,
+                             end: Union[str, int, None] = None) -> 'TransactionTable':
+        """
+        Оставляет операции с датой в полуинтервале [start, end).
+
+        Args:
+            start: Начало периода — дата ISO или метка времени в микросекундах (None — без ограничения)
+            end: Конец периода, не включая его (None — без ограничения)
+        """
+        timestamps = self._columns['timestamp'][self._index]
+        mask = timestamps != MISSING_TIMESTAMP
+        if start is not None:
+            mask &= timestamps >= (parse_timestamp(start) if isinstance(start, str) else start)
+        if end is not None:
+            mask &= timestamps < (parse_timestamp(end) if isinstance(end, str) else end)
+        return self._view(self._index[mask])
+
+    def head(self, n: int = 5) -> 'TransactionTable':
+        """Возвращает первые n операций выборки (срез индекса без копирования)."""
+        return self._view(self._index[:n])
+
+    @property
+    def indices(self) -> np.ndarray:
+        """Номера строк исходного списка, входящих в выборку."""
+        return self._index
+
+    @property
+    def ids(self) -> np.ndarray:
+        """Идентификаторы операций выборки."""
+        column: np.ndarray = self._columns['id'][self._index]
+        return column
+
+    @property
+    def timestamps(self) -> np.ndarray:
+        """Метки времени операций выборки в микросекундах UTC."""
+        column: np.ndarray = self._columns['timestamp'][self._index]
+        return column
+
+    @property
+    def amounts(self) -> np.ndarray:
+        """Суммы операций в целых копейках/центах."""
+        column: np.ndarray = self._columns['amount'][self._index]
+        return column
+
+    def __len__(self) -> int:
+        return len(self._index)
+
+    def __iter__(self) -> Iterator[Union[Dict[str, Any], Transaction]]:
+        return iter(self.to_list())
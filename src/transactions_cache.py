@@ -0,0 +1,193 @@
+import functools
+import hashlib
+import logging
+import os
+import pickle
+from typing import Any, Callable, Dict, List, Optional
+
+# Папка кэша создается рядом с исходным файлом
+CACHE_DIR_NAME = '.transactions_cache'
+CACHE_SUFFIX = '.pkl'
+# Версия формата: при изменении структуры записей старые файлы кэша считаются устаревшими
+CACHE_VERSION = 2
+# Максимальное число файлов кэша в одной папке
+MAX_CACHE_ENTRIES = 16
+
+
+def _loader_id(loader: Callable) -> str:
+    """Возвращает имя загрузчика, под которым его результат хранится в кэше."""
+    if isinstance(loader, functools.partial):
+        # Параметры partial влияют на результат, поэтому входят в ключ
+        return f"{_loader_id(loader.func)}{loader.args}{sorted(loader.keywords.items())}"
+    return f"{loader.__module__}.{loader.__qualname__}"
+
+
+def _content_hash(file_path: str) -> str:
+    """Считает хэш содержимого файла."""
+    with open(file_path, 'rb') as file:
+        return hashlib.file_digest(file, 'blake2b').hexdigest()
+
+
+def _cache_dir_for(file_path: str) -> str:
+    """Возвращает папку кэша рядом с исходным файлом."""
+    return os.path.join(os.path.dirname(os.path.abspath(file_path)), CACHE_DIR_NAME)
+
+
+def _cache_path(cache_dir: str, file_path: str, loader_id: str) -> str:
+    """Возвращает путь к файлу кэша для пары (исходный файл, загрузчик)."""
+    key = hashlib.sha1(f"{os.path.abspath(file_path)}|{loader_id}".encode('utf-8')).hexdigest()[:16]
+    return os.path.join(cache_dir, f"{os.path.basename(file_path)}.{key}{CACHE_SUFFIX}")
+
+
+def _read_header(cache_path: str) -> Optional[Dict[str, Any]]:
+    """Читает заголовок файла кэша, не загружая сами транзакции."""
+    try:
+        with open(cache_path, 'rb') as file:
+            header = pickle.load(file)
+    except Exception:
+        # Поврежденный файл может вызвать при разборе почти любое исключение
+        # (например, ValueError для неизвестной версии протокола pickle)
+        return None
+    if not isinstance(header, dict) or header.get('version') != CACHE_VERSION:
+        return None
+    return header
+
+
+def _is_fresh(header: Dict[str, Any]) -> bool:
+    """Проверяет, что исходный файл не изменился по размеру и времени модификации."""
+    try:
+        stat = os.stat(header['path'])
+    except (OSError, KeyError):
+        return False
+    return stat.st_size == header.get('size') and stat.st_mtime_ns == header.get('mtime_ns')
+
+
+def _remove(path: str) -> None:
+    """Удаляет файл кэша, игнорируя ошибки (например, гонку с другим процессом)."""
+    try:
+        os.remove(path)
+    except OSError:
+        pass
+
+
+def evict_stale_entries(cache_dir: str, max_entries: int = MAX_CACHE_ENTRIES) -> int:
+    """
+    Удаляет устаревшие файлы кэша.
+
+    Устаревшими считаются записи, исходный файл которых удален или изменен,
+    а также самые старые записи сверх max_entries.
+
+    Args:
+        cache_dir: Папка кэша
+        max_entries: Максимальное число записей, которые нужно сохранить
+
+    Returns:
+        Количество удаленных файлов
+    """
+    if not os.path.isdir(cache_dir):
+        return 0
+
+    removed = 0
+    alive = []
+    for name in os.listdir(cache_dir):
+        if not name.endswith(CACHE_SUFFIX):
+            continue
+        path = os.path.join(cache_dir, name)
+        header = _read_header(path)
+        if header is None or not _is_fresh(header):
+            _remove(path)
+            removed += 1
+        else:
+            alive.append(path)
+
+    # Сверх лимита удаляем записи, к которым дольше всего не обращались
+    alive.sort(key=lambda path: os.stat(path).st_mtime_ns, reverse=True)
+    for path in alive[max_entries:]:
+        _remove(path)
+        removed += 1
+
+    return removed
+
+
+def load_cached(file_path: str, loader: Callable[[str], List[Any]],
+                cache_dir: Optional[str] = None) -> List[Any]:
+    """
+    Загружает транзакции через loader, кэшируя результат в бинарном файле.
+
+    Запись кэша привязана к пути, размеру, времени модификации и хэшу
+    содержимого исходного файла. Если ничего из этого не изменилось,
+    транзакции читаются из кэша без повторного разбора. Устаревшая запись
+    удаляется и перестраивается. Пустой результат (ошибка загрузки) не кэшируется.
+
+    Args:
+        file_path: Путь к файлу с транзакциями (JSON, CSV или XLSX)
+        loader: Функция загрузки, например load_transactions
+        cache_dir: Папка кэша (по умолчанию .transactions_cache рядом с файлом)
+
+    Returns:
+        Список транзакций
+    """
+    logger = logging.getLogger(__name__)
+
+    cache_dir = cache_dir or _cache_dir_for(file_path)
+    loader_id = _loader_id(loader)
+    cache_path = _cache_path(cache_dir, file_path, loader_id)
+
+    try:
+        stat = os.stat(file_path)
+    except OSError:
+        return loader(file_path)
+
+    digest = None
+    header = _read_header(cache_path)
+    if header is not None:
+        if (header.get('path') == os.path.abspath(file_path) and header.get('loader') == loader_id
+                and _is_fresh(header)):
+            digest = _content_hash(file_path)
+            if header.get('digest') == digest:
+                try:
+                    with open(cache_path, 'rb') as file:
+                        pickle.load(file)
+                        transactions: List[Any] = pickle.load(file)
+                    # Обновляем время изменения записи: по нему вытесняются давно не используемые
+                    os.utime(cache_path)
+                    logger.info("Транзакции загружены из кэша: %s", cache_path)
+                    return transactions
+                except Exception:
+                    # Поврежденное тело записи: удаляем ее и разбираем файл заново
+                    pass
+        logger.info("Запись кэша устарела: %s", cache_path)
+        _remove(cache_path)
+    elif os.path.exists(cache_path):
+        logger.info("Запись кэша повреждена или записана в другом формате: %s", cache_path)
+        _remove(cache_path)
+
+    # Хэш считаем до разбора, чтобы он соответствовал прочитанному снимку файла
+    digest = digest or _content_hash(file_path)
+    transactions = loader(file_path)
+    if not transactions:
+        return transactions
+
+    header = {
+        'version': CACHE_VERSION,
+        'path': os.path.abspath(file_path),
+        'loader': loader_id,
+        'size': stat.st_size,
+        'mtime_ns': stat.st_mtime_ns,
+        'digest': digest,
+    }
+
+    tmp_path = f"{cache_path}.{os.getpid()}.tmp"
+    try:
+        os.makedirs(cache_dir, exist_ok=True)
+        with open(tmp_path, 'wb') as file:
+            pickle.dump(header, file, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(transactions, file, protocol=pickle.HIGHEST_PROTOCOL)
+        # Атомарная замена: параллельный читатель не увидит недописанный файл
+        os.replace(tmp_path, cache_path)
+        evict_stale_entries(cache_dir)
+    except OSError as e:
+        logger.warning("Не удалось сохранить кэш %s: %s", cache_path, e)
+        _remove(tmp_path)
+
+    return transactions
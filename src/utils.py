@@ -1,35 +1,58 @@
 import json
 import os
 import logging
-from typing import List, Dict, Any
-from datetime import datetime
+import re
+from logging.handlers import QueueListener
+from typing import List, Dict, Any, Iterator, Union
 
+from src import logging_config
+from src.decorators import timed
+from src.transaction import Transaction
 
-def setup_logging():
-    """Настройка логирования для модуля транзакций"""
-    logs_dir = "logs"
-    if not os.path.exists(logs_dir):
-        os.makedirs(logs_dir)
+# Размер порции, которой файл читается при потоковом разборе
+STREAM_CHUNK_SIZE = 64 * 1024
 
-    current_time = datetime.now().strftime("%Y%m%d_%H%M%S")
-    log_filename = os.path.join(logs_dir, f"transactions_{current_time}.log")
+_JSON_WHITESPACE = ' \t\n\r'
 
-    logging.basicConfig(
-        level=logging.INFO,
-        format='%(asctime)s - %(name)s - %(levelname)s - %(message)s',
-        handlers=[
-            logging.FileHandler(log_filename, mode='w'),
-            logging.StreamHandler()
-        ]
-    )
+# Тип верхнеуровневого значения JSON по его первому символу (для сообщения о файле, не содержащем список)
+_JSON_TYPE_BY_FIRST_CHAR = {'{': dict, '"': str, 't': bool, 'f': bool, 'n': type(None)}
+_JSON_TYPE_BY_FIRST_CHAR.update(dict.fromkeys('-0123456789', float))
 
+# Хвост буфера, который может оказаться началом числа или литерала true/false/null, оборванного границей порции
+_PARTIAL_TOKEN_RE = re.compile(r'\s*(?:[-+.\deE]+|[A-Za-z]+)?')
+# Продолжение числа, оставшееся в конце буфера после разобранной части (".", "e", "e-")
+_NUMBER_TAIL_RE = re.compile(r'[-+.\deE]+')
 
-def load_transactions(file_path: str) -> List[Dict[str, Any]]:
+
+def _is_truncated(error: json.JSONDecodeError, buffer: str) -> bool:
+    """
+    Проверяет, что ошибка разбора вызвана концом буфера, а не некорректным JSON.
+
+    Незакрытая строка доходит до конца буфера; неполная escape-последовательность
+    или неполное число и литерал находятся в его последних символах. Ошибки
+    в середине буфера означают поврежденный элемент, и дочитывать файл бесполезно.
+    """
+    tail = buffer[error.pos:]
+    if error.msg.startswith('Unterminated string'):
+        return True
+    if error.msg.startswith('Invalid \\uXXXX escape'):
+        return len(tail) < 6
+    return _PARTIAL_TOKEN_RE.fullmatch(tail) is not None
+
+
+def setup_logging() -> QueueListener:
+    """Настройка логирования для модуля транзакций (общая очередь с записью в файл в фоновом потоке)"""
+    return logging_config.setup_logging("transactions")
+
+
+@timed
+def load_transactions(file_path: str, as_records: bool = False) -> List[Union[Dict[str, Any], Transaction]]:
     """
     Загружает данные о финансовых транзакциях из JSON-файла.
 
     Args:
         file_path (str): Путь до JSON-файла с транзакциями
+        as_records (bool): Вернуть компактные записи Transaction вместо словарей
 
     Returns:
         List[Dict[str, Any]]: Список словарей с данными о транзакциях.
@@ -39,20 +62,20 @@ def load_transactions(file_path: str) -> List[Dict[str, Any]]:
     logger = logging.getLogger(__name__)
 
     try:
-        logger.info(f"Начало загрузки транзакций из файла: {file_path}")
+        logger.info("Начало загрузки транзакций из файла: %s", file_path)
 
         # Проверяем существование файла
         if not os.path.exists(file_path):
-            logger.warning(f"Файл не найден: {file_path}")
+            logger.warning("Файл не найден: %s", file_path)
             return []
 
         # Проверяем, что файл не пустой
         file_size = os.path.getsize(file_path)
         if file_size == 0:
-            logger.warning(f"Файл пустой: {file_path}")
+            logger.warning("Файл пустой: %s", file_path)
             return []
 
-        logger.info(f"Размер файла: {file_size} байт")
+        logger.info("Размер файла: %s байт", file_size)
 
         # Открываем и читаем файл
         with open(file_path, 'r', encoding='utf-8') as file:
@@ -61,40 +84,171 @@ def load_transactions(file_path: str) -> List[Dict[str, Any]]:
         # Проверяем, что данные являются списком
         if isinstance(data, list):
             transactions_count = len(data)
-            logger.info(f"Успешно загружено {transactions_count} транзакций из файла {file_path}")
+            logger.info("Успешно загружено %s транзакций из файла %s", transactions_count, file_path)
 
             # Логируем информацию о первых нескольких транзакциях для отладки
-            if transactions_count > 0:
+            if transactions_count > 0 and logger.isEnabledFor(logging.DEBUG):
                 sample_transactions = min(3, transactions_count)
                 for i in range(sample_transactions):
                     trans = data[i]
                     trans_id = trans.get('id', 'N/A')
                     trans_date = trans.get('date', 'N/A')
                     trans_amount = trans.get('amount', 'N/A')
-                    logger.debug(f"Транзакция {i + 1}: ID={trans_id}, Дата={trans_date}, Сумма={trans_amount}")
+                    logger.debug("Транзакция %s: ID=%s, Дата=%s, Сумма=%s", i + 1, trans_id, trans_date, trans_amount)
 
+            if as_records:
+                return [Transaction.from_dict(trans) for trans in data]
             return data
 
         else:
-            logger.warning(f"Данные в файле {file_path} не являются списком. Тип данных: {type(data)}")
+            logger.warning("Данные в файле %s не являются списком. Тип данных: %s", file_path, type(data))
             return []
 
     except json.JSONDecodeError as e:
-        logger.error(f"Ошибка декодирования JSON в файле {file_path}: {str(e)}")
+        logger.error("Ошибка декодирования JSON в файле %s: %s", file_path, e)
         return []
 
     except FileNotFoundError as e:
-        logger.error(f"Файл не найден после проверки существования: {file_path}. Ошибка: {str(e)}")
+        logger.error("Файл не найден после проверки существования: %s. Ошибка: %s", file_path, e)
         return []
 
     except PermissionError as e:
-        logger.error(f"Отсутствуют права доступа к файлу {file_path}: {str(e)}")
+        logger.error("Отсутствуют права доступа к файлу %s: %s", file_path, e)
         return []
 
     except UnicodeDecodeError as e:
-        logger.error(f"Ошибка кодировки файла {file_path}: {str(e)}")
+        logger.error("Ошибка кодировки файла %s: %s", file_path, e)
         return []
 
     except Exception as e:
-        logger.exception(f"Непредвиденная ошибка при загрузке транзакций из {file_path}: {str(e)}")
+        logger.exception("Непредвиденная ошибка при загрузке транзакций из %s: %s", file_path, e)
         return []
+
+
+def iter_transactions(file_path: str, chunk_size: int = STREAM_CHUNK_SIZE,
+                      as_records: bool = False) -> Iterator[Union[Dict[str, Any], Transaction]]:
+    """
+    Потоково читает транзакции из JSON-файла, выдавая их по одной.
+
+    Верхнеуровневый массив разбирается поэлементно, поэтому в памяти
+    одновременно находится только текущая порция файла и одна транзакция.
+    Обработка ошибок совпадает с load_transactions: для отсутствующего,
+    пустого файла или файла, не содержащего список, ничего не выдается.
+
+    Args:
+        file_path (str): Путь до JSON-файла с транзакциями
+        chunk_size (int): Размер порции чтения в символах
+        as_records (bool): Выдавать компактные записи Transaction вместо словарей
+
+    Yields:
+        Dict[str, Any] | Transaction: Очередная транзакция из файла
+    """
+    logger = logging.getLogger(__name__)
+
+    try:
+        logger.info("Начало потоковой загрузки транзакций из файла: %s", file_path)
+
+        if not os.path.exists(file_path):
+            logger.warning("Файл не найден: %s", file_path)
+            return
+
+        if os.path.getsize(file_path) == 0:
+            logger.warning("Файл пустой: %s", file_path)
+            return
+
+        decoder = json.JSONDecoder()
+        transactions_count = 0
+
+        with open(file_path, 'r', encoding='utf-8') as file:
+            buffer = ''
+            pos = 0
+            eof = False
+
+            def fill() -> bool:
+                """Дочитывает следующую порцию, отбрасывая уже разобранную часть буфера."""
+                nonlocal buffer, pos, eof
+                if eof:
+                    return False
+                chunk = file.read(chunk_size)
+                if not chunk:
+                    eof = True
+                    return False
+                buffer = buffer[pos:] + chunk
+                pos = 0
+                return True
+
+            def skip_whitespace() -> bool:
+                """Пропускает пробельные символы; False, если файл закончился."""
+                nonlocal pos
+                while True:
+                    while pos < len(buffer) and buffer[pos] in _JSON_WHITESPACE:
+                        pos += 1
+                    if pos < len(buffer):
+                        return True
+                    if not fill():
+                        return False
+
+            if not skip_whitespace():
+                logger.warning("Файл пустой: %s", file_path)
+                return
+
+            if buffer[pos] != '[':
+                # Не список: тип значения определяется по первому символу, файл дальше не читается
+                first_char = buffer[pos]
+                logger.warning("Данные в файле %s не являются списком. Тип данных: %s", file_path,
+                               _JSON_TYPE_BY_FIRST_CHAR.get(first_char, repr(first_char)))
+                return
+            pos += 1
+
+            expect_item = True
+            while True:
+                if not skip_whitespace():
+                    raise json.JSONDecodeError("Неожиданный конец файла", buffer, pos)
+
+                # ']' допустим сразу после элемента или в пустом массиве
+                if buffer[pos] == ']' and (not expect_item or transactions_count == 0):
+                    break
+
+                if not expect_item:
+                    if buffer[pos] != ',':
+                        raise json.JSONDecodeError("Ожидалась ',' или ']'", buffer, pos)
+                    pos += 1
+                    expect_item = True
+                    continue
+
+                while True:
+                    try:
+                        item, end = decoder.raw_decode(buffer, pos)
+                    except json.JSONDecodeError as e:
+                        # Элемент разрезан границей порции — дочитываем и пробуем снова;
+                        # синтаксическая ошибка внутри буфера сообщается сразу
+                        if _is_truncated(e, buffer) and fill():
+                            continue
+                        raise
+                    truncated_number = type(item) in (int, float) and _NUMBER_TAIL_RE.fullmatch(buffer, end)
+                    if (end == len(buffer) or truncated_number) and fill():
+                        # Число на границе порции могло быть прочитано не полностью ("-350" вместо "-350.0")
+                        continue
+                    break
+
+                pos = end
+                expect_item = False
+                transactions_count += 1
+                yield Transaction.from_dict(item) if as_records else item
+
+        logger.info("Потоково загружено %s транзакций из файла %s", transactions_count, file_path)
+
+    except json.JSONDecodeError as e:
+        logger.error("Ошибка декодирования JSON в файле %s: %s", file_path, e)
+
+    except FileNotFoundError as e:
+        logger.error("Файл не найден после проверки существования: %s. Ошибка: %s", file_path, e)
+
+    except PermissionError as e:
+        logger.error("Отсутствуют права доступа к файлу %s: %s", file_path, e)
+
+    except UnicodeDecodeError as e:
+        logger.error("Ошибка кодировки файла %s: %s", file_path, e)
+
+    except Exception as e:
+        logger.exception("Непредвиденная ошибка при загрузке транзакций из %s: %s", file_path, e)
@@ -1,5 +1,20 @@
+import os
+
+from src.decorators import memoize
+
+# Максимальное число замаскированных строк карт и счетов в кэше
+MASK_CACHE_SIZE = int(os.getenv('MASK_CACHE_SIZE', 4096))
+
+
+@memoize(maxsize=MASK_CACHE_SIZE)
 def mask_account_card(account_info: str) -> str:
-    """Маскирует номер карты или счета в переданной строке."""
+    """
+    Маскирует номер карты или счета в переданной строке.
+
+    Результат кэшируется по исходной строке: одни и те же карты и счета
+    встречаются в выписке многократно, а маскируются один раз.
+    Статистика попаданий доступна через mask_account_card.cache_stats().
+    """
     parts = account_info.split()
     # Определяем тип - карта или счет
     if "счет" in account_info.lower():
@@ -15,7 +30,10 @@ def mask_account_card(account_info: str) -> str:
 
 
 def get_date(date_str: str) -> str:
-    """Преобразует дату из формата 'YYYY-MM-DDTHH:MM:SS.ssssss' в 'DD.MM.YYYY'."""
+    """
+    Преобразует дату из формата 'YYYY-MM-DDTHH:MM:SS.ssssss' в 'DD.MM.YYYY'.
+    Выводится дата из строки: смещение часового пояса не применяется.
+    """
     date_part = date_str.split("T")[0]
     year, month, day = date_part.split("-")
     return f"{day}.{month}.{year}"
@@ -1,6 +1,7 @@
 import pytest
 import time
-from src.bank_analytics import process_bank_operations
+import random
+from src.bank_analytics import process_bank_operations, compile_categories
 
 
 def test_basic_functionality():
@@ -257,5 +258,52 @@ def test_combined_categories():
     }
 
 
+def test_overlapping_and_nested_categories():
+    """Перекрывающиеся и вложенные категории находятся одновременно."""
+    transactions = [
+        {"description": "Перевод организации"},
+        {"description": "Перевод с карты на карту"},
+        {"description": "Открытие вклада"},
+    ]
+    categories = ["перевод", "пере", "евод", "вод", "карт", "карты на", "вклад", "открытие вклада"]
+
+    result = process_bank_operations(transactions, categories)
+
+    assert result == {
+        "перевод": 2, "пере": 2, "евод": 2, "вод": 2,
+        "карт": 1, "карты на": 1, "вклад": 1, "открытие вклада": 1
+    }
+
+
+def test_matches_naive_substring_search():
+    """Результат совпадает с наивным поиском подстрок на случайных данных."""
+    rng = random.Random(42)
+    alphabet = "абвгаб "
+    categories = ["".join(rng.choice(alphabet) for _ in range(rng.randint(1, 4))) for _ in range(60)]
+    transactions = [{"description": "".join(rng.choice(alphabet) for _ in range(rng.randint(0, 30)))}
+                    for _ in range(300)]
+
+    expected_counts = {}
+    for category in categories:
+        if category:
+            expected_counts[category.lower()] = category
+    expected = {category: 0 for category in categories if category}
+    for operation in transactions:
+        description = operation["description"].lower()
+        for category_lower, original in expected_counts.items():
+            if description and category_lower in description:
+                expected[original] += 1
+
+    assert process_bank_operations(transactions, categories) == expected
+
+
+def test_matcher_is_reused_between_calls():
+    """Автомат для одного набора категорий строится один раз."""
+    categories = ("зарплата", "продукты")
+
+    assert compile_categories(categories) is compile_categories(categories)
+    assert compile_categories(categories).find("зарплата и продукты") == {0, 1}
+
+
 if __name__ == "__main__":
     pytest.main([__file__, "-v"])
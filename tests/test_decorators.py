@@ -1,5 +1,14 @@
+import asyncio
+import gc
+import json
+import threading
+import time
+import weakref
+
 import pytest
-from src.decorators import log
+from src import decorators
+from src.decorators import (LatencyHistogram, drain_logs, dump_timings, flush_logs, get_log_sink, log, memoize,
+                            memoize_stats, timed, timing_stats)
 
 
 def test_log_to_console_success(capsys):
@@ -303,6 +312,367 @@ def test_function_preserves_metadata():
     assert documented_function.__doc__ == "Это документированная функция"
 
 
+def test_buffered_file_flush_on_size(tmp_path):
+    """Тестируем, что при буферизации сообщения записываются при заполнении буфера"""
+
+    test_filename = tmp_path / "test_buffered.log"
+
+    @log(filename=str(test_filename), flush_size=len("tick ok\n") * 3)
+    def tick():
+        return None
+
+    tick()
+    tick()
+    # Буфер еще не заполнен - файл пуст
+    assert test_filename.read_text(encoding='utf-8') == ""
+
+    tick()
+    assert test_filename.read_text(encoding='utf-8') == "tick ok\n" * 3
+
+    tick()
+    flush_logs()
+    assert test_filename.read_text(encoding='utf-8') == "tick ok\n" * 4
+
+
+def test_buffered_file_flush_on_interval(tmp_path):
+    """Тестируем, что буфер записывается фоновым потоком по истечении интервала"""
+
+    test_filename = tmp_path / "test_interval.log"
+
+    @log(filename=str(test_filename), flush_size=10 ** 6, flush_interval=0.05)
+    def tick():
+        return None
+
+    tick()
+    deadline = time.monotonic() + 2
+    while test_filename.read_text(encoding='utf-8') == "" and time.monotonic() < deadline:
+        time.sleep(0.01)
+
+    assert test_filename.read_text(encoding='utf-8') == "tick ok\n"
+
+
+def test_shared_sink_from_threads(tmp_path):
+    """Тестируем, что функции и потоки пишут в один файл через общий буфер без потери строк"""
+
+    test_filename = str(tmp_path / "test_threads.log")
+
+    @log(filename=test_filename, flush_size=4096)
+    def first():
+        return 1
+
+    @log(filename=test_filename)
+    def second():
+        raise ValueError
+
+    def worker():
+        for _ in range(200):
+            first()
+            with pytest.raises(ValueError):
+                second()
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    flush_logs()
+
+    lines = (tmp_path / "test_threads.log").read_text(encoding='utf-8').splitlines()
+    assert get_log_sink(test_filename) is get_log_sink(str(tmp_path / "." / "test_threads.log"))
+    assert lines.count("first ok") == 800
+    assert lines.count("second error: ValueError. Inputs: ()") == 800
+
+
+def test_sink_settings_conflict_warns(tmp_path):
+    """Тестируем, что параметры сброса задаются при открытии файла, а конфликтующие не применяются"""
+
+    test_filename = str(tmp_path / "test_conflict.log")
+    sink = get_log_sink(test_filename, flush_size=4096)
+
+    assert get_log_sink(test_filename) is sink
+    assert get_log_sink(test_filename, flush_size=4096) is sink
+    with pytest.warns(RuntimeWarning, match="flush_size=4096"):
+        get_log_sink(test_filename, flush_size=0, flush_interval=1.0)
+
+    assert sink.flush_size == 4096
+    assert sink.flush_interval == decorators.LOG_FLUSH_INTERVAL
+
+
+@pytest.mark.parametrize("rotate", ["rename", "delete"])
+def test_sink_reopens_rotated_file(tmp_path, rotate):
+    """Тестируем, что после переименования или удаления файла лог пишется в новый файл"""
+
+    test_filename = tmp_path / "test_rotated.log"
+
+    @log(filename=str(test_filename))
+    def tick():
+        return None
+
+    tick()
+    if rotate == "rename":
+        test_filename.rename(tmp_path / "test_rotated.log.1")
+        assert (tmp_path / "test_rotated.log.1").read_text(encoding='utf-8') == "tick ok\n"
+    else:
+        test_filename.unlink()
+
+    tick()
+    assert test_filename.read_text(encoding='utf-8') == "tick ok\n"
+
+
+def test_async_log_success(capsys):
+    """Тестируем, что для корутины логируется результат после await"""
+
+    @log()
+    async def fetch(x):
+        await asyncio.sleep(0)
+        return x * 2
+
+    async def main():
+        result = await fetch(21)
+        await drain_logs()
+        return result
+
+    assert asyncio.run(main()) == 42
+    assert capsys.readouterr().out == "fetch ok\n"
+
+
+def test_async_log_error_to_file(tmp_path):
+    """Тестируем, что исключение корутины логируется в файл и пробрасывается"""
+
+    test_filename = tmp_path / "test_async.log"
+
+    @log(filename=str(test_filename))
+    async def failing(n, flag=True):
+        await asyncio.sleep(0)
+        raise KeyError(n)
+
+    async def main():
+        with pytest.raises(KeyError):
+            await failing(1, flag=False)
+
+    asyncio.run(main())
+
+    # Сообщения, не записанные до завершения цикла событий, дописываются при его закрытии
+    assert test_filename.read_text(encoding='utf-8') == "failing error: KeyError. Inputs: (1,), {'flag': False}\n"
+
+
+def test_async_log_many_coroutines(capsys):
+    """Тестируем, что сообщения параллельных корутин записываются пачками без потерь и повторов"""
+
+    @log()
+    async def work(i):
+        return i
+
+    async def main():
+        results = await asyncio.gather(*(work(i) for i in range(100)))
+        await drain_logs()
+        return results
+
+    assert asyncio.run(main()) == list(range(100))
+    assert capsys.readouterr().out == "work ok\n" * 100
+
+
+def test_async_log_queues_released_after_loop(capsys):
+    """Тестируем, что очередь лога и цикл событий не остаются в памяти после asyncio.run"""
+
+    @log()
+    async def work():
+        return 1
+
+    async def main():
+        await work()
+        return asyncio.get_running_loop()
+
+    loops = [weakref.ref(asyncio.run(main())) for _ in range(5)]
+    gc.collect()
+
+    assert decorators._async_queues == {}
+    assert all(loop() is None for loop in loops)
+    assert capsys.readouterr().out == "work ok\n" * 5
+
+
+def test_timed_collects_stats():
+    """Тестируем, что timed считает вызовы, включая завершившиеся ошибкой"""
+
+    @timed(name="tests.sleepy")
+    def sleepy(fail=False):
+        time.sleep(0.002)
+        if fail:
+            raise ValueError
+
+    sleepy()
+    sleepy()
+    with pytest.raises(ValueError):
+        sleepy(fail=True)
+
+    stats = timing_stats()["tests.sleepy"]
+    assert stats["calls"] == 3
+    assert 2000 <= stats["min_us"] <= stats["p50_us"] <= stats["p99_us"] <= stats["max_us"]
+    assert sleepy.__name__ == "sleepy"
+
+
+def test_timed_without_arguments():
+    """Тестируем форму @timed без скобок и имя по умолчанию"""
+
+    @timed
+    def square(x):
+        return x * x
+
+    assert square(3) == 9
+    assert timing_stats()[f"{__name__}.test_timed_without_arguments.<locals>.square"]["calls"] == 1
+
+
+def test_timed_coroutine():
+    """Тестируем, что для корутины учитывается время до завершения await"""
+
+    @timed(name="tests.async_sleepy")
+    async def sleepy():
+        await asyncio.sleep(0.002)
+        return 1
+
+    assert asyncio.run(sleepy()) == 1
+    stats = timing_stats()["tests.async_sleepy"]
+    assert stats["calls"] == 1
+    assert stats["min_us"] >= 2000
+
+
+def test_latency_histogram_percentiles():
+    """Тестируем, что перцентили гистограммы близки к точным"""
+
+    histogram = LatencyHistogram()
+    values = list(range(1, 100001))
+    for value in values:
+        histogram.record(value * 1000)
+
+    for percent in (50, 95, 99):
+        exact = values[percent * len(values) // 100 - 1] * 1000
+        assert abs(histogram.percentile(percent) - exact) / exact < 1 / LatencyHistogram.SUB_BUCKETS
+    assert histogram.percentile(100) == 100000 * 1000
+
+
+def test_dump_timings(tmp_path):
+    """Тестируем сохранение статистики в JSON"""
+
+    @timed(name="tests.dumped")
+    def noop():
+        return None
+
+    noop()
+    path = tmp_path / "timings.json"
+    dump_timings(str(path))
+
+    assert json.loads(path.read_text(encoding="utf-8"))["tests.dumped"]["calls"] == 1
+
+
+def test_memoize_hits_and_lru_eviction():
+    """Тестируем кэширование результатов и вытеснение давно не использованных записей"""
+
+    calls = []
+
+    @memoize(maxsize=2)
+    def square(x):
+        calls.append(x)
+        return x * x
+
+    assert [square(2), square(3), square(2)] == [4, 9, 4]
+    square(4)  # вытесняет 3 - к нему обращались дольше всего
+    square(2)
+    square(3)
+
+    assert calls == [2, 3, 4, 3]
+    stats = square.cache_stats()
+    assert (stats["hits"], stats["misses"], stats["evictions"], stats["size"]) == (2, 4, 2, 2)
+    assert f"{__name__}.test_memoize_hits_and_lru_eviction.<locals>.square" in memoize_stats()
+
+
+def test_memoize_ttl():
+    """Тестируем, что устаревшая запись вычисляется заново"""
+
+    calls = []
+
+    @memoize(ttl=0.01)
+    def now(x):
+        calls.append(x)
+        return len(calls)
+
+    assert now(1) == now(1) == 1
+    time.sleep(0.02)
+    assert now(1) == 2
+    assert now.cache_stats()["expirations"] == 1
+
+
+def test_memoize_custom_key_for_dicts():
+    """Тестируем кэширование функции от словаря с пользовательским ключом"""
+
+    calls = []
+
+    @memoize(key=lambda transaction: transaction["id"])
+    def describe(transaction):
+        calls.append(transaction["id"])
+        return transaction["description"].upper()
+
+    assert describe({"id": 1, "description": "перевод"}) == "ПЕРЕВОД"
+    assert describe({"id": 1, "description": "перевод"}) == "ПЕРЕВОД"
+    assert calls == [1]
+
+
+def test_memoize_kwargs_order_and_clear():
+    """Тестируем, что порядок именованных аргументов не влияет на ключ"""
+
+    @memoize()
+    def combine(a, b=0, c=0):
+        return a + b + c
+
+    assert combine(1, b=2, c=3) == combine(1, c=3, b=2) == 6
+    assert combine.cache_stats()["hits"] == 1
+    combine.cache_clear()
+    assert combine.cache_stats()["size"] == 0
+
+
+def test_memoize_max_bytes():
+    """Тестируем ограничение суммарного размера значений"""
+
+    @memoize(maxsize=None, max_bytes=3 * 1100)
+    def payload(n):
+        return "x" * 1000 + str(n)
+
+    for n in range(10):
+        payload(n)
+
+    stats = payload.cache_stats()
+    assert stats["bytes"] <= 3 * 1100
+    assert stats["size"] == 3
+    assert stats["evictions"] == 7
+
+
+def test_memoize_thread_safety():
+    """Тестируем одновременные вызовы из нескольких потоков"""
+
+    @memoize(maxsize=16)
+    def double(x):
+        return x * 2
+
+    errors = []
+
+    def worker():
+        try:
+            for i in range(1000):
+                assert double(i % 32) == (i % 32) * 2
+        except AssertionError as e:
+            errors.append(e)
+
+    threads = [threading.Thread(target=worker) for _ in range(4)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+
+    stats = double.cache_stats()
+    assert errors == []
+    assert stats["hits"] + stats["misses"] == 4000
+    assert stats["size"] <= 16
+
+
 if __name__ == "__main__":
     # Запуск тестов напрямую через pytest
     pytest.main([__file__, "-v"])
@@ -1,23 +1,41 @@
+import asyncio
+import importlib
+import json
+import threading
+import time
 import unittest
 import sys
 import os
+import socket
+import requests
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
 from unittest.mock import patch, MagicMock
 
+from src.rate_store import RateStore
+
 # Добавляем корневую директорию проекта в PYTHONPATH
 current_dir = os.path.dirname(os.path.abspath(__file__))  # tests/
 project_root = os.path.dirname(current_dir)  # Chubarov_ILya/
 src_path = os.path.join(project_root, 'src')
 sys.path.insert(0, src_path)
 
-from external_api import get_transaction_amount_in_rub, convert_currency
+external_api = importlib.import_module('external_api')
+from external_api import (RATE_CACHE, AsyncSingleFlight, ExchangeRateClient, RateCache, SingleFlight,
+                          async_convert_transactions, async_get_exchange_rate, async_get_transaction_amount_in_rub,
+                          convert_currency, convert_transactions_to_rub, cross_rate, get_exchange_rate,
+                          get_transaction_amount_in_rub, set_rate_store)
 
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
 
+# Таблица курсов к EUR: USD/RUB = 80, PEN/RUB = 25, TZS/RUB = 0.04
+RATE_TABLE = {"EUR": 1.0, "RUB": 100.0, "USD": 1.25, "PEN": 4.0, "TZS": 2500.0}
+
+
 class TestConvertCurrency(unittest.TestCase):
 
-    @patch('external_api.requests.get')
+    @patch('external_api.requests.Session.get')
     def test_convert_currency_success(self, mock_get):
         """Тест успешной конвертации валюты"""
         # Мокаем ответ API
@@ -34,7 +52,7 @@ class TestConvertCurrency(unittest.TestCase):
         self.assertEqual(result, 7500.50)
         mock_get.assert_called_once()
 
-    @patch('external_api.requests.get')
+    @patch('external_api.requests.Session.get')
     def test_convert_currency_api_error(self, mock_get):
         """Тест когда API возвращает ошибку"""
         mock_response = MagicMock()
@@ -52,6 +70,10 @@ class TestConvertCurrency(unittest.TestCase):
 
 class TestGetTransactionAmountInRub(unittest.TestCase):
 
+    def setUp(self):
+        # Курсы, закэшированные другими тестами, не должны влиять на моки
+        RATE_CACHE.clear()
+
     def test_rub_transaction(self):
         """Тест транзакции в рублях"""
         transaction = {"amount": 1000, "currency": "RUB"}
@@ -64,42 +86,42 @@ class TestGetTransactionAmountInRub(unittest.TestCase):
         result = get_transaction_amount_in_rub(transaction)
         self.assertEqual(result, 1500.75)
 
-    @patch('external_api.convert_currency')
-    def test_usd_transaction(self, mock_convert):
+    @patch('external_api.fetch_rate_table')
+    def test_usd_transaction(self, mock_table):
         """Тест транзакции в USD"""
-        # ЗАМОКАНО: Фиксированное значение вместо реального API-вызова
-        mock_convert.return_value = 7500.50
+        # ЗАМОКАНО: Фиксированная таблица курсов вместо реального API-вызова
+        mock_table.return_value = dict(RATE_TABLE)
         transaction = {"amount": 100, "currency": "USD"}
 
         result = get_transaction_amount_in_rub(transaction)
 
-        self.assertEqual(result, 7500.50)
-        mock_convert.assert_called_once_with(100, "USD", "RUB")
+        self.assertAlmostEqual(result, 8000.0)
+        # API запрашивает таблицу курсов к базовой валюте, курс пары вычисляется локально
+        mock_table.assert_called_once_with("EUR", None)
 
-    @patch('external_api.convert_currency')
-    def test_eur_transaction(self, mock_convert):
+    @patch('external_api.fetch_rate_table')
+    def test_eur_transaction(self, mock_table):
         """Тест транзакции в EUR"""
-        # ЗАМОКАНО: Фиксированное значение вместо реального API-вызова
-        mock_convert.return_value = 8500.25
+        # ЗАМОКАНО: Фиксированная таблица курсов вместо реального API-вызова
+        mock_table.return_value = dict(RATE_TABLE)
         transaction = {"amount": 100, "currency": "EUR"}
 
         result = get_transaction_amount_in_rub(transaction)
 
-        self.assertEqual(result, 8500.25)
-        mock_convert.assert_called_once_with(100, "EUR", "RUB")
+        self.assertAlmostEqual(result, 10000.0)
+        mock_table.assert_called_once_with("EUR", None)
 
-    @patch('external_api.convert_currency')
-    def test_currency_case_insensitive(self, mock_convert):
+    @patch('external_api.fetch_rate_table')
+    def test_currency_case_insensitive(self, mock_table):
         """Тест что валюта обрабатывается case-insensitive"""
-        # ЗАМОКАНО: Фиксированное значение вместо реального API-вызова
-        mock_convert.return_value = 7500.50
+        # ЗАМОКАНО: Фиксированная таблица курсов вместо реального API-вызова
+        mock_table.return_value = dict(RATE_TABLE)
         transaction = {"amount": 100, "currency": "usd"}  # lowercase
 
         result = get_transaction_amount_in_rub(transaction)
 
-        self.assertEqual(result, 7500.50)
         # Обратите внимание: функция должна конвертировать "usd" в "USD"
-        mock_convert.assert_called_once_with(100, "USD", "RUB")
+        self.assertAlmostEqual(result, 8000.0)
 
     def test_no_currency_specified(self):
         """Тест когда валюта не указана (по умолчанию RUB)"""
@@ -125,11 +147,11 @@ class TestGetTransactionAmountInRub(unittest.TestCase):
         result = get_transaction_amount_in_rub(transaction)
         self.assertEqual(result, 0.0)
 
-    @patch('external_api.convert_currency')
-    def test_conversion_error(self, mock_convert):
+    @patch('external_api.fetch_rate_table')
+    def test_conversion_error(self, mock_table):
         """Тест когда конвертация валюты завершается ошибкой"""
         # ЗАМОКАНО: Имитируем исключение от API
-        mock_convert.side_effect = Exception("API unavailable")
+        mock_table.side_effect = Exception("API unavailable")
 
         transaction = {"amount": 100, "currency": "USD"}
 
@@ -141,15 +163,476 @@ class TestGetTransactionAmountInRub(unittest.TestCase):
         # Или, если функция оборачивает исключение:
         # self.assertIn("Failed to convert", str(context.exception))
 
-    def test_unsupported_currency(self):
-        """Тест неподдерживаемой валюты"""
-        transaction = {"amount": 100, "currency": "GBP"}
+    @patch('external_api.fetch_rate_table')
+    def test_unsupported_currency(self, mock_table):
+        """Тест валюты, которой нет в таблице курсов"""
+        mock_table.return_value = dict(RATE_TABLE)
+        transaction = {"amount": 100, "currency": "XYZ"}
 
         with self.assertRaises(ValueError) as context:
             get_transaction_amount_in_rub(transaction)
 
         self.assertIn("Unsupported currency", str(context.exception))
 
+    @patch('external_api.fetch_rate_table')
+    def test_any_currency_in_table(self, mock_table):
+        """Любая валюта из таблицы курсов конвертируется через базовую валюту"""
+        mock_table.return_value = dict(RATE_TABLE)
+
+        self.assertAlmostEqual(get_transaction_amount_in_rub({"amount": 10, "currency": "PEN"}), 250.0)
+        self.assertAlmostEqual(get_transaction_amount_in_rub({"amount": 2500, "currency": "TZS"}), 100.0)
+        mock_table.assert_called_once()
+
+
+class TestCrossRate(unittest.TestCase):
+
+    def test_triangulation(self):
+        """Курс пары вычисляется через базовую валюту"""
+        self.assertAlmostEqual(cross_rate(RATE_TABLE, "USD", "RUB"), 80.0)
+        self.assertAlmostEqual(cross_rate(RATE_TABLE, "RUB", "USD"), 0.0125)
+        self.assertAlmostEqual(cross_rate(RATE_TABLE, "PEN", "USD"), 0.3125)
+        self.assertEqual(cross_rate(RATE_TABLE, "EUR", "EUR"), 1.0)
+
+    def test_unknown_currency(self):
+        """Валюты нет в таблице"""
+        with self.assertRaises(ValueError):
+            cross_rate(RATE_TABLE, "XYZ", "RUB")
+
+
+class TestRateCache(unittest.TestCase):
+
+    def setUp(self):
+        RATE_CACHE.clear()
+
+    @patch('external_api.fetch_rate_table')
+    def test_batch_uses_single_request(self, mock_table):
+        """Пакет транзакций в разных валютах конвертируется одним запросом таблицы курсов"""
+        mock_table.return_value = dict(RATE_TABLE)
+        transactions = [{"amount": amount, "currency": currency}
+                        for amount in range(1, 51) for currency in ("USD", "PEN")]
+
+        results = [get_transaction_amount_in_rub(transaction) for transaction in transactions]
+
+        self.assertEqual(len(results), 100)
+        mock_table.assert_called_once_with("EUR", None)
+
+    @patch('external_api.fetch_rate_table')
+    def test_rate_bucketed_by_day(self, mock_table):
+        """Таблица кэшируется по дню операции, время внутри дня не учитывается"""
+        mock_table.side_effect = [{"EUR": 1.0, "RUB": 90.0}, {"EUR": 1.0, "RUB": 91.0}]
+
+        first = get_transaction_amount_in_rub({"amount": 1, "currency": "EUR", "date": "2019-08-26T10:50:58.294041"})
+        same_day = get_transaction_amount_in_rub({"amount": 2, "currency": "EUR", "date": "2019-08-26T23:00:00"})
+        next_day = get_transaction_amount_in_rub({"amount": 1, "currency": "EUR", "date": "2019-08-27T00:00:00"})
+
+        self.assertEqual((first, same_day, next_day), (90.0, 180.0, 91.0))
+        self.assertEqual(mock_table.call_count, 2)
+        mock_table.assert_any_call("EUR", "2019-08-26")
+
+    @patch('external_api.fetch_rate_table')
+    def test_expired_rate_is_refetched(self, mock_table):
+        """Устаревший курс запрашивается заново"""
+        mock_table.side_effect = [{"EUR": 1.0, "RUB": 90.0}, {"EUR": 1.0, "RUB": 91.0}]
+        cache = RateCache(ttl=0)
+
+        self.assertEqual(get_exchange_rate("EUR", cache=cache), 90.0)
+        self.assertEqual(get_exchange_rate("EUR", cache=cache), 91.0)
+
+    def test_eviction_by_size(self):
+        """При превышении размера вытесняется давно не использованный курс"""
+        cache = RateCache(maxsize=2, ttl=60)
+        cache.set("USD", 90.0)
+        cache.set("EUR", 100.0)
+        cache.get("USD")
+        cache.set("CNY", 12.0)
+
+        self.assertEqual(len(cache), 2)
+        self.assertIsNone(cache.get("EUR"))
+        self.assertEqual(cache.get("USD"), 90.0)
+
+
+class TestConvertTransactionsToRub(unittest.TestCase):
+
+    def setUp(self):
+        RATE_CACHE.clear()
+
+    @patch('external_api.requests.Session.get')
+    def test_single_request_for_batch(self, mock_get):
+        """Таблица курсов пакета запрашивается одним запросом, суммы возвращаются в исходном порядке"""
+        mock_response = MagicMock()
+        mock_response.json.return_value = {"success": True, "base": "EUR", "rates": {"RUB": 100.0, "USD": 1.25}}
+        mock_get.return_value = mock_response
+        transactions = [
+            {"amount": 10, "currency": "USD"},
+            {"amount": "100.5", "currency": "RUB"},
+            {"amount": 2, "currency": "eur"},
+            {"amount": 1, "currency": "USD"},
+        ]
+
+        amounts, errors = convert_transactions_to_rub(transactions)
+
+        self.assertEqual(errors, {})
+        for actual, expected in zip(amounts, [800.0, 100.5, 200.0, 80.0]):
+            self.assertAlmostEqual(actual, expected)
+        mock_get.assert_called_once()
+        self.assertTrue(mock_get.call_args.args[0].endswith("/latest"))
+        self.assertEqual(mock_get.call_args.kwargs["params"], {"base": "EUR"})
+
+    @patch('external_api.requests.Session.get')
+    def test_errors_reported_per_transaction(self, mock_get):
+        """Ошибки отдельных транзакций не прерывают обработку пакета"""
+        mock_get.side_effect = requests.exceptions.ConnectionError("API unavailable")
+        transactions = [
+            {"amount": 10, "currency": "RUB"},
+            {"amount": 10, "currency": "USD"},
+        ]
+
+        amounts, errors = convert_transactions_to_rub(transactions)
+
+        self.assertEqual(amounts, [10.0, None])
+        self.assertIn("API unavailable", errors[1])
+
+    @patch('external_api.fetch_rate_table')
+    def test_unsupported_reported_per_transaction(self, mock_table):
+        """Валюта, которой нет в таблице, отмечается ошибкой только у своей транзакции"""
+        mock_table.return_value = dict(RATE_TABLE)
+
+        amounts, errors = convert_transactions_to_rub([{"amount": 1, "currency": "XYZ"},
+                                                       {"amount": 1, "currency": "USD"}])
+
+        self.assertEqual(amounts, [None, 80.0])
+        self.assertIn("Unsupported currency", errors[0])
+
+    @patch('external_api.requests.Session.get')
+    def test_cached_rates_not_requested(self, mock_get):
+        """Курсы из кэша повторно не запрашиваются"""
+        RATE_CACHE.set(("USD", "RUB", ""), 90.0)
+
+        amounts, errors = convert_transactions_to_rub([{"amount": 2, "currency": "USD"}])
+
+        self.assertEqual((amounts, errors), ([180.0], {}))
+        mock_get.assert_not_called()
+
+
+class TestRateStoreIntegration(unittest.TestCase):
+
+    def setUp(self):
+        RATE_CACHE.clear()
+        self.store = RateStore()
+        set_rate_store(self.store)
+
+    def tearDown(self):
+        set_rate_store(None)
+        self.store.close()
+
+    @patch('external_api.fetch_rate_table')
+    def test_preloaded_rates_need_no_requests(self, mock_table):
+        """Курсы из хранилища используются без обращений к API"""
+        self.store.set_rates([("2024-01-15", "USD", "RUB", 90.0), ("2024-01-16", "EUR", "RUB", 100.0),
+                              ("2024-01-16", "EUR", "PEN", 4.0)])
+        transactions = [
+            {"amount": 2, "currency": "USD", "date": "2024-01-15T12:00:00"},
+            {"amount": 3, "currency": "EUR", "date": "2024-01-16T08:00:00"},
+            {"amount": 4, "currency": "PEN", "date": "2024-01-16T09:00:00"},
+        ]
+
+        self.assertEqual([get_transaction_amount_in_rub(t) for t in transactions], [180.0, 300.0, 100.0])
+        self.assertEqual(convert_transactions_to_rub(transactions), ([180.0, 300.0, 100.0], {}))
+        mock_table.assert_not_called()
+
+    @patch('external_api.fetch_rate_table')
+    def test_fetched_table_written_back(self, mock_table):
+        """Полученная из API таблица курсов на дату сохраняется в хранилище"""
+        mock_table.return_value = dict(RATE_TABLE)
+
+        get_transaction_amount_in_rub({"amount": 1, "currency": "USD", "date": "2024-02-01T00:00:00"})
+
+        self.assertEqual(self.store.get_rates("EUR", "2024-02-01"), RATE_TABLE)
+
+    @patch('external_api.fetch_rate_table')
+    def test_partial_preload_falls_back_to_api(self, mock_table):
+        """Если в хранилище только часть курсов на день, недостающая валюта берется из таблицы API"""
+        mock_table.return_value = dict(RATE_TABLE)
+        self.store.set_rates([("2024-01-16", "EUR", "RUB", 100.0)])
+
+        self.assertEqual(get_transaction_amount_in_rub({"amount": 3, "currency": "EUR", "date": "2024-01-16"}), 300.0)
+        mock_table.assert_not_called()
+
+        self.assertEqual(get_transaction_amount_in_rub({"amount": 2, "currency": "USD", "date": "2024-01-16"}), 160.0)
+        self.assertEqual(get_transaction_amount_in_rub({"amount": 4, "currency": "PEN", "date": "2024-01-16"}), 100.0)
+        with self.assertRaises(ValueError):
+            get_transaction_amount_in_rub({"amount": 1, "currency": "XXX", "date": "2024-01-16"})
+
+        mock_table.assert_called_once_with("EUR", "2024-01-16")
+        self.assertEqual(self.store.get_rates("EUR", "2024-01-16"), RATE_TABLE)
+
+    @patch('external_api.fetch_rate_table')
+    def test_current_rate_not_stored(self, mock_table):
+        """Текущие курсы (операция без даты) в хранилище не записываются"""
+        mock_table.return_value = dict(RATE_TABLE)
+
+        get_transaction_amount_in_rub({"amount": 1, "currency": "USD"})
+
+        self.assertEqual(len(self.store), 0)
+
+
+class _StubRatesHandler(BaseHTTPRequestHandler):
+    """Заглушка API курсов с поддержкой keep-alive, считающая открытые соединения"""
+    protocol_version = "HTTP/1.1"
+    connections = 0
+
+    def setup(self):
+        super().setup()
+        # Без задержки Нейгла ответ не ждет отложенного ACK клиента
+        self.connection.setsockopt(socket.IPPROTO_TCP, socket.TCP_NODELAY, 1)
+        # Обработчик создается на каждое TCP-соединение
+        type(self).connections += 1
+
+    def do_GET(self):
+        body = json.dumps({"success": True, "result": 90.0, "rates": {"RUB": 90.0, "USD": 1.0}}).encode("utf-8")
+        self.send_response(200)
+        self.send_header("Content-Type", "application/json")
+        self.send_header("Content-Length", str(len(body)))
+        self.end_headers()
+        self.wfile.write(body)
+
+    def log_message(self, format, *args):
+        pass
+
+
+class TestExchangeRateClient(unittest.TestCase):
+
+    CALLS = 20
+
+    def setUp(self):
+        _StubRatesHandler.connections = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubRatesHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.url = f"http://127.0.0.1:{self.server.server_address[1]}/convert"
+
+    def tearDown(self):
+        self.server.shutdown()
+        self.server.server_close()
+
+    def _convert_many(self, client_factory):
+        """Выполняет CALLS конвертаций"""
+        for _ in range(self.CALLS):
+            client = client_factory()
+            with patch.object(external_api, "_client", client), patch.object(external_api, "BASE_URL", self.url):
+                self.assertEqual(convert_currency(1, "USD", "RUB"), 90.0)
+
+    def test_pooled_client_reuses_connection(self):
+        """Общий клиент переиспользует одно соединение, новый клиент на каждый вызов открывает новое"""
+        self._convert_many(ExchangeRateClient)
+        connections_before = _StubRatesHandler.connections
+
+        _StubRatesHandler.connections = 0
+        client = ExchangeRateClient(pool_size=2)
+        self._convert_many(lambda: client)
+        client.close()
+
+        self.assertEqual(connections_before, self.CALLS)
+        self.assertEqual(_StubRatesHandler.connections, 1)
+
+    def test_pooled_client_shared_between_threads(self):
+        """Потоки разделяют пул и не открывают соединений больше его размера"""
+        client = ExchangeRateClient(pool_size=2)
+        errors = []
+
+        def worker():
+            try:
+                for _ in range(10):
+                    self.assertEqual(client.get(self.url).json()["result"], 90.0)
+            except Exception as e:
+                errors.append(e)
+
+        threads = [threading.Thread(target=worker) for _ in range(4)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        client.close()
+
+        self.assertEqual(errors, [])
+        self.assertLessEqual(_StubRatesHandler.connections, 2)
+
+
+class TestAsyncConversion(unittest.IsolatedAsyncioTestCase):
+
+    def setUp(self):
+        RATE_CACHE.clear()
+        _StubRatesHandler.connections = 0
+        self.server = ThreadingHTTPServer(("127.0.0.1", 0), _StubRatesHandler)
+        self.server.daemon_threads = True
+        threading.Thread(target=self.server.serve_forever, daemon=True).start()
+        self.client = ExchangeRateClient(pool_size=4)
+        url = f"http://127.0.0.1:{self.server.server_address[1]}/convert"
+        self.patches = [patch.object(external_api, "_client", self.client),
+                        patch.object(external_api, "BASE_URL", url),
+                        patch.object(external_api, "RATES_URL", url.rsplit("/", 1)[0])]
+        for p in self.patches:
+            p.start()
+
+    def tearDown(self):
+        for p in self.patches:
+            p.stop()
+        self.client.close()
+        self.server.shutdown()
+        self.server.server_close()
+
+    async def test_against_fake_server(self):
+        """Пакет транзакций конвертируется параллельно через локальный сервер курсов"""
+        transactions = [{"amount": i, "currency": "USD", "date": f"2024-01-{i:02d}"} for i in range(1, 21)]
+        transactions.append({"amount": "5", "currency": "RUB"})
+
+        results = await async_convert_transactions(transactions, concurrency=4)
+
+        self.assertEqual(results, [i * 90.0 for i in range(1, 21)] + [5.0])
+        self.assertLessEqual(_StubRatesHandler.connections, 4)
+
+    async def test_unsupported_currency(self):
+        """Для неподдерживаемой валюты выбрасывается ValueError, как в синхронной версии"""
+        with self.assertRaises(ValueError) as context:
+            await async_get_transaction_amount_in_rub({"amount": 100, "currency": "GBP"})
+        self.assertIn("Unsupported currency", str(context.exception))
+
+        results = await async_convert_transactions([{"amount": 1, "currency": "GBP"}, {"amount": 1}],
+                                                   return_exceptions=True)
+        self.assertIsInstance(results[0], ValueError)
+        self.assertEqual(results[1], 1.0)
+
+    async def test_conversion_error(self):
+        """Ошибка API оборачивается так же, как в синхронной версии"""
+        with patch.object(external_api, "fetch_rate_table", side_effect=Exception("API unavailable")):
+            with self.assertRaises(Exception) as context:
+                await async_get_transaction_amount_in_rub({"amount": 100, "currency": "USD"})
+        self.assertIn("Failed to convert", str(context.exception))
+        self.assertIn("API unavailable", str(context.exception))
+
+    async def test_concurrency_limit(self):
+        """Одновременно выполняется не больше concurrency конвертаций"""
+        active = 0
+        peak = 0
+        lock = threading.Lock()
+
+        def slow_convert(*args):
+            nonlocal active, peak
+            with lock:
+                active += 1
+                peak = max(peak, active)
+            time.sleep(0.02)
+            with lock:
+                active -= 1
+            return {"EUR": 1.0, "RUB": 90.0}
+
+        transactions = [{"amount": 1, "currency": "EUR", "date": f"2024-02-{i:02d}"} for i in range(1, 13)]
+        with patch.object(external_api, "fetch_rate_table", side_effect=slow_convert):
+            results = await async_convert_transactions(transactions, concurrency=3)
+
+        self.assertEqual(results, [90.0] * 12)
+        self.assertLessEqual(peak, 3)
+        self.assertGreater(peak, 1)
+
+    async def test_rate_limit(self):
+        """Запросы к API распределяются во времени согласно rate_limit"""
+        transactions = [{"amount": 1, "currency": "USD", "date": f"2024-03-{i:02d}"} for i in range(1, 6)]
+
+        started = time.perf_counter()
+        await async_convert_transactions(transactions, rate_limit=50)
+
+        # Пять запросов при 50 запросах в секунду занимают не меньше четырех интервалов по 20 мс
+        self.assertGreaterEqual(time.perf_counter() - started, 0.075)
+
+
+class TestSingleFlight(unittest.TestCase):
+
+    def setUp(self):
+        RATE_CACHE.clear()
+
+    def _run_threads(self, count, target):
+        """Запускает count потоков одновременно и собирает их результаты или исключения"""
+        barrier = threading.Barrier(count)
+        results = [None] * count
+
+        def worker(i):
+            barrier.wait()
+            try:
+                results[i] = target()
+            except Exception as e:
+                results[i] = e
+
+        threads = [threading.Thread(target=worker, args=(i,)) for i in range(count)]
+        for thread in threads:
+            thread.start()
+        for thread in threads:
+            thread.join()
+        return results
+
+    def test_concurrent_threads_share_request(self):
+        """Одновременные запросы одного курса из потоков выполняют один запрос к API"""
+        calls = []
+
+        def slow_table(*args):
+            calls.append(args)
+            time.sleep(0.1)
+            return {"EUR": 1.0, "RUB": 100.0, "USD": 1.25}
+
+        with patch.object(external_api, "fetch_rate_table", side_effect=slow_table):
+            results = self._run_threads(8, lambda: get_exchange_rate("USD", "RUB"))
+
+        self.assertEqual(results, [80.0] * 8)
+        self.assertEqual(calls, [("EUR", None)])
+
+    def test_error_shared_by_waiters(self):
+        """Ошибка запроса получают все ожидающие потоки, следующий вызов повторяет запрос"""
+        flight = SingleFlight()
+        calls = []
+
+        def failing():
+            calls.append(1)
+            time.sleep(0.1)
+            raise Exception("API unavailable")
+
+        results = self._run_threads(4, lambda: flight.do("USD", failing))
+
+        self.assertEqual(len(calls), 1)
+        self.assertTrue(all(isinstance(result, Exception) for result in results))
+        self.assertEqual(flight.do("USD", lambda: 90.0), 90.0)
+
+    def test_concurrent_coroutines_share_request(self):
+        """Одновременные запросы одного курса из корутин выполняют один запрос к API"""
+        calls = []
+
+        def slow_table(*args):
+            calls.append(args)
+            time.sleep(0.05)
+            return {"EUR": 1.0, "RUB": 90.0}
+
+        async def main():
+            return await asyncio.gather(*(async_get_exchange_rate("EUR", "RUB", "2024-01-01") for _ in range(10)))
+
+        with patch.object(external_api, "fetch_rate_table", side_effect=slow_table):
+            results = asyncio.run(main())
+
+        self.assertEqual(results, [90.0] * 10)
+        self.assertEqual(calls, [("EUR", "2024-01-01")])
+
+    def test_event_loops_in_threads_do_not_share_tasks(self):
+        """Циклы событий в разных потоках не ожидают задачи друг друга"""
+        flight = AsyncSingleFlight()
+
+        async def slow():
+            await asyncio.sleep(0.05)
+            return 90.0
+
+        async def main():
+            return await flight.do("EUR", slow)
+
+        results = self._run_threads(4, lambda: asyncio.run(main()))
+
+        self.assertEqual(results, [90.0] * 4)
+
 
 if __name__ == '__main__':
     unittest.main()
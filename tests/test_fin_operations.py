@@ -1,6 +1,11 @@
 from unittest.mock import mock_open, patch, MagicMock
 from src.fin_operations import reading_transactions_csv
 from src.fin_operations import reading_transactions_excel
+from src.fin_operations import operations_from_frame, reading_operations_excel
+from src.fin_operations import parse_csv_parallel, csv_row_to_operation, _csv_byte_ranges
+from src.fin_operations import csv_row_to_record
+import pandas as pd
+import pytest
 
 
 class TestCSVOperations:
@@ -161,3 +166,141 @@ class TestExcelOperations:
         # Assert
         assert len(result) == 1
         assert result[0]['description'] == 'Зарплата'
+
+
+class TestExcelOperationsFormat:
+    """Тесты для преобразования Excel в формат операций"""
+
+    def test_operations_from_frame_structure(self):
+        """Тест построения вложенной структуры operationAmount/currency"""
+        # Arrange
+        df = pd.DataFrame({
+            'id': [650703.0, 3598919.0],
+            'state': ['EXECUTED', 'CANCELED'],
+            'date': ['2023-09-05T11:30:32Z', '2020-12-06T23:00:58Z'],
+            'amount': [16210, 29740.5],
+            'currency_code': ['PEN', 'COP'],
+            'from': ['Счет 58803664561298323391', None],
+            'to': ['Счет 39745660563456619397', 'Visa 6804119550473710'],
+            'description': ['Перевод организации', 'Перевод с карты на карту'],
+        })
+
+        # Act
+        result = operations_from_frame(df)
+
+        # Assert
+        assert result[0] == {
+            'id': 650703,
+            'state': 'EXECUTED',
+            'date': '2023-09-05T11:30:32Z',
+            'description': 'Перевод организации',
+            'from': 'Счет 58803664561298323391',
+            'to': 'Счет 39745660563456619397',
+            'operationAmount': {
+                'amount': 16210.0,
+                'currency': {'name': 'RUB', 'code': 'PEN'}
+            }
+        }
+        assert type(result[0]['id']) is int
+        assert result[1]['from'] == 'nan'
+        assert result[1]['operationAmount']['amount'] == 29740.5
+
+    def test_operations_from_frame_missing_columns(self):
+        """Тест значений по умолчанию для отсутствующих колонок"""
+        result = operations_from_frame(pd.DataFrame({'state': ['EXECUTED']}))
+
+        assert result == [{
+            'id': 0, 'state': 'EXECUTED', 'date': '', 'description': '', 'from': '', 'to': '',
+            'operationAmount': {'amount': 0.0, 'currency': {'name': 'RUB', 'code': 'RUB'}}
+        }]
+
+    def test_operations_from_frame_invalid_id(self):
+        """Тест что пропущенный id приводит к ошибке, как и при построчном разборе"""
+        with pytest.raises(ValueError):
+            operations_from_frame(pd.DataFrame({'id': [1.0, float('nan')]}))
+
+    @patch('pandas.read_excel')
+    def test_reading_operations_excel_uses_shared_reader(self, mock_read_excel):
+        """Тест что загрузчик операций читает файл тем же путем, что и reading_transactions_excel"""
+        mock_read_excel.return_value = pd.DataFrame({'id': [1], 'amount': [10.0]})
+
+        result = reading_operations_excel('test.xlsx')
+
+        mock_read_excel.assert_called_once_with('test.xlsx')
+        assert result[0]['id'] == 1
+        assert result[0]['operationAmount']['amount'] == 10.0
+
+    def test_operations_from_frame_records(self):
+        """Тест что записи Transaction совпадают со словарным форматом"""
+        df = pd.DataFrame({'id': [1.0, 2.0], 'state': ['EXECUTED', 'EXECUTED'], 'amount': [1.5, 2.0]})
+
+        records = operations_from_frame(df, as_records=True)
+
+        assert [record.to_dict() for record in records] == operations_from_frame(df)
+        assert records[0].state is records[1].state
+
+
+class TestParallelCSV:
+    """Тесты для параллельного разбора CSV файлов"""
+
+    @pytest.fixture
+    def csv_file(self, tmp_path):
+        """CSV-файл с операциями в формате data/transactions.csv"""
+        lines = ["id;state;date;amount;currency_name;currency_code;from;to;description"]
+        for i in range(200):
+            lines.append(f"{i};EXECUTED;2023-09-05T11:30:32Z;{i * 10};Sol;PEN;"
+                         f"Счет 5880366456129832{i:04d};Visa 680411955047{i:04d};Перевод организации")
+        file_path = tmp_path / "transactions.csv"
+        file_path.write_text("\n".join(lines) + "\n", encoding='utf-8')
+        return str(file_path)
+
+    def test_parallel_matches_sequential(self, csv_file):
+        """Тест что параллельный разбор дает те же записи в том же порядке"""
+        # Arrange
+        expected = reading_transactions_csv(csv_file)
+
+        # Act
+        result = reading_transactions_csv(csv_file, workers=2)
+
+        # Assert
+        assert len(expected) == 200
+        assert result == expected
+
+    def test_parallel_with_row_converter(self, csv_file):
+        """Тест преобразования строк в процессах-обработчиках"""
+        result = parse_csv_parallel(csv_file, delimiter=';', workers=2, row_converter=csv_row_to_operation)
+
+        assert [op['id'] for op in result] == list(range(200))
+        assert result[5]['operationAmount']['amount'] == 50.0
+
+    @pytest.mark.parametrize("parts", [1, 3, 7, 1000])
+    def test_byte_ranges_split_on_line_boundaries(self, csv_file, parts):
+        """Тест что диапазоны покрывают файл целиком и начинаются с начала строки"""
+        with open(csv_file, 'rb') as file:
+            content = file.read()
+        data_start = content.index(b"\n") + 1
+
+        ranges = _csv_byte_ranges(csv_file, data_start, parts)
+
+        assert ranges[0][0] == data_start
+        assert ranges[-1][1] == len(content)
+        assert all(end == next_start for (_, end), (next_start, _) in zip(ranges, ranges[1:]))
+        assert all(content[start - 1:start] == b"\n" for start, _ in ranges)
+
+    def test_parallel_headers_only(self, tmp_path):
+        """Тест файла только с заголовками"""
+        file_path = tmp_path / "headers_only.csv"
+        file_path.write_text("date;amount;description\n", encoding='utf-8')
+
+        assert parse_csv_parallel(str(file_path), workers=2) == []
+
+    def test_parallel_file_not_found(self):
+        """Тест что ошибка параллельного чтения возвращает пустой список"""
+        assert reading_transactions_csv('nonexistent.csv', workers=2) == []
+
+    def test_parallel_records_match_operations(self, csv_file):
+        """Тест что записи Transaction совпадают со словарным форматом"""
+        operations = parse_csv_parallel(csv_file, workers=2, row_converter=csv_row_to_operation)
+        records = parse_csv_parallel(csv_file, workers=2, row_converter=csv_row_to_record)
+
+        assert [record.to_dict() for record in records] == operations
@@ -0,0 +1,68 @@
+import logging
+
+import pytest
+from src import logging_config
+from src.logging_config import PER_RECORD, SamplingFilter, redact, setup_logging, shutdown_logging
+from src.masks import get_mask_card_number
+
+
+@pytest.mark.parametrize("text, expected", [
+    ("карта 4111111111111111", "карта ************1111"),
+    ("счет 40817810099910004312", "счет ****************4312"),
+    ("id 1234567, дата 2019-08-26", "id 1234567, дата 2019-08-26"),
+    ("4111 11** **** 1111", "4111 11** **** 1111"),
+    ("карта 1234 5678 9012 3456", "карта **** **** **** 3456"),
+    ("карта 1234-5678-9012-3456.", "карта ****-****-****-3456."),
+    ("счет 4081 7810 0999 1000 4312", "счет **** **** **** **** 4312"),
+    ("сумма 1234 руб, id 5678", "сумма 1234 руб, id 5678"),
+    ("1234  5678", "1234  5678"),
+])
+def test_redact(text, expected):
+    """Номера карт и счетов скрываются, короткие числа остаются"""
+    assert redact(text) == expected
+
+
+def make_record(level=logging.INFO, per_record=True):
+    record = logging.LogRecord("src.masks", level, __file__, 1, "сообщение", None, None)
+    if per_record:
+        record.per_record = True
+    return record
+
+
+def test_sampling_filter():
+    """Прореживаются только сообщения об отдельных записях уровня INFO и ниже"""
+    sampler = SamplingFilter(rate=0.25)
+
+    assert [sampler.filter(make_record()) for _ in range(8)] == [True, False, False, False] * 2
+    assert sampler.filter(make_record(level=logging.ERROR))
+    assert sampler.filter(make_record(per_record=False))
+    assert not SamplingFilter(rate=0).filter(make_record())
+
+
+@pytest.fixture
+def logs_dir(tmp_path, monkeypatch):
+    """Папка логов во временной директории; логирование останавливается после теста"""
+    monkeypatch.setattr(logging_config, "LOGS_DIR", str(tmp_path))
+    root_level = logging.getLogger().level
+    yield tmp_path
+    shutdown_logging()
+    logging.getLogger().setLevel(root_level)
+
+
+def test_setup_logging_writes_redacted_file(logs_dir):
+    """Сообщения записываются в файл фоновым потоком с ленивым форматированием и скрытыми номерами"""
+    listener = setup_logging("test", sample_rate=0.5, console=False)
+    assert setup_logging("test") is listener
+
+    for _ in range(4):
+        get_mask_card_number("4111111111111111")
+    logging.getLogger("src.masks").warning("Проблема со счетом %s", "40817810099910004312", extra=PER_RECORD)
+    shutdown_logging()
+
+    (log_file,) = logs_dir.glob("test_*.log")
+    lines = log_file.read_text(encoding="utf-8").splitlines()
+    assert "4111111111111111" not in "\n".join(lines)
+    # Половина из восьми сообщений о маскировке отдельных номеров
+    assert sum("номера карты" in line for line in lines) == 4
+    assert any("Начало маскировки номера карты: ************1111" in line for line in lines)
+    assert lines[-1].endswith("WARNING - Проблема со счетом ****************4312")
@@ -1,5 +1,8 @@
+import logging
+
+import numpy as np
 import pytest
-from src.masks import get_mask_card_number, get_mask_account
+from src.masks import get_mask_card_number, get_mask_account, mask_accounts, mask_cards
 
 
 # Параметризованные тесты для get_mask_card_number
@@ -60,3 +63,31 @@ def test_get_mask_account_too_short():
     """Тестирование слишком короткого номера счета"""
     with pytest.raises(ValueError):
         get_mask_account("123")
+
+
+def test_mask_cards_batch():
+    """Тестирование пакетной маскировки карт: некорректные номера собираются, а не выбрасываются"""
+    masked, invalid = mask_cards(["4111111111111111", "123", None, "5500000000000004"])
+
+    assert masked == ["4111 11** **** 1111", None, None, "5500 00** **** 0004"]
+    assert invalid == {1: "123", 2: None}
+
+
+def test_mask_accounts_batch_numpy():
+    """Тестирование пакетной маскировки счетов из массива NumPy"""
+    masked, invalid = mask_accounts(np.array(["40817810099910004312", "abcd", "1234"]))
+
+    assert masked == ["**4312", None, "**1234"]
+    assert list(invalid) == [1]
+
+
+def test_mask_batch_matches_single(caplog):
+    """Пакетная маскировка совпадает с поштучной и пишет в лог одну запись"""
+    numbers = ["4111111111111111", "5500000000000004"] * 50
+
+    with caplog.at_level(logging.INFO, logger="src.masks"):
+        masked, invalid = mask_cards(numbers)
+
+    assert masked == [get_mask_card_number(number) for number in numbers]
+    assert invalid == {}
+    assert len([r for r in caplog.records if "Замаскировано" in r.getMessage()]) == 1
@@ -1,5 +1,5 @@
 import pytest
-from src.processing import filter_by_state, sort_by_date
+from src.processing import filter_by_state, sort_by_date, filter_by_date_range, latest_operations
 
 
 # Параметризованные тесты для filter_by_state
@@ -101,3 +101,53 @@ def test_sort_and_filter_integration(sample_transactions):
     assert len(filtered) == 3
     assert all(item["state"] == "EXECUTED" for item in filtered)
     assert [item["id"] for item in filtered] == [5, 1, 3]  # По возрастанию даты
+
+
+def test_filter_by_state_accepts_iterator():
+    """Фильтрация работает с итератором, например из iter_transactions"""
+    data = iter([{"id": 1, "state": "EXECUTED"}, {"id": 2, "state": "CANCELED"}])
+    assert filter_by_state(data) == [{"id": 1, "state": "EXECUTED"}]
+
+
+def test_sort_by_date_mixed_formats():
+    """Даты из JSON и CSV сравниваются как моменты времени, а не как строки"""
+    data = [
+        {"id": 1, "date": "2023-09-05T11:30:32Z"},
+        {"id": 2, "date": "2023-09-05T11:30:32.500000"},
+        {"id": 3, "date": "2023-09-05T14:00:00+03:00"},
+    ]
+    assert [item["id"] for item in sort_by_date(data)] == [2, 1, 3]
+
+
+def test_filter_by_date_range():
+    """Фильтрация по полуинтервалу дат"""
+    data = [
+        {"id": 1, "date": "2019-08-26T10:50:58.294041"},
+        {"id": 2, "date": "2020-01-01T00:00:00Z"},
+        {"id": 3, "date": "2020-06-01"},
+        {"id": 4},
+    ]
+    assert [item["id"] for item in filter_by_date_range(data, "2019-01-01", "2020-06-01")] == [1, 2]
+    assert [item["id"] for item in filter_by_date_range(data, start="2020-01-01")] == [2, 3]
+    assert [item["id"] for item in filter_by_date_range(data)] == [1, 2, 3]
+
+
+@pytest.mark.parametrize("n", [0, 1, 2, 3, 10])
+def test_latest_operations_matches_full_sort(n):
+    """Выбор последних операций совпадает с фильтрацией, полной сортировкой и срезом"""
+    data = [
+        {"id": 1, "state": "EXECUTED", "date": "2023-10-15T12:30:45.123456"},
+        {"id": 2, "state": "CANCELED", "date": "2023-10-16T10:15:30.654321"},
+        {"id": 3, "state": "EXECUTED", "date": "2023-10-14T08:45:12Z"},
+        {"id": 4, "state": "EXECUTED", "date": "2023-10-15T12:30:45.123456"},
+        {"id": 5, "state": "EXECUTED", "date": "2023-10-17T00:00:00Z"},
+    ]
+    expected = sort_by_date(filter_by_state(data))[:n]
+    assert latest_operations(data, n) == expected
+    assert latest_operations(iter(data), n) == expected
+
+
+def test_latest_operations_without_state_filter():
+    """При state=None учитываются операции с любым статусом"""
+    data = [{"id": 1, "state": "CANCELED", "date": "2024-01-02"}, {"id": 2, "state": "EXECUTED", "date": "2024-01-01"}]
+    assert [item["id"] for item in latest_operations(data, 1, state=None)] == [1]
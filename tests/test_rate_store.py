@@ -0,0 +1,57 @@
+import pytest
+from src.rate_store import RateStore
+
+
+@pytest.fixture
+def store(tmp_path):
+    """Хранилище курсов в файле во временной папке"""
+    rate_store = RateStore(str(tmp_path / "rates.sqlite3"))
+    yield rate_store
+    rate_store.close()
+
+
+def test_set_and_get_rate(store):
+    """Курс сохраняется и ищется по валютам и дню, регистр и время не учитываются"""
+    store.set_rate("usd", "rub", "2024-01-15T10:30:00", 89.5)
+
+    assert store.get_rate("USD", "RUB", "2024-01-15") == 89.5
+    assert store.get_rate("USD", "RUB", "2024-01-16") is None
+    assert store.get_rate("EUR", "RUB", "2024-01-15") is None
+
+
+def test_rate_replaced(store):
+    """Повторное сохранение заменяет курс"""
+    store.set_rate("USD", "RUB", "2024-01-15", 89.5)
+    store.set_rate("USD", "RUB", "2024-01-15", 90.0)
+
+    assert store.get_rate("USD", "RUB", "2024-01-15") == 90.0
+    assert len(store) == 1
+
+
+def test_persistent_between_connections(tmp_path):
+    """Курсы сохраняются на диске между запусками"""
+    path = str(tmp_path / "rates.sqlite3")
+    first = RateStore(path)
+    first.set_rates([("2024-01-15", "USD", "RUB", 89.5), ("2024-01-15", "EUR", "RUB", 97.0)])
+    first.close()
+
+    second = RateStore(path)
+    assert second.get_rate("EUR", "RUB", "2024-01-15") == 97.0
+    assert len(second) == 2
+    second.close()
+
+
+def test_load_csv(store, tmp_path):
+    """Таблица курсов загружается из CSV, некорректные строки пропускаются"""
+    csv_path = tmp_path / "rates.csv"
+    csv_path.write_text(
+        "date,base,quote,rate\n"
+        "2024-01-15,USD,RUB,89.5\n"
+        "2024-01-16,USD,RUB,89.7\n"
+        "2024-01-16,EUR,RUB,not-a-number\n",
+        encoding="utf-8",
+    )
+
+    assert store.load_csv(str(csv_path)) == 2
+    assert store.get_rate("USD", "RUB", "2024-01-16") == 89.7
+    assert store.get_rate("EUR", "RUB", "2024-01-16") is None
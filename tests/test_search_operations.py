@@ -1,5 +1,5 @@
 import pytest
-from src.search_operations import process_bank_search
+from src.search_operations import DescriptionIndex, process_bank_search
 
 
 @pytest.mark.parametrize("search_term,expected_ids", [
@@ -75,3 +75,31 @@ def test_result_structure_integrity(sample_data):
     assert operation["amount"] == 200.00
     assert operation["description"] == "Amazon purchase - electronics"
     assert operation["date"] == "2024-01-17"
+
+
+INDEX_DATA = [
+    {"id": 1, "description": "Перевод организации"},
+    {"id": 2, "description": "Перевод с карты на карту"},
+    {"id": 3, "description": "Открытие вклада"},
+    {"id": 4},
+    {"id": 5, "description": "Monthly Payment-rent"},
+    {"id": 6, "description": "payment for İstanbul ſtore"},
+    {"id": 7, "description": ""},
+]
+
+
+@pytest.mark.parametrize("search_term", [
+    "перевод", "ПЕРЕВОД", "вод", "с карты на", "рта на ка", "payment", "ment rent", "rent",
+    "store", "istanbul", "s", "nonexistent", "payment|перевод", "^Перевод", r"\bвклада\b", "[invalid",
+])
+def test_description_index_matches_scan(search_term):
+    """Поиск по индексу дает тот же результат и порядок, что и полный просмотр."""
+    index = DescriptionIndex(INDEX_DATA)
+    assert index.search(search_term) == process_bank_search(INDEX_DATA, search_term)
+    assert process_bank_search(INDEX_DATA, search_term, index=index) == index.search(search_term)
+
+
+def test_description_index_empty():
+    """Пустой запрос и пустые данные."""
+    assert DescriptionIndex(INDEX_DATA).search("") == []
+    assert DescriptionIndex([]).search("перевод") == []
@@ -0,0 +1,119 @@
+import io
+import json
+import os
+
+import pytest
+from src.statement import SEPARATOR, _format_day, format_date, format_operation_details, render_statement
+from src.transaction import Transaction
+
+OPERATIONS_PATH = os.path.join(os.path.dirname(__file__), '..', 'data', 'operations.json')
+
+EDGE_OPERATIONS = [
+    {
+        "id": 1, "state": "EXECUTED", "date": "2019-08-26T10:50:58.294041",
+        "operationAmount": {"amount": "31957.58", "currency": {"name": "руб.", "code": "RUB"}},
+        "description": "Перевод организации", "from": "Maestro 1596837868705199", "to": "Счет 64686473678894779589",
+    },
+    {
+        "id": 2, "state": "EXECUTED", "date": "2019-07-03T18:35:29.512364+03:00",
+        "operationAmount": {"amount": "8221.37", "currency": {"name": "USD", "code": "USD"}},
+        "description": "Открытие вклада", "to": "Счет 35383033474447895560",
+    },
+    {"id": 3, "date": "не дата", "description": "Без суммы"},
+    {"id": 4, "date": None, "to": ""},
+    {},
+]
+
+
+def _printed(operations, capsys):
+    """Вывод прежнего цикла с двумя вызовами print на операцию."""
+    for operation in operations:
+        print(format_operation_details(operation))
+        print("-" * 40)
+    return capsys.readouterr().out
+
+
+@pytest.fixture
+def operations():
+    with open(OPERATIONS_PATH, encoding='utf-8') as file:
+        return [operation for operation in json.load(file) if operation] + EDGE_OPERATIONS
+
+
+def test_format_date():
+    assert format_date("2019-08-26T10:50:58.294041") == "26.08.2019"
+    assert format_date("не дата") == "не дата"
+
+
+def test_render_statement_date_with_offset(capsys):
+    """Дата со смещением часового пояса выводится так, как записана, а не в UTC"""
+    operation = {"date": "2024-01-16T01:00:00+03:00", "description": "Открытие вклада", "to": "Счет 1234"}
+
+    for operations in ([operation], [Transaction.from_dict(operation)]):
+        render_statement(operations)
+        assert capsys.readouterr().out.startswith("16.01.2024 Открытие вклада\n")
+        assert format_operation_details(operations[0]).startswith("16.01.2024 ")
+
+
+def test_render_statement_caches_dates_by_day(capsys):
+    """Операции одного дня форматируют дату один раз, некорректные даты выводятся как есть"""
+    operations = [Transaction.from_dict({"date": f"2031-02-0{day}T1{hour}:00:00+03:00", "to": "Счет 1234"})
+                  for day in (1, 2) for hour in range(5)]
+    operations.append(Transaction.from_dict({"date": "2031-02-01T25:00:00", "to": "Счет 1234"}))
+    misses = _format_day.cache_stats()["misses"]
+
+    render_statement(operations)
+    dates = [line.split()[0] for line in capsys.readouterr().out.splitlines() if line.endswith("Без описания")]
+
+    assert _format_day.cache_stats()["misses"] - misses == 2
+    assert dates == ["01.02.2031"] * 5 + ["02.02.2031"] * 5 + ["2031-02-01T25:00:00"]
+
+
+def test_render_statement_matches_print(operations, capsys):
+    expected = _printed(operations, capsys)
+
+    assert render_statement(operations) == len(operations)
+    assert capsys.readouterr().out == expected
+
+
+def test_render_statement_records(operations, capsys):
+    records = [Transaction.from_dict(operation) for operation in operations]
+    expected = _printed(records, capsys)
+
+    render_statement(records)
+    assert capsys.readouterr().out == expected
+
+
+@pytest.mark.parametrize("buffer_size", [1, 100, 1 << 16])
+def test_render_statement_stream_buffer_size(operations, capsys, buffer_size):
+    expected = _printed(operations, capsys)
+    stream = io.StringIO()
+
+    render_statement(iter(operations), stream, buffer_size=buffer_size)
+    assert stream.getvalue() == expected
+
+
+def test_render_statement_file(operations, capsys, tmp_path):
+    expected = _printed(operations, capsys)
+    path = tmp_path / "statement.txt"
+
+    assert render_statement(operations, str(path), buffer_size=4096) == len(operations)
+    assert path.read_text(encoding='utf-8') == expected
+
+
+def test_render_statement_empty():
+    stream = io.StringIO()
+
+    assert render_statement([], stream) == 0
+    assert stream.getvalue() == ""
+
+
+def test_render_statement_block_layout():
+    stream = io.StringIO()
+
+    render_statement(EDGE_OPERATIONS[1:2], stream)
+    assert stream.getvalue() == (
+        "03.07.2019 Открытие вклада\n"
+        "Счет **5560\n"
+        "Сумма: 8221.37 USD\n"
+        "\n" + SEPARATOR + "\n"
+    )
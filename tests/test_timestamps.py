@@ -0,0 +1,69 @@
+import pytest
+from src.timestamps import (MISSING_TIMESTAMP, format_local_date, format_timestamp, parse_timestamp, parse_timestamps,
+                            to_timestamp)
+
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("1970-01-01T00:00:00.000000", 0),
+    ("2019-08-26T10:50:58.294041", 1566816658294041),
+    ("2023-09-05T11:30:32Z", 1693913432000000),
+    ("2023-09-05T14:30:32+03:00", 1693913432000000),
+    ("2023-10-15", 1697328000000000),
+    ("1969-12-31T23:59:59.999999", -1),
+])
+def test_parse_timestamp(date_string, expected):
+    """Разбор дат разных форматов в микросекунды UTC"""
+    assert parse_timestamp(date_string) == expected
+
+
+@pytest.mark.parametrize("invalid_input", ["", "2023/10/15", "2023-13-45T12:30:45", "invalid-date"])
+def test_parse_timestamp_invalid(invalid_input):
+    """Некорректные даты вызывают ValueError"""
+    with pytest.raises(ValueError):
+        parse_timestamp(invalid_input)
+
+
+@pytest.mark.parametrize("invalid_input", [None, "", "2023-02-30", 123])
+def test_to_timestamp_missing(invalid_input):
+    """Пустые и некорректные даты заменяются меткой MISSING_TIMESTAMP"""
+    assert to_timestamp(invalid_input) == MISSING_TIMESTAMP
+
+
+def test_parse_timestamps_matches_scalar():
+    """Векторный разбор колонки совпадает с поэлементным"""
+    dates = ["2019-08-26T10:50:58.294041", "2023-09-05T11:30:32Z", "2023-10-15"]
+    assert parse_timestamps(dates).tolist() == [parse_timestamp(date) for date in dates]
+
+
+def test_parse_timestamps_fallback():
+    """Смещения зон и некорректные значения разбираются поэлементно"""
+    dates = ["2023-09-05T14:30:32+03:00", "nan", None]
+    assert parse_timestamps(dates).tolist() == [1693913432000000, MISSING_TIMESTAMP, MISSING_TIMESTAMP]
+
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("2019-08-26T10:50:58.294041", "26.08.2019"),
+    ("2020-02-29T23:59:59.999999", "29.02.2020"),
+    ("1969-12-31T12:00:00", "31.12.1969"),
+])
+def test_format_timestamp(date_string, expected):
+    """Форматирование метки времени в DD.MM.YYYY"""
+    assert format_timestamp(parse_timestamp(date_string)) == expected
+
+
+@pytest.mark.parametrize("date_string, expected", [
+    ("2019-08-26T10:50:58.294041", "26.08.2019"),
+    ("2024-01-16T01:00:00+03:00", "16.01.2024"),
+    ("2024-01-15T23:00:00-05:00", "15.01.2024"),
+    ("2024-01-16T01:00:00Z", "16.01.2024"),
+    ("2024-01-16", "16.01.2024"),
+])
+def test_format_local_date(date_string, expected):
+    """Дата для вывода берется из строки без перевода в UTC"""
+    assert format_local_date(date_string) == expected
+
+
+def test_format_local_date_invalid():
+    """Некорректная дата"""
+    with pytest.raises(ValueError):
+        format_local_date("не дата")
@@ -0,0 +1,100 @@
+import pickle
+
+import pytest
+from src.transaction import Transaction
+from src.processing import filter_by_state, sort_by_date
+from src.generators import filter_by_currency, transaction_descriptions
+
+
+@pytest.fixture
+def operation():
+    """Операция в формате operations.json"""
+    return {
+        "id": 441945886,
+        "state": "EXECUTED",
+        "date": "2019-08-26T10:50:58.294041",
+        "operationAmount": {"amount": "31957.58", "currency": {"name": "руб.", "code": "RUB"}},
+        "description": "Перевод организации",
+        "from": "Maestro 1596837868705199",
+        "to": "Счет 64686473678894779589"
+    }
+
+
+def test_from_dict_flattens_fields(operation):
+    """Вложенные operationAmount/currency раскладываются в плоские поля"""
+    record = Transaction.from_dict(operation)
+
+    assert record.id == 441945886
+    assert record.amount == "31957.58"
+    assert record.currency_code == "RUB"
+    assert record.currency_name == "руб."
+    assert record.from_ == "Maestro 1596837868705199"
+    assert record.to == "Счет 64686473678894779589"
+
+
+def test_round_trip(operation):
+    """Преобразование в словарь возвращает исходную операцию"""
+    assert Transaction.from_dict(operation).to_dict() == operation
+
+
+def test_round_trip_missing_fields():
+    """Отсутствующие поля не появляются при обратном преобразовании"""
+    operation = {"id": 1, "state": "EXECUTED", "date": "2019-08-26T10:50:58.294041"}
+    assert Transaction.from_dict(operation).to_dict() == operation
+
+
+def test_dict_compatible_access(operation):
+    """Запись читается по ключам словарного формата"""
+    record = Transaction.from_dict({key: value for key, value in operation.items() if key != "from"})
+
+    assert record.get("state") == "EXECUTED"
+    assert record["date"] == "2019-08-26T10:50:58.294041"
+    assert record.get("operationAmount") == operation["operationAmount"]
+    assert record.get("from", "") == ""
+    assert "from" not in record
+    with pytest.raises(KeyError):
+        record["from"]
+
+
+def test_repeated_strings_are_interned(operation):
+    """Повторяющиеся строки хранятся в одном экземпляре"""
+    first = Transaction.from_dict(operation)
+    second = Transaction.from_dict({**operation, "state": "".join(["EXEC", "UTED"])})
+
+    assert first.state is second.state
+
+
+def test_record_is_compact_and_immutable(operation):
+    """Запись не имеет __dict__ и не изменяется"""
+    record = Transaction.from_dict(operation)
+
+    assert not hasattr(record, "__dict__")
+    with pytest.raises(AttributeError):
+        record.state = "CANCELED"
+
+
+def test_pickle(operation):
+    """Запись сохраняется в кэш через pickle"""
+    record = Transaction.from_dict(operation)
+    assert pickle.loads(pickle.dumps(record)) == record
+
+
+def test_processing_and_generators_accept_records(operation):
+    """Фильтрация, сортировка и генераторы работают с записями"""
+    records = [
+        Transaction.from_dict({**operation, "id": 1, "date": "2019-01-01T00:00:00.000000"}),
+        Transaction.from_dict({**operation, "id": 2, "state": "CANCELED"}),
+        Transaction.from_dict({**operation, "id": 3, "date": "2020-01-01T00:00:00.000000",
+                               "operationAmount": {"amount": "1", "currency": {"name": "USD", "code": "USD"}}}),
+    ]
+
+    assert [r.id for r in filter_by_state(records)] == [1, 3]
+    assert [r.id for r in sort_by_date(records)] == [3, 2, 1]
+    assert [r.id for r in filter_by_currency(records, "USD")] == [3]
+    assert list(transaction_descriptions(records[:1])) == ["Перевод организации"]
+
+
+def test_timestamp_parsed_once(operation):
+    """Дата разбирается при создании записи"""
+    assert Transaction.from_dict(operation).timestamp == 1566816658294041
+    assert Transaction.from_dict({"id": 1}).timestamp is None
@@ -0,0 +1,100 @@
+import numpy as np
+import pytest
+from src.transaction import Transaction
+from src.transaction_table import TransactionTable
+from src.processing import filter_by_state, sort_by_date, filter_by_date_range
+from src.generators import filter_by_currency
+
+
+def make_operation(op_id, state, date, amount, code):
+    """Операция в формате operations.json"""
+    return {
+        "id": op_id,
+        "state": state,
+        "date": date,
+        "operationAmount": {"amount": amount, "currency": {"name": code, "code": code}},
+        "description": "Перевод организации",
+    }
+
+
+@pytest.fixture
+def operations():
+    return [
+        make_operation(1, "EXECUTED", "2019-08-26T10:50:58.294041", "31957.58", "RUB"),
+        make_operation(2, "CANCELED", "2018-06-30T02:08:58.425572", "9824.07", "USD"),
+        make_operation(3, "EXECUTED", "2019-08-26T10:50:58.294041", "100", "USD"),
+        make_operation(4, "EXECUTED", "2018-03-23T10:45:06.972075", "48223.05", "RUB"),
+        make_operation(5, "PENDING", "2019-04-04T23:20:05.206878", "79114.93", "USD"),
+    ]
+
+
+@pytest.mark.parametrize("reverse", [True, False])
+def test_filter_and_sort_match_list_functions(operations, reverse):
+    """Векторные фильтрация и сортировка совпадают со списочными, включая порядок равных дат"""
+    table = TransactionTable.from_list(operations)
+
+    result = table.filter_by_state("EXECUTED").sort_by_date(reverse).to_list()
+
+    assert result == sort_by_date(filter_by_state(operations, "EXECUTED"), reverse)
+
+
+def test_filter_by_currency(operations):
+    """Фильтрация по валюте совпадает с генератором filter_by_currency"""
+    table = TransactionTable.from_list(operations)
+    assert table.filter_by_currency("USD").to_list() == list(filter_by_currency(operations, "USD"))
+
+
+def test_unknown_category_gives_empty_table(operations):
+    """Неизвестный статус дает пустую выборку"""
+    table = TransactionTable.from_list(operations)
+    assert len(table.filter_by_state("FAILED")) == 0
+    assert table.filter_by_currency("EUR").to_list() == []
+
+
+def test_columns(operations):
+    """Колонки хранят числа: id, метки времени и суммы в копейках"""
+    table = TransactionTable.from_list(operations)
+
+    assert table.ids.tolist() == [1, 2, 3, 4, 5]
+    assert table.amounts.tolist() == [3195758, 982407, 10000, 4822305, 7911493]
+    assert table.timestamps.dtype == np.int64
+    assert table.timestamps[0] == 1566816658294041
+
+
+def test_views_share_columns(operations):
+    """Выборки не копируют колонки, а head возвращает срез индекса"""
+    table = TransactionTable.from_list(operations)
+    sorted_table = table.sort_by_date()
+    head = sorted_table.head(2)
+
+    assert head._columns is table._columns
+    assert np.shares_memory(head.indices, sorted_table.indices)
+    assert [op["id"] for op in head] == [1, 3]
+
+
+def test_records_round_trip(operations):
+    """Таблица строится из записей Transaction и возвращает их же"""
+    records = [Transaction.from_dict(op) for op in operations]
+    table = TransactionTable.from_list(records)
+
+    assert table.filter_by_currency("RUB").to_list() == [records[0], records[3]]
+    assert table.amounts.tolist()[0] == 3195758
+
+
+def test_missing_date_sorted_first_ascending():
+    """Операции без даты оказываются в начале при сортировке по возрастанию"""
+    table = TransactionTable.from_list([
+        {"id": 1, "date": "2020-01-01T00:00:00"},
+        {"id": 2},
+    ])
+    assert table.sort_by_date(reverse=False).ids.tolist() == [2, 1]
+
+
+def test_filter_by_date_range(operations):
+    """Векторная фильтрация по периоду совпадает со списочной"""
+    table = TransactionTable.from_list(operations)
+
+    result = table.filter_by_date_range("2018-06-01", "2019-08-26")
+
+    assert result.ids.tolist() == [2, 5]
+    assert result.to_list() == filter_by_date_range(operations, "2018-06-01", "2019-08-26")
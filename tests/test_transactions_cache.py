@@ -0,0 +1,163 @@
+import json
+import os
+import pickle
+from unittest.mock import MagicMock
+
+import pytest
+from src.transactions_cache import load_cached, evict_stale_entries, CACHE_DIR_NAME
+
+
+@pytest.fixture
+def source_file(tmp_path):
+    """JSON-файл с транзакциями"""
+    file_path = tmp_path / "operations.json"
+    file_path.write_text(json.dumps([{"id": 1, "state": "EXECUTED"}, {"id": 2, "state": "CANCELED"}]))
+    return file_path
+
+
+def make_loader(result):
+    """Загрузчик-заглушка с именем, как у настоящей функции"""
+    loader = MagicMock(return_value=result)
+    loader.__module__ = "tests.loaders"
+    loader.__qualname__ = "load_operations"
+    return loader
+
+
+def test_second_load_uses_cache(source_file):
+    """Повторная загрузка неизменного файла не вызывает разбор"""
+    loader = make_loader([{"id": 1}, {"id": 2}])
+
+    first = load_cached(str(source_file), loader)
+    second = load_cached(str(source_file), loader)
+
+    assert first == second == [{"id": 1}, {"id": 2}]
+    loader.assert_called_once_with(str(source_file))
+    assert len(os.listdir(source_file.parent / CACHE_DIR_NAME)) == 1
+
+
+def test_modified_file_invalidates_cache(source_file):
+    """Изменение исходного файла приводит к повторному разбору"""
+    loader = make_loader([{"id": 1}])
+    load_cached(str(source_file), loader)
+
+    source_file.write_text(json.dumps([{"id": 3}]))
+    os.utime(source_file, ns=(0, 0))
+    loader.return_value = [{"id": 3}]
+
+    assert load_cached(str(source_file), loader) == [{"id": 3}]
+    assert loader.call_count == 2
+    assert len(os.listdir(source_file.parent / CACHE_DIR_NAME)) == 1
+
+
+def test_same_size_and_mtime_checked_by_hash(source_file):
+    """Подмена содержимого с сохранением размера и времени ловится по хэшу"""
+    loader = make_loader([{"id": 1}])
+    load_cached(str(source_file), loader)
+
+    stat = source_file.stat()
+    content = source_file.read_text()
+    source_file.write_text(content.replace("CANCELED", "EXECUTED"))
+    os.utime(source_file, ns=(stat.st_atime_ns, stat.st_mtime_ns))
+    assert source_file.stat().st_size == stat.st_size
+
+    load_cached(str(source_file), loader)
+
+    assert loader.call_count == 2
+
+
+def test_empty_result_not_cached(source_file):
+    """Пустой результат (ошибка загрузки) не сохраняется в кэш"""
+    loader = make_loader([])
+
+    load_cached(str(source_file), loader)
+    load_cached(str(source_file), loader)
+
+    assert loader.call_count == 2
+
+
+def test_corrupted_cache_is_rebuilt(source_file):
+    """Поврежденный файл кэша перестраивается"""
+    loader = make_loader([{"id": 1}])
+    load_cached(str(source_file), loader)
+    cache_dir = source_file.parent / CACHE_DIR_NAME
+    (cache_file,) = cache_dir.iterdir()
+    cache_file.write_bytes(b"not a pickle")
+
+    assert load_cached(str(source_file), loader) == [{"id": 1}]
+    assert loader.call_count == 2
+
+
+@pytest.mark.parametrize("content", [
+    b"\x80\x09",
+    b"\x00\xff garbage",
+    pickle.dumps({"version": 1}) + b"\x80\x09",
+])
+def test_unreadable_cache_entry_is_rebuilt(source_file, content):
+    """Файл кэша с мусором или неизвестной версией протокола pickle удаляется и перестраивается"""
+    loader = make_loader([{"id": 1}])
+    load_cached(str(source_file), loader)
+    (cache_file,) = (source_file.parent / CACHE_DIR_NAME).iterdir()
+    cache_file.write_bytes(content)
+
+    assert load_cached(str(source_file), loader) == [{"id": 1}]
+    assert loader.call_count == 2
+    assert load_cached(str(source_file), loader) == [{"id": 1}]
+    assert loader.call_count == 2
+
+
+def test_bad_protocol_body_is_rebuilt(source_file):
+    """Запись с корректным заголовком и поврежденным телом перестраивается"""
+    loader = make_loader([{"id": 1}])
+    load_cached(str(source_file), loader)
+    (cache_file,) = (source_file.parent / CACHE_DIR_NAME).iterdir()
+    with open(cache_file, 'rb') as file:
+        header = pickle.load(file)
+    cache_file.write_bytes(pickle.dumps(header) + b"\x80\x09")
+
+    assert load_cached(str(source_file), loader) == [{"id": 1}]
+    assert loader.call_count == 2
+
+
+def test_different_loaders_have_separate_entries(source_file):
+    """Результаты разных загрузчиков одного файла хранятся раздельно"""
+    loader_a = make_loader([{"id": "a"}])
+    loader_b = make_loader([{"id": "b"}])
+    loader_b.__qualname__ = "load_other"
+
+    assert load_cached(str(source_file), loader_a) == [{"id": "a"}]
+    assert load_cached(str(source_file), loader_b) == [{"id": "b"}]
+    assert load_cached(str(source_file), loader_a) == [{"id": "a"}]
+
+
+def test_evict_entries_of_deleted_sources(tmp_path, source_file):
+    """Записи для удаленных исходных файлов вытесняются"""
+    cache_dir = tmp_path / "cache"
+    other = tmp_path / "other.json"
+    other.write_text("[1]")
+    load_cached(str(source_file), make_loader([1]), cache_dir=str(cache_dir))
+    load_cached(str(other), make_loader([2]), cache_dir=str(cache_dir))
+
+    other.unlink()
+
+    assert evict_stale_entries(str(cache_dir)) == 1
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_evict_over_limit(tmp_path):
+    """Сверх лимита вытесняются самые давние записи"""
+    cache_dir = tmp_path / "cache"
+    for i in range(3):
+        source = tmp_path / f"ops_{i}.json"
+        source.write_text("[1]")
+        load_cached(str(source), make_loader([i]), cache_dir=str(cache_dir))
+
+    assert evict_stale_entries(str(cache_dir), max_entries=1) == 2
+    assert len(os.listdir(cache_dir)) == 1
+
+
+def test_missing_source_delegates_to_loader(tmp_path):
+    """Для несуществующего файла результат загрузчика возвращается как есть"""
+    loader = make_loader([])
+
+    assert load_cached(str(tmp_path / "missing.json"), loader) == []
+    loader.assert_called_once()
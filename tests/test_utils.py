@@ -3,7 +3,8 @@ from unittest.mock import mock_open, patch
 import json
 import os
 import sys
-from utils import load_transactions
+import tempfile
+from utils import load_transactions, iter_transactions
 
 sys.path.insert(0, os.path.join(os.path.dirname(__file__), '../src'))
 
@@ -62,3 +63,112 @@ class TestLoadTransactions(unittest.TestCase):
                 with patch("os.path.getsize", return_value=100):
                     result = load_transactions("data/protected.json")
                     self.assertEqual(result, [])
+
+
+class TestIterTransactions(unittest.TestCase):
+
+    def _write(self, content):
+        """Создает временный JSON-файл с указанным содержимым"""
+        file = tempfile.NamedTemporaryFile('w', suffix='.json', encoding='utf-8', delete=False)
+        file.write(content)
+        file.close()
+        self.addCleanup(os.remove, file.name)
+        return file.name
+
+    def test_iter_transactions_matches_load_transactions(self):
+        """Тест что потоковое чтение выдает те же транзакции, что и load_transactions"""
+        test_data = [
+            {"id": 1, "amount": 100, "currency": "RUB", "description": "Перевод организации"},
+            {"id": 2, "amount": 50.25, "currency": "USD", "nested": {"values": [1, 2, 3]}},
+            {"id": 3, "amount": 12345678, "currency": "EUR"}
+        ]
+        file_path = self._write(json.dumps(test_data, ensure_ascii=False, indent=2))
+
+        # Маленькая порция заставляет элементы пересекать границы чтения
+        result = list(iter_transactions(file_path, chunk_size=5))
+
+        self.assertEqual(result, test_data)
+        self.assertEqual(result, load_transactions(file_path))
+
+    def test_iter_transactions_is_lazy(self):
+        """Тест что транзакции выдаются до окончания разбора файла"""
+        file_path = self._write('[{"id": 1}, {"id": 2}, not json')
+
+        iterator = iter_transactions(file_path, chunk_size=4)
+
+        self.assertEqual(next(iterator), {"id": 1})
+        self.assertEqual(next(iterator), {"id": 2})
+        self.assertEqual(list(iterator), [])
+
+    def test_iter_transactions_file_not_found(self):
+        """Тест когда файл не найден"""
+        self.assertEqual(list(iter_transactions("data/nonexistent.json")), [])
+
+    def test_iter_transactions_empty_file(self):
+        """Тест когда файл пустой"""
+        self.assertEqual(list(iter_transactions(self._write(""))), [])
+
+    def test_iter_transactions_empty_list(self):
+        """Тест когда файл содержит пустой список"""
+        self.assertEqual(list(iter_transactions(self._write(" [ ] "))), [])
+
+    def test_iter_transactions_not_list(self):
+        """Тест когда JSON не является списком"""
+        file_path = self._write(json.dumps({"transaction": {"id": 1, "amount": 100}}))
+        self.assertEqual(list(iter_transactions(file_path)), [])
+
+    def test_iter_transactions_not_list_is_not_read_whole(self):
+        """Тест что для файла, не содержащего список, тип определяется без чтения всего файла"""
+        file_path = self._write(json.dumps({"transactions": ["x" * 100] * 1000}))
+
+        with self.assertLogs("utils", level="WARNING") as logs:
+            self.assertEqual(list(iter_transactions(file_path, chunk_size=64)), [])
+
+        self.assertIn("<class 'dict'>", logs.output[0])
+
+    def test_iter_transactions_corrupt_element_stops_early(self):
+        """Тест что синтаксическая ошибка в элементе не заставляет дочитывать весь файл"""
+        items = ", ".join(json.dumps({"id": i, "pad": "x" * 100}) for i in range(2000))
+        file_path = self._write('[{"id": 1}, {"id": 2, "bad": tru}, ' + items + ']')
+        reads = []
+        real_open = open
+
+        def counting_open(*args, **kwargs):
+            file = real_open(*args, **kwargs)
+            read = file.read
+
+            def counting_read(size=-1):
+                reads.append(size)
+                return read(size)
+
+            file.read = counting_read
+            return file
+
+        with patch("builtins.open", side_effect=counting_open):
+            with self.assertLogs("utils", level="ERROR"):
+                result = list(iter_transactions(file_path, chunk_size=64))
+
+        self.assertEqual(result, [{"id": 1}])
+        self.assertLess(len(reads), 5)
+
+    def test_iter_transactions_values_across_chunks(self):
+        """Тест чисел, литералов и escape-последовательностей на границах порций"""
+        test_data = [{"id": 1, "text": "Счет\n\"кавычки\"", "values": [1.5e10, -2, True, None]}, -350.0, False]
+        file_path = self._write(json.dumps(test_data))
+
+        for chunk_size in range(1, 40):
+            self.assertEqual(list(iter_transactions(file_path, chunk_size=chunk_size)), test_data)
+
+    def test_iter_transactions_trailing_comma(self):
+        """Тест когда массив оборван лишней запятой"""
+        self.assertEqual(list(iter_transactions(self._write('[{"id": 1},]'))), [{"id": 1}])
+
+    def test_iter_transactions_as_records(self):
+        """Тест выдачи компактных записей Transaction"""
+        test_data = [{"id": 1, "state": "EXECUTED", "operationAmount": {"amount": "1.00"}}]
+        file_path = self._write(json.dumps(test_data))
+
+        records = list(iter_transactions(file_path, as_records=True))
+
+        self.assertEqual([record.to_dict() for record in records], test_data)
+        self.assertEqual(load_transactions(file_path, as_records=True), records)
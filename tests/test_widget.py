@@ -58,3 +58,25 @@ def test_get_date_value_error(invalid_input):
     """Тестирование обработки невалидных входных данных дат (ValueError)"""
     with pytest.raises(ValueError):
         get_date(invalid_input)
+
+
+def test_get_date_with_offset():
+    """Тестирование даты со смещением часового пояса: выводится дата из строки, а не дата в UTC"""
+    assert get_date("2024-01-16T01:00:00+03:00") == "16.01.2024"
+
+
+def test_mask_account_card_account():
+    """Тестирование маскировки счета с названием"""
+    assert mask_account_card("Счет 73654108430135874305") == "Счет **4305"
+
+
+def test_mask_account_card_cached():
+    """Повторяющиеся номера маскируются один раз, затем берутся из кэша"""
+    mask_account_card.cache_clear()
+    values = ["Visa Classic 6831982476737658", "Счет 73654108430135874305"] * 100
+
+    results = [mask_account_card(value) for value in values]
+
+    assert results[:2] == ["Visa Classic 6831 98** **** 7658", "Счет **4305"]
+    stats = mask_account_card.cache_stats()
+    assert (stats["misses"], stats["hits"]) == (2, 198)